@@ -1,4 +1,6 @@
 from .exceptions import *
 from .query_parser import *
+from .compiled_query_parser import *
 from .types import *
 from .auth import *
+from . import codec
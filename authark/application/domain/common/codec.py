@@ -0,0 +1,78 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON = True
+except ImportError:  # pragma: no cover
+    ORJSON = False
+
+
+class JsonCodec:
+    """Standard library json encoder and decoder producing the same
+    compact or two spaces indented output as orjson"""
+
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(value, indent=2)
+        return json.dumps(value, separators=(',', ':'))
+
+    def encode(self, value: Any) -> bytes:
+        return self.dumps(value).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    """Orjson encoder and decoder falling back to the standard library
+    for the values it can't serialize, like integers over 64 bits."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if not ORJSON:
+            raise ImportError('The orjson package is not installed.')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any, indent: bool = False) -> str:
+        return self.encode(value, indent).decode()
+
+    def encode(self, value: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, option=option)
+        except TypeError:
+            return super().dumps(value, indent).encode()
+
+
+_codec: JsonCodec = OrjsonCodec() if ORJSON else JsonCodec()
+
+
+def get_codec() -> JsonCodec:
+    return _codec
+
+
+def set_codec(codec: JsonCodec) -> JsonCodec:
+    """Replace the process wide codec returning the previous one"""
+    global _codec
+    previous, _codec = _codec, codec
+    return previous
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return _codec.loads(data)
+
+
+def dumps(value: Any, indent: bool = False) -> str:
+    return _codec.dumps(value, indent)
+
+
+def encode(value: Any) -> bytes:
+    return _codec.encode(value)
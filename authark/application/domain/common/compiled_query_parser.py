@@ -0,0 +1,142 @@
+import re
+import keyword
+from collections import OrderedDict
+from fnmatch import translate
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union)
+from .query_parser import QueryParser
+from .types import TermTuple
+
+
+Binder = Optional[Callable[[Any], Any]]
+Plan = Tuple[Callable[..., Callable],
+             List[Tuple[int, Callable[[Any], Any]]]]
+
+
+class CompiledQueryParser(QueryParser):
+    """Query parser compiling each domain into a single generated function
+    with its field accessors and like patterns resolved ahead of time.
+
+    Compiled plans are cached by domain shape, i.e. its operators, fields
+    and comparisons, and the literal values are bound on every parse."""
+
+    def __init__(self, cache_size: int = 256) -> None:
+        super().__init__()
+        self.cache_size = cache_size
+        self.plans: 'OrderedDict[Hashable, Plan]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.templates: Dict[str, str] = {
+            '=': '({field} == {value})',
+            '!=': '({field} != {value})',
+            '<=': '({field} <= {value})',
+            '<': '({field} < {value})',
+            '>': '({field} > {value})',
+            '>=': '({field} >= {value})',
+            'in': '({field} in {value})',
+            'contains': '({value} in {field})',
+            'like': ('(isinstance(({slot} := {field}), str) and '
+                     '{value}({slot}) is not None)'),
+            'ilike': ('(isinstance(({slot} := {field}), str) and '
+                      '{value}({slot}.lower()) is not None)')
+        }
+
+    def parse(self, domain: Sequence[Union[str, TermTuple]]) -> Callable:
+        if not domain:
+            return lambda obj: True
+
+        shape = tuple([item if isinstance(item, str) else
+                       (item[0], item[1]) for item in domain])
+        plan = self.plans.get(shape)
+        if plan is None:
+            self.misses += 1
+            plan = self._plan(domain)
+            self.plans[shape] = plan
+            if len(self.plans) > self.cache_size:
+                self.plans.popitem(last=False)
+        else:
+            self.hits += 1
+            self.plans.move_to_end(shape)
+
+        build, binders = plan
+        values = [item[2] for item in domain if not isinstance(item, str)]
+        for index, bind in binders:
+            values[index] = bind(values[index])
+
+        return build(*values)
+
+    def _plan(self, domain: Sequence[Union[str, TermTuple]]) -> Plan:
+        binders: List[Binder] = []
+        stack: List[str] = []
+        for item in list(reversed(domain)):
+            if isinstance(item, str) and item in self.binary_dict:
+                first_operand = stack.pop()
+                second_operand = stack.pop()
+                stack.append(self._binary(
+                    item, first_operand, second_operand))
+            elif isinstance(item, str) and item in self.unary_dict:
+                stack.append(f'(not {stack.pop()})')
+
+            stack = self._default_join_source(stack)
+
+            if isinstance(item, (list, tuple)):
+                stack.append(self._compile_term(item, binders))
+
+        source = self._default_join_source(stack)[0]
+
+        # Terms were compiled in reverse, so their slots are reversed too.
+        names = [f'_v{index}' for index in reversed(range(len(binders)))]
+        namespace: Dict[str, Any] = {}
+        exec(f"def build({', '.join(names)}):\n"
+             f"    return lambda obj: {source}\n", namespace)
+
+        return namespace['build'], [
+            (index, bind) for index, bind in enumerate(reversed(binders))
+            if bind]
+
+    def _default_join_source(self, stack: List[str]) -> List[str]:
+        if len(stack) == 2:
+            first_operand = stack.pop()
+            second_operand = stack.pop()
+            stack.append(self._binary(
+                self.default_join_operator, first_operand, second_operand))
+        return stack
+
+    def _compile_term(self, term_tuple: Sequence[Any],
+                      binders: List[Binder]) -> str:
+        field, operator, _ = term_tuple
+        function = self.comparison_dict[operator]
+        template = self.templates.get(operator)
+        name = f'_v{len(binders)}'
+
+        if template is None:
+            binders.append(lambda value: function(field, value))
+            return f'{name}(obj)'
+
+        binder: Binder = None
+        if operator in ('like', 'ilike'):
+            insensitive = operator == 'ilike'
+            binder = lambda value: self._compile_like(value, insensitive)
+        binders.append(binder)
+
+        return template.format(
+            field=self._accessor(field), value=name, slot=f'_s{name}')
+
+    @staticmethod
+    def _binary(operator: str, first: str, second: str) -> str:
+        return f"({first} {'and' if operator == '&' else 'or'} {second})"
+
+    @staticmethod
+    def _accessor(field: str) -> str:
+        if field.isidentifier() and not keyword.iskeyword(field):
+            return f'obj.{field}'
+        return f'getattr(obj, {field!r})'
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_like(pattern: str, insensitive: bool) -> Callable:
+        pattern = pattern.replace('%', '*').replace('_', '?')
+        if insensitive:
+            pattern = pattern.lower()
+        return re.compile(translate(pattern)).match
@@ -42,6 +42,14 @@ class EntityNotFoundError(RepositoryError):
     """The entity was not found in the repository."""
 
 
+class DuplicateError(RepositoryError):
+    """A unique value is already taken by another entity."""
+
+
+class QueryError(RepositoryError):
+    """The query is not valid for the repository."""
+
+
 # Services
 
 class ServiceError(ApplicationError):
@@ -1,3 +1,4 @@
+from hashlib import sha256
 from typing import Literal
 from modelark import Entity
 
@@ -10,3 +11,10 @@ class Credential(Entity):
             'password', 'refresh_token'] = attributes.get('type', 'password')
         self.client = attributes.get('client', 'ALL')
         self.value = attributes['value']
+        self.key = attributes.get('key') or (
+            self.lookup(self.value) if self.type == 'refresh_token' else '')
+
+    @staticmethod
+    def lookup(value: str) -> str:
+        """Short digest under which refresh tokens are indexed."""
+        return sha256(value.encode()).hexdigest()[:32]
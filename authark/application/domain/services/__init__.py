@@ -5,4 +5,5 @@ from .access_service import *
 from .verification_service import *
 from .enrollment_service import *
 from .identity_service import *
+from .decision_service import *
 from .repositories import *
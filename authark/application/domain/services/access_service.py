@@ -1,8 +1,17 @@
-from typing import Dict, Any, List
+import time
+from hashlib import blake2b
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from ..common import codec
 from ..models import User, Tenant, Token, Dominion
 from .repositories import (
     RankingRepository, RoleRepository, DominionRepository)
 from .token_service import AccessTokenService
+from .decision_service import DecisionService
+
+
+RolesKey = Tuple[str, str]
+RolesEntry = Tuple[float, Tuple[str, str], Set[str], List[str]]
 
 
 class AccessService:
@@ -10,11 +19,34 @@ class AccessService:
     def __init__(self, ranking_repository: RankingRepository,
                  role_repository: RoleRepository,
                  dominion_repository: DominionRepository,
-                 token_service: AccessTokenService) -> None:
+                 token_service: AccessTokenService,
+                 ttl: float = 60, size: int = 10_000,
+                 decision_service: Optional[DecisionService] = None,
+                 budget: int = 0) -> None:
         self.ranking_repository = ranking_repository
         self.role_repository = role_repository
         self.dominion_repository = dominion_repository
         self.token_service = token_service
+        self.ttl = ttl
+        self.size = size
+        self.decision_service = decision_service
+        self.budget = budget
+        self.roles_cache: Dict[str, 'OrderedDict[RolesKey, RolesEntry]'] = (
+            defaultdict(OrderedDict))
+
+    def invalidate(self, user_ids: Iterable[str] = (),
+                   dominion_ids: Iterable[str] = (),
+                   role_ids: Iterable[str] = ()) -> None:
+        """Drop the cached roles of the given users and dominions and those
+        containing the given roles, in every tenant."""
+        user_ids, dominion_ids = set(user_ids), set(dominion_ids)
+        role_ids = set(role_ids)
+        for cache in self.roles_cache.values():
+            for key in [key for key, (*_, cached_role_ids, _)
+                        in cache.items()
+                        if key[0] in user_ids or key[1] in dominion_ids or
+                        not role_ids.isdisjoint(cached_role_ids)]:
+                del cache[key]
 
     async def generate_token(self, tenant: Tenant, user: User,
                              dominion: Dominion) -> Token:
@@ -25,7 +57,10 @@ class AccessService:
     async def _build_payload(self, tenant: Tenant, user: User,
                              dominion: Dominion) -> Dict[str, Any]:
         payload = self._build_basic_info(tenant, user)
-        payload['roles'] = await self._build_roles(user, dominion)
+        payload['roles'] = await self._build_roles(tenant, user, dominion)
+        if self.decision_service and self.budget:
+            payload.update(await self._build_permissions(
+                self.decision_service, payload['roles']))
         return payload
 
     def _build_basic_info(self, tenant: Tenant, user: User) -> Dict[str, Any]:
@@ -41,12 +76,59 @@ class AccessService:
             'roles': []
         }
 
-    async def _build_roles(self, user: User, dominion: Dominion) -> List[str]:
+    async def _build_roles(self, tenant: Tenant, user: User,
+                           dominion: Dominion) -> List[str]:
+        cache = self.roles_cache[tenant.id]
+        key = (user.id, dominion.id)
+        # Entries are checked against the repository versions to see the
+        # writes of other workers too, which invalidate can't reach.
+        versions = (await self.role_repository.version(),
+                    await self.ranking_repository.version())
+        entry = cache.get(key)
+        if entry and entry[0] > time.monotonic() and entry[1] == versions:
+            cache.move_to_end(key)
+            return list(entry[3])
+
         dominion_roles = await self.role_repository.search(
             [('dominion_id', '=', dominion.id)])
-        ranking_role_ids = [
+        ranking_role_ids = {
             ranking.role_id for ranking in
-            await self.ranking_repository.search([('user_id', '=', user.id)])]
-        roles = [f"{role.name}|{role.id}" for role in dominion_roles
+            await self.ranking_repository.search([('user_id', '=', user.id)])}
+        roles = [role for role in dominion_roles
                  if role.id in ranking_role_ids]
-        return roles
+        labels = [f"{role.name}|{role.id}" for role in roles]
+
+        # Versions read before the searches outdate the entry if any
+        # write happened while they were awaited.
+        cache[key] = (time.monotonic() + self.ttl, versions,
+                      {role.id for role in roles}, labels)
+        cache.move_to_end(key)
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+
+        return list(labels)
+
+    async def _build_permissions(self, decision_service: DecisionService,
+                                 roles: List[str]) -> Dict[str, Any]:
+        """Compact claim of the resource privileges granted to the roles,
+        e.g. 'orders:read,~write users:read' where '~' marks the
+        restricted ones, or a reference to them if it exceeds the
+        budget in bytes."""
+        role_ids = sorted(role.rsplit('|', 1)[-1] for role in roles)
+        table = await decision_service.table()
+
+        privileges: Dict[str, List[str]] = defaultdict(list)
+        for (resource, privilege), restricted in table.permissions(
+                role_ids).items():
+            privileges[resource].append(
+                f"{'~' if restricted else ''}{privilege}")
+        permissions = ' '.join(
+            f"{resource}:{','.join(values)}"
+            for resource, values in privileges.items())
+
+        if len(permissions.encode()) <= self.budget:
+            return {'permissions': permissions}
+
+        reference = blake2b(codec.dumps(
+            [role_ids, table.versions]).encode(), digest_size=8)
+        return {'permissions_ref': reference.hexdigest()}
@@ -0,0 +1,199 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from ..common import AuthProvider
+from ..models import Policy, Restriction
+from .repositories import (
+    PolicyRepository, RestrictionRepository, current_batch)
+
+
+DecisionKey = Tuple[str, str, str]
+
+
+class DecisionTable:
+    """Decisions of the active policies of a tenant by (role, resource,
+    privilege), each one with the ordered restrictions of its policies.
+
+    A decision allows access if any of its policies does. Each policy
+    contributes a list of restrictions, which are alternatives of each
+    other, and a policy without restrictions grants unrestricted
+    access."""
+
+    def __init__(self, versions: Tuple[str, str] = ('', '')) -> None:
+        self.versions = versions
+        self.policies: Dict[str, Policy] = {}
+        self.restrictions: Dict[str, Restriction] = {}
+        self.keys: Dict[DecisionKey, Dict[str, None]] = defaultdict(dict)
+        self.children: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.entries: Dict[DecisionKey, List[List[Dict[str, Any]]]] = {}
+        self.grants: Dict[str, Dict[Tuple[str, str], None]] = (
+            defaultdict(dict))
+
+    def decide(self, role_ids: Iterable[str], resource: str,
+               privilege: str) -> Dict[str, Any]:
+        restrictions: List[List[Dict[str, Any]]] = []
+        allowed = unrestricted = False
+        for role_id in role_ids:
+            entry = self.entries.get((role_id, resource, privilege))
+            if entry is None:
+                continue
+            allowed = True
+            unrestricted = unrestricted or not all(entry)
+            restrictions.extend(entry)
+
+        return {'allowed': allowed,
+                'restrictions': [] if unrestricted else restrictions}
+
+    def permissions(self, role_ids: Iterable[str]) -> Dict[
+            Tuple[str, str], bool]:
+        """Return the (resource, privilege) pairs granted to the given
+        roles, telling whether each one is restricted."""
+        role_ids = list(role_ids)
+        pairs: Dict[Tuple[str, str], None] = {}
+        for role_id in role_ids:
+            pairs.update(self.grants.get(role_id, {}))
+
+        return {pair: bool(self.decide(role_ids, *pair)['restrictions'])
+                for pair in sorted(pairs)}
+
+    def update(self, policies: Iterable[Policy] = (),
+               restrictions: Iterable[Restriction] = (),
+               policy_ids: Iterable[str] = (),
+               restriction_ids: Iterable[str] = ()) -> None:
+        """Patch the table recompiling only the affected decisions"""
+        touched: Set[DecisionKey] = set()
+        for policy_id in policy_ids:
+            touched.update(self._unlink_policy(policy_id))
+        for restriction_id in restriction_ids:
+            touched.update(self._unlink_restriction(restriction_id))
+
+        for policy in policies:
+            touched.update(self._unlink_policy(policy.id))
+            self.policies[policy.id] = policy
+            key = _key(policy)
+            self.keys[key][policy.id] = None
+            touched.add(key)
+
+        for restriction in restrictions:
+            touched.update(self._unlink_restriction(restriction.id))
+            self.restrictions[restriction.id] = restriction
+            self.children[restriction.policy_id][restriction.id] = None
+            touched.update(self._policy_keys(restriction.policy_id))
+
+        for key in touched:
+            self._compile(key)
+
+    def _unlink_policy(self, policy_id: str) -> List[DecisionKey]:
+        policy = self.policies.pop(policy_id, None)
+        if policy is None:
+            return []
+        key = _key(policy)
+        self.keys[key].pop(policy_id, None)
+        if not self.keys[key]:
+            del self.keys[key]
+        return [key]
+
+    def _unlink_restriction(self, restriction_id: str) -> List[DecisionKey]:
+        restriction = self.restrictions.pop(restriction_id, None)
+        if restriction is None:
+            return []
+        children = self.children[restriction.policy_id]
+        children.pop(restriction_id, None)
+        if not children:
+            del self.children[restriction.policy_id]
+        return self._policy_keys(restriction.policy_id)
+
+    def _policy_keys(self, policy_id: str) -> List[DecisionKey]:
+        policy = self.policies.get(policy_id)
+        return [_key(policy)] if policy else []
+
+    def _compile(self, key: DecisionKey) -> None:
+        alternatives: List[List[Dict[str, Any]]] = []
+        for policy_id in self.keys.get(key, ()):
+            if not self.policies[policy_id].active:
+                continue
+            restrictions = sorted(
+                (self.restrictions[restriction_id] for restriction_id
+                 in self.children.get(policy_id, ())),
+                key=lambda restriction: (
+                    int(restriction.sequence or 0), restriction.id))
+            alternatives.append([{
+                'name': restriction.name,
+                'target': restriction.target,
+                'domain': restriction.domain
+            } for restriction in restrictions])
+
+        role_id, resource, privilege = key
+        grants = self.grants[role_id]
+        if alternatives:
+            self.entries[key] = alternatives
+            grants[(resource, privilege)] = None
+        else:
+            self.entries.pop(key, None)
+            grants.pop((resource, privilege), None)
+        if not grants:
+            del self.grants[role_id]
+
+
+class DecisionService:
+    """Authorization decisions of the current tenant served from a
+    compiled decision table, rebuilt whenever the policies or
+    restrictions repositories change behind its back."""
+
+    def __init__(self, policy_repository: PolicyRepository,
+                 restriction_repository: RestrictionRepository,
+                 auth_provider: AuthProvider) -> None:
+        self.policy_repository = policy_repository
+        self.restriction_repository = restriction_repository
+        self.auth_provider = auth_provider
+        self.tables: Dict[str, DecisionTable] = {}
+
+    async def decide(self, role_ids: Iterable[str], resource: str,
+                     privilege: str) -> Dict[str, Any]:
+        table = await self.table()
+        return table.decide(role_ids, resource, privilege)
+
+    async def table(self) -> DecisionTable:
+        location = self.auth_provider.location
+        versions = await self.versions()
+        table = self.tables.get(location)
+        if table is not None and table.versions == versions:
+            return table
+
+        table = DecisionTable(versions)
+        table.update(await self.policy_repository.search([]),
+                     await self.restriction_repository.search([]))
+        # Tables seeing the writes of a batch are not shared, since the
+        # batch may still be rolled back.
+        if current_batch() is None:
+            self.tables[location] = table
+
+        return table
+
+    async def versions(self) -> Tuple[str, str]:
+        return (await self.policy_repository.version(),
+                await self.restriction_repository.version())
+
+    async def update(self, versions: Tuple[str, str],
+                     policies: Iterable[Policy] = (),
+                     restrictions: Iterable[Restriction] = (),
+                     policy_ids: Iterable[str] = (),
+                     restriction_ids: Iterable[str] = ()) -> None:
+        """Patch the table of the current tenant after writing the given
+        policies and restrictions or removing the given ids, provided
+        that it was built from the versions read before the write.
+        Otherwise, the table is dropped to be rebuilt on its next use."""
+        location = self.auth_provider.location
+        table: Optional[DecisionTable] = self.tables.get(location)
+        if table is None:
+            return
+        if current_batch() is not None or table.versions != versions:
+            del self.tables[location]
+            return
+
+        current = await self.versions()
+        table.update(policies, restrictions, policy_ids, restriction_ids)
+        table.versions = current
+
+
+def _key(policy: Policy) -> DecisionKey:
+    return (policy.role_id, policy.resource, policy.privilege)
@@ -1,5 +1,5 @@
 from typing import Dict, List, Tuple, Any
-from ..common import RecordList, UserCreationError
+from ..common import RecordList, UserCreationError, DuplicateError
 from ..models import User, Credential, Token, Dominion
 from .repositories import UserRepository, CredentialRepository
 from .hash_service import HashService
@@ -21,9 +21,14 @@ class EnrollmentService:
         credentials = [item[1] for item in registration_tuples]
 
         self._validate_usernames(users)
-        await self._validate_duplicates(users)
 
-        users = await self.user_repository.add(users)
+        # Usernames and emails are unique in the user repository.
+        try:
+            users = await self.user_repository.add(users)
+        except DuplicateError as error:
+            raise UserCreationError(
+                f"A user with the same email or username already "
+                f"exists. {error}") from error
 
         await self.set_credentials(users, credentials)
 
@@ -31,12 +36,11 @@ class EnrollmentService:
 
     async def set_credentials(
             self, users: List[User], credentials: List[Credential]) -> None:
-        new_credentials = []
-        for user, credential in zip(users, credentials):
-            hashed_password = self.hash_service.generate_hash(
-                credential.value)
-            credential = Credential(user_id=user.id, value=hashed_password)
-            new_credentials.append(credential)
+        hashed_passwords = await self.hash_service.agenerate_hashes(
+            [credential.value for credential in credentials])
+        new_credentials = [
+            Credential(user_id=user.id, value=hashed_password)
+            for user, hashed_password in zip(users, hashed_passwords)]
 
         old_credentials = await self.credential_repository.search([
             ('user_id', 'in', [user.id for user in users]),
@@ -62,14 +66,3 @@ class EnrollmentService:
             if any((character in '@.+-_') for character in user.username):
                 raise UserCreationError(
                     f"The username '{user.name}' has forbidden characters")
-
-    async def _validate_duplicates(self, users: List[User]):
-        existing_users = await self.user_repository.search([
-            '|', ('username', 'in', [user.username for user in users]),
-            ('email', 'in',  [user.email for user in users])])
-
-        for existing_user in existing_users:
-            message = (
-                f"A user with email '{existing_user.email}' or "
-                f"username '{existing_user.name}' already exists.")
-            raise UserCreationError(message)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class HashService(ABC):
@@ -10,6 +11,25 @@ class HashService(ABC):
     def verify_password(self, password: str, hash: str) -> bool:
         "Generate method to be implemented."
 
+    def generate_hashes(self, values: List[str]) -> List[str]:
+        "Batch generate method. Defaults to hashing serially."
+        return [self.generate_hash(value) for value in values]
+
+    async def agenerate_hash(self, value: str) -> str:
+        "Asynchronous generate method. Defaults to the blocking one."
+        return self.generate_hash(value)
+
+    async def averify_password(self, password: str, hash: str) -> bool:
+        "Asynchronous verify method. Defaults to the blocking one."
+        return self.verify_password(password, hash)
+
+    async def agenerate_hashes(self, values: List[str]) -> List[str]:
+        "Asynchronous batch generate method. Defaults to the blocking one."
+        return self.generate_hashes(values)
+
+    def shutdown(self) -> None:
+        "Release the held resources. Nothing is held by default."
+
 
 class MemoryHashService(HashService):
     def generate_hash(self, value: str) -> str:
@@ -4,8 +4,8 @@ from abc import ABC, abstractmethod
 
 class ImportService(ABC):
     @abstractmethod
-    def import_users(self, filepath: str, source: str,
-                     password_field: str) -> List[Any]:
+    async def import_users(self, filepath: str, source: str,
+                           password_field: str) -> List[Any]:
         "Import users method to be implemented."
 
 
@@ -13,6 +13,6 @@ class MemoryImportService(ImportService):
     def __init__(self):
         self.users = []
 
-    def import_users(self, filepath: str, source: str,
-                     password_field: str) -> List[Any]:
+    async def import_users(self, filepath: str, source: str,
+                           password_field: str) -> List[Any]:
         return self.users
@@ -1,4 +1,9 @@
 from ...common import QueryDomain
+from .repository_index import RepositoryIndex, unique_claims
+from .repository_paging import paginate, parse_order, key_ordered
+from .repository_batch import (
+    RepositoryBatch, repository_batch, current_batch)
+from .memory_repository import MemoryRepository
 from .memory_model_repositories import (
     CredentialRepository, MemoryCredentialRepository,
     DominionRepository, MemoryDominionRepository,
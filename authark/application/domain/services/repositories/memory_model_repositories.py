@@ -1,10 +1,13 @@
-from modelark import Repository, MemoryRepository
+from modelark import Repository
+from .memory_repository import MemoryRepository
 from ...models import (
     Credential, Dominion, Ranking, Role, User, Restriction, Policy)
 
 
 class CredentialRepository(Repository[Credential]):
     model = Credential
+    indexes = ['user_id', 'key', ('user_id', 'type'),
+               ('user_id', 'type', 'client')]
 
 
 class MemoryCredentialRepository(
@@ -14,6 +17,7 @@ class MemoryCredentialRepository(
 
 class DominionRepository(Repository[Dominion]):
     model = Dominion
+    indexes = ['name']
 
 
 class MemoryDominionRepository(
@@ -23,6 +27,8 @@ class MemoryDominionRepository(
 
 class RankingRepository(Repository[Ranking]):
     model = Ranking
+    indexes = ['user_id', 'role_id']
+    unique = [('user_id', 'role_id')]
 
 
 class MemoryRankingRepository(
@@ -32,6 +38,7 @@ class MemoryRankingRepository(
 
 class RoleRepository(Repository[Role]):
     model = Role
+    indexes = ['dominion_id']
 
 
 class MemoryRoleRepository(
@@ -41,6 +48,7 @@ class MemoryRoleRepository(
 
 class RestrictionRepository(Repository[Restriction]):
     model = Restriction
+    indexes = ['policy_id']
 
 
 class MemoryRestrictionRepository(
@@ -50,6 +58,7 @@ class MemoryRestrictionRepository(
 
 class PolicyRepository(Repository[Policy]):
     model = Policy
+    indexes = ['role_id']
 
 
 class MemoryPolicyRepository(
@@ -59,6 +68,8 @@ class MemoryPolicyRepository(
 
 class UserRepository(Repository[User]):
     model = User
+    indexes = ['username', 'email']
+    unique = ['username', 'email']
 
 
 class MemoryUserRepository(
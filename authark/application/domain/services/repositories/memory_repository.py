@@ -0,0 +1,98 @@
+from uuid import uuid4
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from modelark import MemoryRepository as BaseMemoryRepository
+from ...common import QueryDomain
+from .repository_index import RepositoryIndex
+from .repository_paging import paginate
+
+
+Stamp = Tuple[int, int, int]
+
+
+class MemoryRepository(BaseMemoryRepository):
+    """Memory repository ordering before paginating its searches and
+    counting the writes of each of its collections.
+
+    Searches are narrowed down through an index of each collection,
+    which is rebuilt whenever its data changes other than through the
+    repository, as far as its identity or size tell."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.epoch = uuid4().hex[:8]
+        self.versions: Dict[str, int] = defaultdict(int)
+        self.lookups: Dict[str, Tuple[Stamp, RepositoryIndex]] = {}
+
+    async def add(self, item: Union[Any, List[Any]]) -> List[Any]:
+        items = item if isinstance(item, list) else [item]
+        index = self._index()
+        # The items replace their stored versions, so they may swap values.
+        records = {item.id: vars(item) for item in items}
+        index.ensure_unique(records.values(), records)
+
+        items = await super().add(items)
+        self.versions[self._location] += 1
+        for item in items:
+            index.add(vars(item))
+        self._stamp(index)
+
+        return items
+
+    async def remove(self, item: Union[Any, List[Any]]) -> bool:
+        items = item if isinstance(item, list) else [item]
+        index = self._index()
+
+        deleted = await super().remove(items)
+        self.versions[self._location] += 1
+        for item in items:
+            index.remove(item.id)
+        self._stamp(index)
+
+        return deleted
+
+    def load(self, data: Dict[str, Dict[str, Any]]) -> 'MemoryRepository':
+        for location in data:
+            self.versions[location] += 1
+        return super().load(data)
+
+    async def version(self) -> str:
+        location = self._location
+        return f'{location}:{self.epoch}.{self.versions[location]}'
+
+    async def search(self, domain: QueryDomain,
+                     limit: Optional[int] = None, offset: Optional[int] = None,
+                     order: Optional[str] = None) -> List[Any]:
+        filter_function = self.filterer.parse(domain)
+        data = self.data.setdefault(self._location, {})
+        keys = self._index().lookup(domain)
+        items = data.values() if keys is None else (
+            data[key] for key in keys if key in data)
+
+        if limit is not None:
+            limit = min(limit, self.max_items)
+
+        return paginate((item for item in items
+                         if filter_function(item)), limit, offset, order)
+
+    def _index(self) -> RepositoryIndex:
+        location = self._location
+        data = self.data.setdefault(location, {})
+        stamp = (self.versions[location], id(data), len(data))
+        stamped = self.lookups.get(location)
+        if stamped and stamped[0] == stamp:
+            return stamped[1]
+
+        index = RepositoryIndex(
+            getattr(self, 'indexes', []), getattr(self, 'unique', []))
+        index.extend({**vars(item), 'id': key}
+                     for key, item in data.items())
+        self.lookups[location] = (stamp, index)
+
+        return index
+
+    def _stamp(self, index: RepositoryIndex) -> None:
+        location = self._location
+        data = self.data[location]
+        self.lookups[location] = (
+            (self.versions[location], id(data), len(data)), index)
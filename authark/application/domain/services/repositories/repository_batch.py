@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+
+class RepositoryBatch:
+    """Repository writes deferred until the end of a batch, where they
+    are committed once per enlisted participant or rolled back.
+
+    Participants provide validate, commit and rollback methods."""
+
+    def __init__(self) -> None:
+        self.participants: Dict[Hashable, Any] = {}
+        self.closed = False
+
+    def enlist(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        participant = self.participants.get(key)
+        if participant is None:
+            participant = self.participants[key] = factory()
+        return participant
+
+    def get(self, key: Hashable) -> Any:
+        return self.participants.get(key)
+
+    def commit(self) -> None:
+        """Validate every participant before committing any of them, and
+        roll back the ones left uncommitted if a commit fails."""
+        participants = list(self.participants.values())
+        try:
+            for participant in participants:
+                participant.validate()
+        except BaseException:
+            self.rollback()
+            raise
+
+        for position, participant in enumerate(participants):
+            try:
+                participant.commit()
+            except BaseException:
+                for pending in participants[position:]:
+                    pending.rollback()
+                raise
+
+    def rollback(self) -> None:
+        for participant in self.participants.values():
+            participant.rollback()
+
+
+_batch: ContextVar[Optional[RepositoryBatch]] = ContextVar(
+    'repository_batch', default=None)
+
+
+def current_batch() -> Optional[RepositoryBatch]:
+    # Tasks spawned within a batch inherit its context after it closes.
+    batch = _batch.get()
+    return batch if batch and not batch.closed else None
+
+
+@contextmanager
+def repository_batch() -> Iterator[RepositoryBatch]:
+    """Defer the repository writes of the enclosed block, committing
+    them at its end or rolling them back if it raises. Nested blocks
+    join the outer batch."""
+    batch = current_batch()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = RepositoryBatch()
+    token = _batch.set(batch)
+    try:
+        yield batch
+    except BaseException:
+        batch.rollback()
+        raise
+    else:
+        batch.commit()
+    finally:
+        batch.closed = True
+        _batch.reset(token)
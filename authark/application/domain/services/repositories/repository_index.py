@@ -0,0 +1,305 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import product
+from typing import (
+    Any, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional,
+    Sequence, Set, Tuple, Union)
+from ...common import QueryDomain, DuplicateError
+
+
+Field = Union[str, Tuple[str, ...]]
+
+
+class RepositoryIndex:
+    """Secondary hash indexes over the declared fields of a collection,
+    composite ones being declared as tuples of fields.
+
+    Composite indexes serve conjunctions of equalities on all of their
+    fields, and unique fields or composites reject the values already
+    taken by another record, except for empty ones. Like the unique
+    indexes of SQLite, those already holding duplicated values when
+    built in bulk are relaxed and not enforced."""
+
+    def __init__(self, fields: Sequence[Union[str, Sequence[str]]],
+                 unique: Sequence[Union[str, Sequence[str]]] = ()) -> None:
+        self.unique: List[Field] = [_field(field) for field in unique]
+        self.fields: List[Field] = list(dict.fromkeys(
+            ['id', *map(_field, fields), *self.unique]))
+        self.composites = [
+            field for field in self.fields if isinstance(field, tuple)]
+        self.entries: Dict[Field, Dict[Any, Dict[str, None]]] = {
+            field: defaultdict(dict) for field in self.fields}
+        self.values: Dict[str, Dict[Field, Any]] = {}
+        self.sequence: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self.counter = 0
+        self.relaxed: List[Field] = []
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        if self._insert(record):
+            insort(self.keys, record['id'])
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Add many records at once, sorting the keys only once"""
+        records = list(records)
+        inserted = False
+        for record in records:
+            inserted = self._insert(record) or inserted
+        if inserted:
+            self.keys = sorted(self.sequence)
+
+        for record in records:
+            for field, value in unique_claims(self.unique, record):
+                if (len(self.entries[field].get(value, ())) > 1 and
+                        field not in self.relaxed):
+                    self.relaxed.append(field)
+        if self.relaxed:
+            self.unique = [field for field in self.unique
+                           if field not in self.relaxed]
+
+    def _insert(self, record: Mapping[str, Any]) -> bool:
+        """Index the values of a record, returning whether its key is
+        new to the index."""
+        key = record['id']
+        self._unlink(key)
+        inserted = key not in self.sequence
+        if inserted:
+            self.sequence[key] = self.counter
+            self.counter += 1
+
+        values: Dict[Field, Any] = {}
+        for field in self.fields:
+            value = _value(record, field)
+            if not _hashable(value):
+                continue
+            self.entries[field][value][key] = None
+            values[field] = value
+        self.values[key] = values
+
+        return inserted
+
+    def remove(self, key: str) -> None:
+        self._unlink(key)
+        if self.sequence.pop(key, None) is None:
+            return
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            del self.keys[position]
+
+    def ensure_unique(
+            self, records: Iterable[Mapping[str, Any]],
+            written: Optional[Mapping[str, Optional[Mapping[str, Any]]]] = None
+    ) -> None:
+        """Raise a DuplicateError if any record takes a unique value owned
+        by another one, either indexed or given. Written records, or None
+        for the removed ones, override the indexed ones."""
+        for key, field, value in self.conflicts(records, written):
+            raise DuplicateError(
+                f"The value {value!r} of {field!r} is already taken.")
+
+    def conflicts(
+            self, records: Iterable[Mapping[str, Any]],
+            written: Optional[Mapping[str, Optional[Mapping[str, Any]]]] = None
+    ) -> Iterator[Tuple[str, Field, Any]]:
+        """Yield the key, field and value of every unique value taken by
+        a record while owned by another one."""
+        written = written or {}
+        owners: Dict[Tuple[Field, Any], str] = {}
+        for key, record in written.items():
+            for claim in unique_claims(self.unique, record or {}):
+                owners[claim] = key
+
+        for record in records:
+            key = record['id']
+            for claim in unique_claims(self.unique, record):
+                field, value = claim
+                taken = [owner for owner in
+                         self.entries[field].get(value, ())
+                         if owner not in written]
+                taken.append(owners.get(claim, key))
+                if any(owner != key for owner in taken):
+                    yield key, field, value
+                    continue
+                owners[claim] = key
+
+    def lookup(self, domain: QueryDomain) -> Optional[List[str]]:
+        """Return the ordered candidate keys of a domain or None if the
+        domain can't be narrowed down using the index."""
+        candidates = self._plan(domain)
+        if candidates is None:
+            return None
+        return sorted(candidates, key=self.sequence.__getitem__)
+
+    def scan(self, domain: QueryDomain) -> Iterable[str]:
+        """Return the candidate keys of a domain in ascending key order,
+        seeking directly past a leading ('id', '>', key) cursor term."""
+        after = _cursor(domain)
+        candidates = self._plan(domain)
+        if candidates is not None:
+            return sorted(key for key in candidates
+                          if after is None or key > after)
+
+        start = 0 if after is None else bisect_right(self.keys, after)
+        return (self.keys[position] for position in
+                range(start, len(self.keys)))
+
+    def _unlink(self, key: str) -> None:
+        for field, value in self.values.pop(key, {}).items():
+            bucket = self.entries[field].get(value)
+            if bucket is None:
+                continue
+            bucket.pop(key, None)
+            if not bucket:
+                del self.entries[field][value]
+
+    def _plan(self, domain: QueryDomain) -> Optional[Set[str]]:
+        # Mirrors the stack evaluation of the QueryParser so that the
+        # candidates are always a superset of the matching records.
+        if not domain:
+            return None
+
+        candidates = self._composite(domain)
+        if candidates is not None:
+            return candidates
+
+        stack: List[Optional[Set[str]]] = []
+        for item in list(reversed(domain)):
+            if isinstance(item, str) and item in ('&', '|'):
+                first_operand = stack.pop()
+                second_operand = stack.pop()
+                stack.append(self._combine(
+                    item, first_operand, second_operand))
+            elif isinstance(item, str) and item == '!':
+                stack.pop()
+                stack.append(None)
+
+            stack = self._default_join(stack)
+
+            if isinstance(item, (list, tuple)):
+                stack.append(self._match(item))
+
+        return self._default_join(stack)[0]
+
+    def _composite(self, domain: QueryDomain) -> Optional[Set[str]]:
+        """Candidates of a conjunction of equalities covering all the
+        fields of a composite index, the widest one being preferred."""
+        if not self.composites or any(
+                isinstance(item, str) and item != '&' for item in domain):
+            return None
+
+        values: Dict[str, List[Any]] = {}
+        for item in domain:
+            if isinstance(item, str):
+                continue
+            field, operator, value = item
+            if operator == '=':
+                value = [value]
+            elif operator != 'in' or not isinstance(
+                    value, (list, tuple, set)):
+                continue
+            if all(_hashable(element) for element in value):
+                values.setdefault(field, list(value))
+
+        covered = [composite for composite in self.composites
+                   if all(field in values for field in composite)]
+        if not covered:
+            return None
+
+        composite = max(covered, key=len)
+        combinations = 1
+        for field in composite:
+            combinations *= len(values[field])
+        # Beyond the collection size a scan is cheaper.
+        if combinations > len(self.sequence) + 1:
+            return None
+
+        entries = self.entries[composite]
+        result: Set[str] = set()
+        for value in product(*(values[field] for field in composite)):
+            result.update(entries.get(value, ()))
+        return result
+
+    def _default_join(
+            self, stack: List[Optional[Set[str]]]
+    ) -> List[Optional[Set[str]]]:
+        if len(stack) == 2:
+            first_operand = stack.pop()
+            second_operand = stack.pop()
+            stack.append(self._combine('&', first_operand, second_operand))
+        return stack
+
+    def _match(self, term: Sequence[Any]) -> Optional[Set[str]]:
+        field, operator, value = term
+        entries = self.entries.get(field)
+        if entries is None:
+            return None
+
+        if operator == '=' and isinstance(value, Hashable):
+            return set(entries.get(value, ()))
+
+        if operator == 'in' and isinstance(value, (list, tuple, set)):
+            if not all(isinstance(element, Hashable) for element in value):
+                return None
+            result: Set[str] = set()
+            for element in value:
+                result.update(entries.get(element, ()))
+            return result
+
+        return None
+
+    @staticmethod
+    def _combine(operator: str, first: Optional[Set[str]],
+                 second: Optional[Set[str]]) -> Optional[Set[str]]:
+        if operator == '&':
+            if first is None:
+                return second
+            if second is None:
+                return first
+            return first & second
+
+        if first is None or second is None:
+            return None
+        return first | second
+
+
+def unique_claims(fields: Sequence[Field], record: Mapping[str, Any]
+                  ) -> List[Tuple[Field, Any]]:
+    """Unique (field, value) pairs claimed by a record, leaving out the
+    empty values."""
+    claims = []
+    for field in fields:
+        value = _value(record, field)
+        elements = value if isinstance(field, tuple) else (value,)
+        if _hashable(value) and all(
+                element not in (None, '') for element in elements):
+            claims.append((field, value))
+    return claims
+
+
+def _field(field: Union[str, Sequence[str]]) -> Field:
+    return field if isinstance(field, str) else tuple(field)
+
+
+def _value(record: Mapping[str, Any], field: Field) -> Any:
+    if isinstance(field, tuple):
+        return tuple(record.get(element) for element in field)
+    return record.get(field)
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _cursor(domain: QueryDomain) -> Optional[str]:
+    # A leading term is always conjoined with the rest of the domain
+    # under the default join of the query parser.
+    if not domain or not isinstance(domain[0], (list, tuple)):
+        return None
+    field, operator, value = domain[0]
+    if field == 'id' and operator == '>' and isinstance(value, str):
+        return value
+    return None
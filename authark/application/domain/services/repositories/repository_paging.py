@@ -0,0 +1,71 @@
+import heapq
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+from ...common import QueryError
+
+
+T = TypeVar('T')
+
+
+def paginate(items: Iterable[T], limit: Optional[int] = None,
+             offset: Optional[int] = None,
+             order: Optional[str] = None) -> List[T]:
+    """Slice the given items lazily, so that unordered pages stop
+    consuming the iterable as soon as they are complete."""
+    offset = offset or 0
+    if order:
+        key = order_key(order)
+        if limit is None:
+            return sorted(items, key=key)[offset:]
+        return heapq.nsmallest(offset + limit, items, key=key)[offset:]
+
+    stop = None if limit is None else offset + limit
+    return list(islice(items, offset, stop))
+
+
+def parse_order(order: str) -> List[Tuple[str, bool]]:
+    fields = []
+    for field in order.split(','):
+        key, *direction = field.split() or ['']
+        tokens = [token.lower() for token in direction]
+        if not key or not set(tokens) <= {'asc', 'desc'}:
+            raise QueryError(f"Invalid order '{field.strip()}'.")
+        fields.append((key, 'desc' in tokens))
+    return fields
+
+
+def key_ordered(order: Optional[str] = None) -> bool:
+    """Tell whether an order walks the records by ascending id."""
+    return parse_order(order) == [('id', False)] if order else False
+
+
+def order_key(order: str) -> Callable[[Any], Tuple]:
+    """Sort key of an order, placing the None values last as if they
+    were the largest ones."""
+    fields = parse_order(order)
+
+    def key(item: Any) -> Tuple:
+        values = []
+        for field, descending in fields:
+            try:
+                value = getattr(item, field)
+            except AttributeError:
+                raise QueryError(f"Unknown order field '{field}'.")
+            value = (value is None, value)
+            values.append(Descending(value) if descending else value)
+        return tuple(values)
+
+    return key
+
+
+class Descending:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return self.value == getattr(other, 'value', other)
+
+    def __lt__(self, other: 'Descending') -> bool:
+        return other.value < self.value
@@ -1,6 +1,6 @@
-import json
 from typing import Dict, Any
 from abc import ABC, abstractmethod
+from ..common import codec
 from ..models import Token
 
 
@@ -20,13 +20,13 @@ class TokenService(ABC):
 
 class MemoryTokenService(TokenService):
     def generate_token(self, payload: Dict[str, Any]) -> Token:
-        return Token(json.dumps(payload))
+        return Token(codec.dumps(payload))
 
     def valid(self, token: Token) -> bool:
         return True
 
     def decode(self, token: Token) -> Dict[str, Any]:
-        return json.loads(token.value)
+        return codec.loads(token.value)
 
 
 # Dedicated Aliases
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Tuple, Union
+from .tenant_supplier import TenantSupplier
+
+
+Entry = Tuple[float, Union[Dict[str, Any], Exception]]
+
+
+class CachedTenantSupplier(TenantSupplier):
+    """Tenant supplier decorator caching tenant lookups by slug and by id,
+    including the failed ones for a shorter time."""
+
+    def __init__(self, supplier: TenantSupplier, ttl: float = 60,
+                 negative_ttl: float = 5, size: int = 10_000) -> None:
+        self.supplier = supplier
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.size = size
+        self.names: 'OrderedDict[str, Entry]' = OrderedDict()
+        self.ids: 'OrderedDict[str, Entry]' = OrderedDict()
+
+    def get_tenant(self, tenant_id: str) -> Dict[str, Any]:
+        return self._lookup(self.ids, tenant_id, self.supplier.get_tenant)
+
+    def create_tenant(self, tenant_dict: Dict[str, Any]) -> None:
+        self.supplier.create_tenant(tenant_dict)
+        self.invalidate()
+
+    def resolve_tenant(self, name: str) -> Dict[str, Any]:
+        return self._lookup(self.names, name, self.supplier.resolve_tenant)
+
+    def search_tenants(self, domain: List[Any]) -> List[Dict[str, Any]]:
+        return self.supplier.search_tenants(domain)
+
+    def invalidate(self) -> None:
+        self.names.clear()
+        self.ids.clear()
+
+    def _lookup(self, cache: 'OrderedDict[str, Entry]', key: str,
+                load: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry and entry[0] > now:
+            cache.move_to_end(key)
+            return self._unwrap(entry[1])
+
+        try:
+            tenant = dict(load(key))
+        except Exception as error:
+            self._store(cache, key, (now + self.negative_ttl, error))
+            raise
+
+        entry = (now + self.ttl, tenant)
+        self._store(cache, key, entry)
+        self._store(self.names, tenant.get('slug', key), entry)
+        self._store(self.ids, tenant.get('id', key), entry)
+
+        return dict(tenant)
+
+    def _store(self, cache: 'OrderedDict[str, Entry]',
+               key: str, entry: Entry) -> None:
+        cache[key] = entry
+        cache.move_to_end(key)
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _unwrap(value: Union[Dict[str, Any], Exception]) -> Dict[str, Any]:
+        if isinstance(value, Exception):
+            raise value.with_traceback(None)
+        return dict(value)
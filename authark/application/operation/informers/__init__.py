@@ -1,3 +1,4 @@
 from .standard_informer import StandardInformer
 from .composing_informer import ComposingInformer
 from .tenant_informer import TenantInformer
+from .security_informer import SecurityInformer
@@ -0,0 +1,40 @@
+from typing import List, Optional
+from ...domain.common import AuthProvider
+from ...domain.services import DecisionService
+from ...domain.services.repositories import RankingRepository
+
+
+class SecurityInformer:
+
+    def __init__(self, ranking_repository: RankingRepository,
+                 decision_service: DecisionService,
+                 auth_provider: AuthProvider) -> None:
+        self.ranking_repository = ranking_repository
+        self.decision_service = decision_service
+        self.auth_provider = auth_provider
+
+    async def authorize(self, entry: dict) -> dict:
+        """Decide every (resource, privilege) pair of the entry data for
+        the meta user, or for the roles of the current one."""
+        meta, data = entry.get('meta', {}), entry.get('data', [])
+        role_ids = await self._role_ids(meta.get('user_id'))
+
+        table = await self.decision_service.table()
+        result = []
+        for record in data:
+            resource, privilege = record['resource'], record['privilege']
+            decision = table.decide(role_ids, resource, privilege)
+            result.append({'resource': resource, 'privilege': privilege,
+                           **decision})
+
+        return {"data": result}
+
+    async def _role_ids(self, user_id: Optional[str] = None) -> List[str]:
+        if user_id:
+            return [ranking.role_id for ranking in
+                    await self.ranking_repository.search(
+                        [('user_id', '=', user_id)])]
+
+        # Token roles are labeled as 'name|id'.
+        return [role.rsplit('|', 1)[-1]
+                for role in self.auth_provider.user.roles]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Union, List, Tuple, Any, overload
+from typing import Union, Dict, List, Tuple, Any, overload
 from ...domain.services.repositories import (
     UserRepository, CredentialRepository,
     DominionRepository, RoleRepository,
@@ -29,8 +29,20 @@ class StandardInformer():
         model = meta['model']
         domain = meta['domain']
         repository = getattr(self, f'{model}_repository')
-        result = await repository.search(domain=domain)
-        return {'data': [vars(item) for item in result]}
+        limit, offset = meta.get('limit'), meta.get('offset')
+        order, after = meta.get('order') or None, meta.get('after')
+        if after is not None:
+            domain = [('id', '>', after), *domain] if after else domain
+            offset, order = None, 'id'
+
+        result = await repository.search(domain, limit, offset, order)
+        records: Dict[str, Any] = {'data': [vars(item) for item in result]}
+
+        if after is not None:
+            records['cursor'] = (
+                result[-1].id if limit and len(result) == limit else '')
+
+        return records
 
     async def count(self, entry: dict) -> dict:
         meta = entry['meta']
@@ -40,6 +52,13 @@ class StandardInformer():
         result = await repository.count(meta['domain'])
         return {'data': result}
 
+    async def version(self, entry: dict) -> dict:
+        meta = entry['meta']
+        model = meta['model']
+
+        repository = getattr(self, f'{model}_repository')
+        return {'data': await repository.version()}
+
     async def join(self, entry: dict) -> dict:
         meta = entry['meta']
         model = meta['model']
@@ -72,7 +72,8 @@ class AuthManager:
             raise AuthError("Authentication Error: No credentials found.")
 
         user_password = credentials[0].value
-        if not self.hash_service.verify_password(password, user_password):
+        if not await self.hash_service.averify_password(
+                password, user_password):
             raise AuthError("Authentication Error: Password mismatch.")
 
         dominion = await self._ensure_dominion(dominion_name)
@@ -132,16 +133,12 @@ class AuthManager:
             organization=tenant.name)
         self.auth_provider.setup(anonymouns_session)
 
-        credentials = await self.credential_repository.search([
-            ('value', '=', refresh_token), ('type', '=', 'refresh_token')])
-        if not credentials:
-            raise AuthError("Authentication Error: Refresh token not found.")
-
         token = Token(refresh_token)
         self.refresh_token_service.valid(token)
 
+        credential = await self._find_refresh_credential(token)
+
         tokens_dict = {}
-        credential = credentials[0]
 
         tokens_dict['refresh_token'] = await self._generate_refresh_token(
             credential.user_id, credential.client)
@@ -157,6 +154,32 @@ class AuthManager:
 
         return tokens_dict
 
+    async def _find_refresh_credential(self, token: Token) -> Credential:
+        credentials = [
+            credential for credential in
+            await self.credential_repository.search([
+                ('key', '=', Credential.lookup(token.value)),
+                ('type', '=', 'refresh_token')])
+            if credential.value == token.value]
+
+        if not credentials:
+            # Refresh tokens stored before they had a lookup key
+            credentials = await self.credential_repository.search([
+                ('user_id', '=', self._token_subject(token)),
+                ('type', '=', 'refresh_token'),
+                ('value', '=', token.value)])
+
+        if not credentials:
+            raise AuthError("Authentication Error: Refresh token not found.")
+
+        return credentials[0]
+
+    def _token_subject(self, token: Token) -> str:
+        try:
+            return self.refresh_token_service.decode(token).get('sub', '')
+        except ValueError:
+            return ''
+
     async def _ensure_dominion(self, dominion_name: str) -> Dominion:
         dominions = await self.dominion_repository.search(
             [('name', '=', dominion_name)])
@@ -184,14 +207,16 @@ class AuthManager:
         refresh_token = self.refresh_token_service.generate_token(
             refresh_payload)
 
-        # Remove previous refresh tokens as a user should have only one
+        # Replace the previous refresh token in place, as a user should
+        # have only one per client, so that rotating it is a single write
         previous_tokens = await self.credential_repository.search([
             ('user_id', '=', user_id), ('type', '=', 'refresh_token'),
             ('client', '=', client)])
-        for token in previous_tokens:
-            await self.credential_repository.remove(token)
+        identity = {'id': previous_tokens[0].id} if previous_tokens else {}
+        if previous_tokens[1:]:
+            await self.credential_repository.remove(previous_tokens[1:])
 
-        credential = Credential(user_id=user_id,
+        credential = Credential(**identity, user_id=user_id,
                                 value=refresh_token.value,
                                 type='refresh_token', client=client)
         await self.credential_repository.add(credential)
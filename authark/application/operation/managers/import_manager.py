@@ -1,12 +1,15 @@
-from typing import List, Optional, Any
+from typing import Any, Dict, List, Sequence, Tuple
 from ...domain.services import ImportService
 from ...domain.services.repositories import (
     UserRepository, CredentialRepository, RoleRepository, RankingRepository,
-    DominionRepository)
-from ...domain.models import User, Credential, Ranking, Dominion
+    DominionRepository, repository_batch)
+from ...domain.models import User, Credential, Ranking
 
 
 class ImportManager:
+    # Values searched at once, within the SQLite parameter limits.
+    chunk_size = 500
+
     def __init__(self, import_service: ImportService,
                  user_repository: UserRepository,
                  credential_repository: CredentialRepository,
@@ -26,55 +29,114 @@ class ImportManager:
         source = data['source']
         password_field = data['password_field']
 
-        users_list = self.import_service.import_users(
+        users_list = await self.import_service.import_users(
             filepath, source, password_field)
-        for user, credential, roles in users_list:
-            user, *_ = await self.user_repository.add(user)
-            if credential:
-                credential.user_id = user.id
-                await self._update_credential(credential)
-            if roles:
-                await self._generate_ranking_user(roles, user)
-
-        return {}
-
-    async def _update_credential(self, credential: Credential):
-        domain = [
-            ('user_id', '=', credential.user_id),
-            ('type', '=', 'password')]
-
-        existing_credential = await self.credential_repository.search(domain)
-        if existing_credential:
-            credential.id = existing_credential[0].id
-            await self.credential_repository.add(credential)
-        else:
-            await self.credential_repository.add(credential)
-
-    async def _search_dominion(self, dominion: Dominion) -> Optional[Dominion]:
-        domain = [('name', '=', dominion.name)]
-        existing_dominion = await self.dominion_repository.search(domain)
-        if existing_dominion:
-            return existing_dominion[0]
-        else:
-            return None
-
-    async def _create_ranking(self, role, user: User) -> None:
-        if not role:
-            return None
-        ranking_domain = [('user_id', '=', user.id),
-                          ('role_id', '=', role[0].id)]
-        existing_ranking = await self.ranking_repository.search(
-            ranking_domain)
-        if not existing_ranking:
-            ranking = Ranking(user_id=user.id,
-                              role_id=role[0].id)
-            await self.ranking_repository.add(ranking)
-
-    async def _generate_ranking_user(
-            self, roles: List[Any], user: User) -> None:
-        for role, dominion in roles:
-            existing_dominion = await self._search_dominion(dominion)
-            if existing_dominion:
-                domain = [('name', '=', role.name)]
-                existing_role = await self.role_repository.search(domain)
-                await self._create_ranking(existing_role, user)
+
+        # Written in bulk and committed at once instead of per user.
+        with repository_batch():
+            users, skipped = await self._update_users(
+                [user for user, *_ in users_list])
+            imported = {id(user) for user in users}
+            users_list = [row for row in users_list
+                          if id(row[0]) in imported]
+            await self._update_credentials([
+                (user, credential)
+                for user, credential, _ in users_list if credential])
+            await self._generate_rankings([
+                (user, roles) for user, _, roles in users_list if roles])
+
+        return {"data": {"skipped": skipped}}
+
+    async def _update_users(
+            self, users: List[User]) -> Tuple[List[User], List[str]]:
+        """Match the users with the stored ones by username, the latest
+        one of the import winning, and leave out those whose email is
+        taken by another user."""
+        existing = {user.username: user.id for user in await self._search(
+            self.user_repository, 'username',
+            [user.username for user in users])}
+        owners = {user.email: user.id for user in await self._search(
+            self.user_repository, 'email',
+            [user.email for user in users if user.email])}
+
+        accepted: Dict[str, User] = {}
+        emails: Dict[str, str] = {}
+        skipped: List[str] = []
+        for user in users:
+            previous = accepted.get(user.username)
+            user.id = previous.id if previous else existing.get(
+                user.username, user.id)
+            if (owners.get(user.email, user.id) != user.id or
+                    emails.get(user.email, user.username) != user.username):
+                skipped.append(user.username)
+                continue
+            if previous:
+                emails.pop(previous.email, None)
+                del accepted[user.username]
+            if user.email:
+                emails[user.email] = user.username
+            accepted[user.username] = user
+
+        if accepted:
+            await self.user_repository.add(list(accepted.values()))
+
+        return list(accepted.values()), skipped
+
+    async def _update_credentials(
+            self, pairs: List[Tuple[User, Credential]]) -> None:
+        existing = {
+            credential.user_id: credential.id
+            for credential in await self._search(
+                self.credential_repository, 'user_id',
+                [user.id for user, _ in pairs])
+            if credential.type == 'password'}
+
+        credentials = []
+        for user, credential in pairs:
+            credential.user_id = user.id
+            credential.id = existing.get(user.id, credential.id)
+            credentials.append(credential)
+
+        if credentials:
+            await self.credential_repository.add(credentials)
+
+    async def _generate_rankings(
+            self, pairs: List[Tuple[User, List[Any]]]) -> None:
+        """Rank the users in their roles of existing dominions, skipping
+        the rankings they already have."""
+        dominions = {dominion.name for dominion in await self._search(
+            self.dominion_repository, 'name',
+            [dominion.name for _, roles in pairs for _, dominion in roles])}
+        roles: Dict[str, str] = {}
+        for role in await self._search(
+                self.role_repository, 'name',
+                [role.name for _, roles in pairs for role, _ in roles]):
+            roles.setdefault(role.name, role.id)
+        ranked = {(ranking.user_id, ranking.role_id)
+                  for ranking in await self._search(
+                      self.ranking_repository, 'user_id',
+                      [user.id for user, _ in pairs])}
+
+        rankings = []
+        for user, user_roles in pairs:
+            for role, dominion in user_roles:
+                key = (user.id, roles.get(role.name))
+                if (dominion.name not in dominions or key[1] is None or
+                        key in ranked):
+                    continue
+                ranked.add(key)
+                rankings.append(Ranking(user_id=user.id, role_id=key[1]))
+
+        if rankings:
+            await self.ranking_repository.add(rankings)
+
+    async def _search(self, repository: Any, field: str,
+                      values: Sequence[Any]) -> List[Any]:
+        """Search the records holding any of the values of a field, in
+        chunks of them."""
+        values = list(dict.fromkeys(values))
+        results = []
+        for index in range(0, len(values), self.chunk_size):
+            results.extend(await repository.search([
+                (field, 'in', values[index:index + self.chunk_size])]))
+        return results
@@ -1,5 +1,6 @@
 from typing import List
 from ...domain.models import Dominion, Role, Ranking
+from ...domain.services import AccessService
 from ...domain.services.repositories import (
     UserRepository, DominionRepository, RoleRepository, RankingRepository)
 from ...domain.common import RecordList
@@ -10,11 +11,13 @@ class ManagementManager:
     def __init__(self, user_repository: UserRepository,
                  dominion_repository: DominionRepository,
                  role_repository: RoleRepository,
-                 ranking_repository: RankingRepository) -> None:
+                 ranking_repository: RankingRepository,
+                 access_service: AccessService) -> None:
         self.user_repository = user_repository
         self.dominion_repository = dominion_repository
         self.role_repository = role_repository
         self.ranking_repository = ranking_repository
+        self.access_service = access_service
 
     async def create_dominion(self, entry: dict) -> dict:
         meta, data = entry['meta'], entry['data']
@@ -37,6 +40,9 @@ class ManagementManager:
         role_dicts = data
         roles = [Role(**role_dict) for role_dict in role_dicts]
         await self.role_repository.add(roles)
+        self.access_service.invalidate(
+            dominion_ids=[role.dominion_id for role in roles],
+            role_ids=[role.id for role in roles])
 
         return {}
 
@@ -45,7 +51,12 @@ class ManagementManager:
         role_ids = data
         roles = await self.role_repository.search(
             [('id', 'in', role_ids)])
-        return {"data": await self.role_repository.remove(roles)}
+        result = await self.role_repository.remove(roles)
+        self.access_service.invalidate(
+            dominion_ids=[role.dominion_id for role in roles],
+            role_ids=[role.id for role in roles])
+
+        return {"data": result}
 
     async def assign_role(self, entry: dict) -> dict:
         meta, data = entry['meta'], entry['data']
@@ -67,19 +78,21 @@ class ManagementManager:
             if record['user_id'] in user_set and
             record['role_id'] in role_set]
 
-        existing_rankings = await self.ranking_repository.search([
-            '|', ('user_id', 'in',  [ranking.user_id for ranking in rankings]),
-            ('role_id', 'in',  [ranking.role_id for ranking in rankings])
-        ])
+        # Both equalities narrow the candidates through the repository
+        # indexes, and duplicates are then matched by their exact pair.
+        existing = {
+            (ranking.user_id, ranking.role_id): ranking.id
+            for ranking in await self.ranking_repository.search([
+                ('user_id', 'in', list(user_set)),
+                ('role_id', 'in', list(role_set))])}
 
-        # Check for duplicates
-        for existing_ranking in existing_rankings:
-            for ranking in rankings:
-                if (existing_ranking.user_id == ranking.user_id and
-                        existing_ranking.role_id == ranking.role_id):
-                    ranking.id = existing_ranking.id
+        for ranking in rankings:
+            key = (ranking.user_id, ranking.role_id)
+            ranking.id = existing.setdefault(key, ranking.id)
 
         await self.ranking_repository.add(rankings)
+        self.access_service.invalidate(
+            user_ids=[ranking.user_id for ranking in rankings])
 
         return {}
 
@@ -88,4 +101,8 @@ class ManagementManager:
         ranking_ids = data
         rankings = await self.ranking_repository.search(
             [('id', 'in', ranking_ids)])
-        return {"data": await self.ranking_repository.remove(rankings)}
+        result = await self.ranking_repository.remove(rankings)
+        self.access_service.invalidate(
+            user_ids=[ranking.user_id for ranking in rankings])
+
+        return {"data": result}
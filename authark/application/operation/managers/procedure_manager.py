@@ -231,14 +231,16 @@ class ProcedureManager:
         refresh_token = self.refresh_token_service.generate_token(
             refresh_payload)
 
-        # Remove previous refresh tokens as a user should have only one
+        # Replace the previous refresh token in place, as a user should
+        # have only one per client, so that rotating it is a single write
         previous_tokens = await self.credential_repository.search([
             ('user_id', '=', user_id), ('type', '=', 'refresh_token'),
             ('client', '=', client)])
-        for token in previous_tokens:
-            await self.credential_repository.remove(token)
+        identity = {'id': previous_tokens[0].id} if previous_tokens else {}
+        if previous_tokens[1:]:
+            await self.credential_repository.remove(previous_tokens[1:])
 
-        credential = Credential(user_id=user_id,
+        credential = Credential(**identity, user_id=user_id,
                                 value=refresh_token.value,
                                 type='refresh_token', client=client)
         await self.credential_repository.add(credential)
@@ -2,6 +2,7 @@ from typing import List
 from ...domain.models import Restriction, Policy
 from ...domain.services.repositories import (
     RestrictionRepository, PolicyRepository)
+from ...domain.services import DecisionService
 from ...domain.common import RecordList
 
 
@@ -9,10 +10,11 @@ class SecurityManager:
 
     def __init__(self, restriction_repository: RestrictionRepository,
                  policy_repository: PolicyRepository,
-                 ) -> None:
+                 decision_service: DecisionService) -> None:
         self.restriction_repository: RestrictionRepository = (
             restriction_repository)
         self.policy_repository: PolicyRepository = policy_repository
+        self.decision_service = decision_service
 
     async def create_restriction(self, entry: dict) -> dict:
         meta, data = entry['meta'], entry['data']
@@ -20,7 +22,10 @@ class SecurityManager:
         restrictions: List[Restriction] = (
             [Restriction(**restriction_dict)
              for restriction_dict in restriction_dicts])
+        versions = await self.decision_service.versions()
         await self.restriction_repository.add(restrictions)
+        await self.decision_service.update(
+            versions, restrictions=restrictions)
 
         return {}
 
@@ -29,7 +34,9 @@ class SecurityManager:
         policy_dicts = data
         policies: List[Policy] = [Policy(**policy_dict)
                                   for policy_dict in policy_dicts]
+        versions = await self.decision_service.versions()
         await self.policy_repository.add(policies)
+        await self.decision_service.update(versions, policies=policies)
 
         return {}
 
@@ -38,11 +45,19 @@ class SecurityManager:
         restriction_ids = data
         restrictions = await self.restriction_repository.search(
             [('id', 'in', restriction_ids)])
-        return {"data": await self.restriction_repository.remove(restrictions)}
+        versions = await self.decision_service.versions()
+        deleted = await self.restriction_repository.remove(restrictions)
+        await self.decision_service.update(versions, restriction_ids=[
+            restriction.id for restriction in restrictions])
+        return {"data": deleted}
 
     async def remove_policy(self, entry: dict) -> dict:
         meta, data = entry['meta'], entry['data']
         policy_ids = data
         policies = await self.policy_repository.search(
             [('id', 'in', policy_ids)])
-        return {"data": await self.policy_repository.remove(policies)}
+        versions = await self.decision_service.versions()
+        deleted = await self.policy_repository.remove(policies)
+        await self.decision_service.update(versions, policy_ids=[
+            policy.id for policy in policies])
+        return {"data": deleted}
@@ -8,6 +8,7 @@ Config = Dict[str, Any]
 
 config = {
     "port": int(os.environ.get('AUTHARK_PORT') or 6291),
+    "workers": int(os.environ.get('AUTHARK_WORKERS') or 1),
     "factory": os.environ.get('AUTHARK_FACTORY') or 'OauthFactory',
     "templates": (os.environ.get('AUTHARK_TEMPLATES') or ".").split(','),
     "environment": {
@@ -41,7 +42,15 @@ config = {
             "algorithm": "HS256",
             "secret": (os.environ.get('AUTHARK_TOKENS_SECRET') or
                        ""),
-            "lifetime": 86400
+            "lifetime": 86400,
+            "cache": {
+                "size": int(os.environ.get(
+                    'AUTHARK_TOKENS_CACHE_SIZE') or 4096),
+                "ttl": int(os.environ.get(
+                    'AUTHARK_TOKENS_CACHE_TTL') or 300),
+                "report": int(os.environ.get(
+                    'AUTHARK_TOKENS_CACHE_REPORT') or 300)
+            }
         },
         "tenant": {
             "algorithm": "HS256",
@@ -53,7 +62,9 @@ config = {
             "algorithm": "HS256",
             "secret": (os.environ.get('AUTHARK_TOKENS_SECRET') or
                        "DEVSECRET123"),
-            "lifetime": 86400
+            "lifetime": 86400,
+            "permissions": int(os.environ.get(
+                'AUTHARK_TOKENS_PERMISSIONS') or 0)
         },
         "verification": {
             "algorithm": "HS256",
@@ -69,9 +80,14 @@ config = {
             "threshold": 86400
         }
     },
+    "hashing": {
+        "workers": int(os.environ.get('AUTHARK_HASHING_WORKERS') or 0),
+        "depth": int(os.environ.get('AUTHARK_HASHING_DEPTH') or 256)
+    },
     "tenancy": {
         "json": os.environ.get('AUTHARK_TENANCY_JSON') or str(
-            Path.home() / "data/tenants.json")
+            Path.home() / "data/tenants.json"),
+        "ttl": int(os.environ.get('AUTHARK_TENANCY_TTL') or 60)
     },
     "zones": {
         "default": {
@@ -79,6 +95,19 @@ config = {
                 Path.home() / "data")
         }
     },
+    "json": {
+        "commit": {
+            "delay": float(os.environ.get(
+                'AUTHARK_JSON_COMMIT_DELAY') or 0),
+            "size": int(os.environ.get('AUTHARK_JSON_COMMIT_SIZE') or 100),
+            "fsync": os.environ.get(
+                'AUTHARK_JSON_COMMIT_FSYNC', '').lower() in ('1', 'true')
+        },
+        "journal": {
+            "threshold": int(os.environ.get(
+                'AUTHARK_JSON_JOURNAL_THRESHOLD') or 1_048_576)
+        }
+    },
     "export": {
         "type": "json",
         "dir": os.environ.get('AUTHARK_EXPORT_DIR') or str(
@@ -1 +1,2 @@
 from .json import *
+from .sqlite import *
@@ -1,6 +1,10 @@
+from modelark import JsonRepository
+from .indexed_json_repository import IndexedJsonRepository
+from .json_committer import JsonCommitter
+from .journal_repository import JournalRepository
 from .json_model_repositories import (
     JsonCredentialRepository, JsonDominionRepository,
-    JsonRankingRepository, JsonRepository,
-    JsonRoleRepository, JsonUserRepository,
-    JsonRestrictionRepository, JsonPolicyRepository)
+    JsonRankingRepository, JsonRoleRepository, JsonUserRepository,
+    JsonRestrictionRepository, JsonPolicyRepository,
+    JournalCredentialRepository, JournalRankingRepository)
 from .json_import_service import JsonImportService
@@ -0,0 +1,333 @@
+import os
+import time
+import logging
+from heapq import merge
+from itertools import chain
+from operator import itemgetter
+from collections import defaultdict
+from typing import (
+    Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union)
+from modelark import JsonRepository
+from .....application.domain.common import QueryDomain, codec
+from .....application.domain.services.repositories import (
+    RepositoryIndex, paginate, key_ordered, current_batch)
+from .json_committer import JsonCommitter
+
+
+logger = logging.getLogger(__name__)
+
+
+Stamp = Tuple[int, int, int]
+
+
+class CollectionSnapshot:
+    def __init__(self, stamp: Stamp, data: Dict[str, Any],
+                 collection: str, fields: Sequence[Any],
+                 unique: Sequence[Any] = ()) -> None:
+        self.stamp = stamp
+        self.data = data
+        # Inode and offset of the journal records applied, if any.
+        self.journal: Tuple[Optional[int], int] = (None, 0)
+        self.records: Dict[str, Dict[str, Any]] = data.setdefault(
+            collection, {})
+        self.index = RepositoryIndex(fields, unique)
+        self.index.extend(self.records.values())
+
+    def fresh(self, path: str) -> bool:
+        """Whether the collection file is still the one snapshotted."""
+        return self.stamp == _stamp(os.stat(path))
+
+    def select(self, domain: QueryDomain) -> Iterable[Dict[str, Any]]:
+        keys = self.index.lookup(domain)
+        if keys is None:
+            return self.records.values()
+        return (self.records[key] for key in keys)
+
+    def scan(self, domain: QueryDomain) -> Iterable[Dict[str, Any]]:
+        return (self.records[key] for key in self.index.scan(domain))
+
+    def put(self, record: Dict[str, Any]) -> None:
+        self.records[record['id']] = record
+        self.index.add(record)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        records = list(records)
+        for record in records:
+            self.records[record['id']] = record
+        self.index.extend(records)
+
+    def pop(self, key: str) -> bool:
+        self.index.remove(key)
+        return self.records.pop(key, None) is not None
+
+
+class PendingWrites:
+    """Records written to a collection file and not committed yet, or
+    None for the removed ones."""
+
+    def __init__(self, repository: 'IndexedJsonRepository',
+                 path: str) -> None:
+        self.repository = repository
+        self.path = path
+        self.records: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.operations = 0
+
+    def validate(self) -> None:
+        self.repository._validate(self)
+
+    def commit(self) -> None:
+        self.repository._commit(self)
+
+    def rollback(self) -> None:
+        self.records.clear()
+
+
+class IndexedJsonRepository(JsonRepository):
+    """Json repository serving its reads from an indexed memory snapshot
+    of the collection file, reloaded whenever the file changes.
+
+    Writes go through a committer which may group them, and the pending
+    ones are overlaid on the snapshot so that reads always see them."""
+
+    def __init__(self, *args, committer: Optional[JsonCommitter] = None,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.committer = committer or JsonCommitter()
+        self.snapshots: Dict[str, CollectionSnapshot] = {}
+
+    async def add(self, item: Union[Any, List[Any]]) -> List[Any]:
+        await self.setup()
+
+        items = item if isinstance(item, list) else [item]
+        records = []
+        for item in items:
+            item.updated_at = int(time.time())
+            item.updated_by = self.editor.reference
+            item.created_at = item.created_at or item.updated_at
+            item.created_by = item.created_by or item.updated_by
+            records.append(_clone(vars(item)))
+
+        if getattr(self, 'unique', None):
+            written: Dict[str, Optional[Dict[str, Any]]] = {}
+            for layer in self._layers():
+                written.update(layer.records)
+            # The records replace their stored versions, so they may swap
+            # their values.
+            written.update((record['id'], record) for record in records)
+            self._snapshot().index.ensure_unique(records, written)
+
+        pending = self._stage()
+        for record in records:
+            pending.records[record['id']] = record
+
+        self._settle(pending)
+
+        return items
+
+    async def remove(self, item: Union[Any, List[Any]]) -> bool:
+        if not self.file_path.exists():
+            return False
+
+        items = item if isinstance(item, list) else [item]
+        layers = self._layers()
+        snapshot = self._snapshot()
+        pending = self._stage()
+        deleted = False
+        for item in items:
+            current = snapshot.records.get(item.id)
+            for layer in layers:
+                current = layer.records.get(item.id, current)
+            pending.records[item.id] = None
+            deleted = current is not None or deleted
+
+        self._settle(pending)
+
+        return deleted
+
+    async def count(self, domain: Optional[QueryDomain] = None) -> int:
+        if not self.file_path.exists():
+            return 0
+
+        domain = domain or []
+        filter_function = self.filterer.parse(domain)
+
+        count = 0
+        for record in self._select(domain):
+            if filter_function(self.constructor(**record)):
+                count += 1
+
+        return count
+
+    async def search(self, domain: QueryDomain,
+                     limit: Optional[int] = None, offset: Optional[int] = None,
+                     order: Optional[str] = None) -> List[Any]:
+        if not self.file_path.exists():
+            return []
+
+        filter_function = self.filterer.parse(domain)
+        if key_ordered(order):
+            records, order = self._select(domain, scan=True), None
+        else:
+            records = self._select(domain)
+        candidates = (self.constructor(**_clone(record))
+                      for record in records)
+
+        return paginate((item for item in candidates
+                         if filter_function(item)), limit, offset, order)
+
+    async def version(self) -> str:
+        path = str(self.file_path)
+        if not self.file_path.exists():
+            return f'{path}:0'
+        batch = current_batch()
+        layers = [self.committer.get(path),
+                  batch and batch.get(('json', path))]
+        operations = ':'.join(
+            str(layer.operations if layer else 0) for layer in layers)
+        return (f"{path}:{'.'.join(map(str, _stamp(os.stat(path))))}"
+                f":{operations}")
+
+    def _select(self, domain: QueryDomain,
+                scan: bool = False) -> Iterable[Dict[str, Any]]:
+        snapshot = self._snapshot()
+        records = snapshot.scan(domain) if scan else snapshot.select(domain)
+        for layer in self._layers():
+            written = layer.records
+            base = (record for record in records
+                    if record['id'] not in written)
+            added = [record for record in written.values()
+                     if record is not None]
+            if scan:
+                key = itemgetter('id')
+                records = merge(base, sorted(added, key=key), key=key)
+            else:
+                records = chain(base, added)
+        return records
+
+    def _layers(self) -> List[PendingWrites]:
+        """Pending writes of the collection, the oldest ones first"""
+        path = str(self.file_path)
+        batch = current_batch()
+        layers = [self.committer.get(path),
+                  batch and batch.get(('json', path))]
+        return [layer for layer in layers if layer and layer.records]
+
+    def _stage(self) -> PendingWrites:
+        path = str(self.file_path)
+        batch = current_batch()
+        if batch is not None:
+            return batch.enlist(
+                ('json', path), lambda: PendingWrites(self, path))
+        if self._grouped():
+            return self.committer.enlist(
+                path, lambda: PendingWrites(self, path))
+        return PendingWrites(self, path)
+
+    def _settle(self, pending: PendingWrites) -> None:
+        pending.operations += 1
+        if current_batch() is not None:
+            return
+        if self._grouped():
+            return self.committer.schedule(pending.path)
+        self._commit(pending)
+
+    def _grouped(self) -> bool:
+        """Whether writes are group committed, never for collections with
+        unique values, whose writes must be checked against the latest
+        collection file before being acknowledged."""
+        return bool(self.committer.delay) and not getattr(
+            self, 'unique', None)
+
+    def _validate(self, pending: PendingWrites) -> None:
+        """Check the pending writes against the latest collection file,
+        with the unique values taken by other processes meanwhile."""
+        if not getattr(self, 'unique', None):
+            return
+        written: Dict[str, Optional[Dict[str, Any]]] = {}
+        for layer in (self.committer.get(pending.path), pending):
+            written.update(layer.records if layer else {})
+        self._read(pending.path).index.ensure_unique(
+            [record for record in written.values() if record], written)
+
+    def _commit(self, pending: PendingWrites) -> None:
+        path = pending.path
+        group = self.committer.take(path)
+        layers = [layer for layer in dict.fromkeys([group, pending])
+                  if layer and layer.records]
+        if not layers:
+            return
+
+        with self.committer.lock(path):
+            try:
+                snapshot = self._read(path)
+                # Other processes may have taken unique values meanwhile.
+                written: Dict[str, Optional[Dict[str, Any]]] = {}
+                for layer in layers:
+                    written.update(layer.records)
+                snapshot.index.ensure_unique(
+                    [record for record in written.values() if record],
+                    written)
+
+                for layer in layers:
+                    for key, record in layer.records.items():
+                        if record is None:
+                            snapshot.pop(key)
+                        else:
+                            snapshot.put(record)
+
+                self._persist(path, snapshot, layers)
+            except Exception:
+                self.snapshots.pop(path, None)
+                self.committer.restore(path, group)
+                raise
+
+        for layer in layers:
+            layer.records.clear()
+
+    def _persist(self, path: str, snapshot: CollectionSnapshot,
+                 layers: List[PendingWrites]) -> None:
+        stat = self.committer.write(
+            path, codec.dumps(snapshot.data, indent=True))
+        snapshot.stamp = _stamp(stat)
+
+    def _snapshot(self) -> CollectionSnapshot:
+        return self._read(str(self.file_path))
+
+    def _read(self, path: str) -> CollectionSnapshot:
+        snapshot = self.snapshots.get(path)
+        if snapshot and snapshot.fresh(path):
+            return snapshot
+
+        snapshot = self._load(path)
+        self.snapshots[path] = snapshot
+
+        return snapshot
+
+    def _load(self, path: str) -> CollectionSnapshot:
+        # Files are replaced atomically, so an open one never changes.
+        with open(path) as file:
+            stamp = _stamp(os.fstat(file.fileno()))
+            data: Dict[str, Any] = defaultdict(lambda: {})
+            data.update(codec.loads(file.read() or '{}'))
+
+        snapshot = CollectionSnapshot(
+            stamp, data, self.collection, getattr(self, 'indexes', []),
+            getattr(self, 'unique', []))
+        for field in snapshot.index.relaxed:
+            logger.warning(
+                f"Unique field {field!r} of '{path}' not enforced, since "
+                "its collection already holds duplicated values.")
+
+        return snapshot
+
+
+def _stamp(stat: os.stat_result) -> Stamp:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _clone(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _clone(element) for key, element in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clone(element) for element in value]
+    return value
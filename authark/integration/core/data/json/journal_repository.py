@@ -0,0 +1,173 @@
+import os
+import asyncio
+import logging
+from typing import List, Optional, Set
+from .....application.domain.common import codec
+from .indexed_json_repository import (
+    IndexedJsonRepository, CollectionSnapshot, PendingWrites)
+
+
+logger = logging.getLogger(__name__)
+
+
+class JournalRepository(IndexedJsonRepository):
+    """Json repository appending its writes as compact records to a
+    journal beside the collection file, so that their cost doesn't grow
+    with the collection.
+
+    Snapshots are rebuilt from the collection file and its journal, and
+    the journal is compacted back into the file in background once it
+    grows past a threshold in bytes."""
+
+    def __init__(self, *args, threshold: int = 1_048_576,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+        self.compacting: Set[str] = set()
+
+    async def version(self) -> str:
+        version = await super().version()
+        journal = _journal(str(self.file_path))
+        if not os.path.exists(journal):
+            return version
+        stat = os.stat(journal)
+        return f'{version}:{stat.st_ino}.{stat.st_size}'
+
+    def compact(self, path: Optional[str] = None) -> None:
+        """Rewrite the collection file with its journal folded in and
+        start a new journal with the records appended meanwhile.
+
+        The rewrite happens outside of the lock, which is only held for
+        the final replacements so that writers aren't held up."""
+        path = path or str(self.file_path)
+        snapshot = self._load(path)
+        temporary, _ = self.committer.stage(
+            path, codec.dumps(snapshot.data, indent=True))
+        try:
+            with self.committer.lock(path):
+                tail = self._tail(path, snapshot)
+                if tail is None:
+                    # Compacted by another process in the meantime.
+                    return
+                # Replaying the old journal over the new file is harmless,
+                # so a crash between both replacements loses nothing.
+                self.committer.replace(temporary, path)
+                self.committer.write(_journal(path), tail.decode())
+        finally:
+            self.committer.discard(temporary)
+
+    def _tail(self, path: str, snapshot: CollectionSnapshot
+              ) -> Optional[bytes]:
+        """Return the whole journal records appended since the snapshot
+        was loaded, or None if its files were replaced meanwhile."""
+        if not snapshot.fresh(path):
+            return None
+
+        inode, offset = snapshot.journal
+        try:
+            file = open(_journal(path), 'rb')
+        except FileNotFoundError:
+            return b'' if inode is None else None
+
+        with file:
+            stat = os.fstat(file.fileno())
+            if inode is not None and (
+                    stat.st_ino != inode or stat.st_size < offset):
+                return None
+            file.seek(offset if inode is not None else 0)
+            chunk = file.read()
+
+        return chunk[:chunk.rfind(b'\n') + 1]
+
+    def _persist(self, path: str, snapshot: CollectionSnapshot,
+                 layers: List[PendingWrites]) -> None:
+        content = ''.join(
+            f'{codec.dumps([key, record])}\n'
+            for layer in layers for key, record in layer.records.items()
+        ).encode()
+
+        inode, offset = snapshot.journal
+        with open(_journal(path), 'ab') as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_ino == inode and stat.st_size > offset:
+                # Drop the partial record left by an interrupted append.
+                file.truncate(offset)
+            elif stat.st_ino != inode:
+                offset = 0
+            file.write(content)
+            file.flush()
+            if self.committer.fsync:
+                os.fsync(file.fileno())
+
+        offset += len(content)
+        snapshot.journal = (stat.st_ino, offset)
+        if offset > self.threshold:
+            self._schedule(path)
+
+    def _read(self, path: str) -> CollectionSnapshot:
+        snapshot = super()._read(path)
+        if self._replay(path, snapshot):
+            return snapshot
+
+        # The journal was compacted meanwhile, so start over.
+        self.snapshots.pop(path, None)
+        return super()._read(path)
+
+    def _load(self, path: str) -> CollectionSnapshot:
+        snapshot = super()._load(path)
+        self._replay(path, snapshot)
+        return snapshot
+
+    def _replay(self, path: str, snapshot: CollectionSnapshot) -> bool:
+        """Apply the journal records appended since the last replay, and
+        return False if the journal was replaced in the meantime."""
+        inode, offset = snapshot.journal
+        try:
+            file = open(_journal(path), 'rb')
+        except FileNotFoundError:
+            return inode is None
+
+        with file:
+            stat = os.fstat(file.fileno())
+            if inode is not None and (
+                    stat.st_ino != inode or stat.st_size < offset):
+                return False
+            if stat.st_size > offset:
+                file.seek(offset)
+                chunk = file.read()
+                # Only whole records, an append may still be underway.
+                chunk = chunk[:chunk.rfind(b'\n') + 1]
+                changes = dict(codec.loads(line)
+                               for line in chunk.splitlines())
+                for key, record in changes.items():
+                    if record is None:
+                        snapshot.pop(key)
+                snapshot.extend(record for record in changes.values()
+                                if record is not None)
+                offset += len(chunk)
+
+        snapshot.journal = (stat.st_ino, offset)
+        return True
+
+    def _schedule(self, path: str) -> None:
+        if path in self.compacting:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.compact(path)
+
+        self.compacting.add(path)
+        future = loop.run_in_executor(None, self.compact, path)
+        future.add_done_callback(lambda future: self._compacted(
+            path, future))
+
+    def _compacted(self, path: str, future: asyncio.Future) -> None:
+        self.compacting.discard(path)
+        if not future.cancelled() and future.exception():
+            logger.error(f'Journal compaction of <{path}> failed',
+                         exc_info=future.exception())
+
+
+def _journal(path: str) -> str:
+    return f'{path}.journal'
@@ -0,0 +1,147 @@
+import os
+import fcntl
+import atexit
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCommitter:
+    """Group commit of json collection files. Writes are buffered for a
+    delay or until a number of operations is reached, and each file is
+    replaced atomically, optionally syncing it to disk.
+
+    A zero delay commits every write as soon as it is made. Groups
+    failing to commit are kept and retried."""
+
+    def __init__(self, delay: float = 0, size: int = 100,
+                 fsync: bool = False) -> None:
+        self.delay = delay
+        self.size = size
+        self.fsync = fsync
+        self.groups: Dict[str, Any] = {}
+        self.timers: Dict[str, asyncio.TimerHandle] = {}
+        if delay:
+            atexit.register(self.flush)
+
+    def enlist(self, path: str, factory: Callable[[], Any]) -> Any:
+        group = self.groups.get(path)
+        if group is None:
+            group = self.groups[path] = factory()
+        return group
+
+    def get(self, path: str) -> Any:
+        return self.groups.get(path)
+
+    def schedule(self, path: str) -> None:
+        group = self.groups[path]
+        if group.operations >= self.size:
+            self._attempt(path)
+        elif path not in self.timers:
+            self.timers[path] = asyncio.get_running_loop().call_later(
+                self.delay, self._expire, path)
+
+    def take(self, path: str) -> Any:
+        timer = self.timers.pop(path, None)
+        if timer:
+            timer.cancel()
+        return self.groups.pop(path, None)
+
+    def restore(self, path: str, group: Any) -> None:
+        """Give back a group taken for a commit that failed, so that its
+        writes are neither lost nor hidden from the reads, and retry it
+        after a delay."""
+        if group is None:
+            return
+        self.groups.setdefault(path, group)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if path not in self.timers:
+            self.timers[path] = loop.call_later(
+                self.delay, self._expire, path)
+
+    def flush(self, path: Optional[str] = None) -> None:
+        """Commit the groups of the given path or of all of them, keeping
+        the failed ones and raising the first error."""
+        error: Optional[Exception] = None
+        for key in [path] if path else list(self.groups):
+            group = self.take(key)
+            if not group:
+                continue
+            try:
+                group.commit()
+            except Exception as exception:
+                self.restore(key, group)
+                error = error or exception
+        if error:
+            raise error
+
+    @contextmanager
+    def lock(self, path: str) -> Iterator[None]:
+        with open(f'{path}.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def write(self, path: str, content: str) -> os.stat_result:
+        temporary, stat = self.stage(path, content)
+        self.replace(temporary, path)
+        return stat
+
+    def stage(self, path: str, content: str
+              ) -> Tuple[str, os.stat_result]:
+        """Write the content to a temporary file beside the path, to be
+        put in its place later on."""
+        temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(temporary, 'w') as file:
+                file.write(content)
+                file.flush()
+                if self.fsync:
+                    os.fsync(file.fileno())
+                stat = os.fstat(file.fileno())
+        except BaseException:
+            self.discard(temporary)
+            raise
+
+        return temporary, stat
+
+    def replace(self, temporary: str, path: str) -> None:
+        try:
+            os.replace(temporary, path)
+        except BaseException:
+            self.discard(temporary)
+            raise
+
+        if self.fsync:
+            directory = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    @staticmethod
+    def discard(temporary: str) -> None:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+    def _expire(self, path: str) -> None:
+        self.timers.pop(path, None)
+        self._attempt(path)
+
+    def _attempt(self, path: str) -> None:
+        """Commit the group of a path, whose writes were acknowledged
+        already, so its failures are logged instead of raised."""
+        try:
+            self.flush(path)
+        except Exception:
+            logger.exception(f"Failed to commit '{path}', retrying.")
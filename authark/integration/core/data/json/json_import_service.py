@@ -1,5 +1,5 @@
-import json
 from typing import List, Any
+from .....application.domain.common import codec
 from .....application.domain.services import ImportService, HashService
 from .....application.domain.models import User, Credential, Role, Dominion
 
@@ -9,11 +9,12 @@ class JsonImportService(ImportService):
     def __init__(self, hash_service: HashService) -> None:
         self.hash_service = hash_service
 
-    def import_users(self, filepath: str, source: str,
-                     password_field: str) -> List[Any]:
+    async def import_users(self, filepath: str, source: str,
+                           password_field: str) -> List[Any]:
         users_list = []
-        with open(filepath) as f:
-            users_dict = json.load(f)
+        credentials = []
+        with open(filepath, 'rb') as f:
+            users_dict = codec.loads(f.read())
             for user_key, user_dict in users_dict.get('users').items():
                 user_dict_data = {
                     'external_source': source,
@@ -28,15 +29,22 @@ class JsonImportService(ImportService):
                 credential = None
                 roles = None
                 if user_dict.get(password_field, False):
-                    hashed_password = self.hash_service.generate_hash(
-                        user_dict.pop(password_field))
-                    credential = Credential(value=hashed_password)
+                    credential = Credential(
+                        value=user_dict.pop(password_field))
+                    credentials.append(credential)
 
                 if user_dict.get('authorization', False):
                     roles = self._users_roles(user_dict.pop('authorization'))
                 user = User(**user_dict_data)
                 users_list.append([user, credential, roles])
         f.close()
+
+        hashed_passwords = await self.hash_service.agenerate_hashes(
+            [credential.value for credential in credentials])
+        for credential, hashed_password in zip(
+                credentials, hashed_passwords):
+            credential.value = hashed_password
+
         return users_list
 
     def _users_roles(self, authorization: dict) -> List[Any]:
@@ -1,4 +1,4 @@
-from modelark import JsonRepository
+from typing import Optional
 from .....application.domain.common import (
     QueryParser, AuthProvider)
 from .....application.domain.models import (
@@ -6,73 +6,119 @@ from .....application.domain.models import (
 from .....application.domain.services.repositories import (
     CredentialRepository, DominionRepository, RankingRepository,
     RoleRepository, UserRepository, RestrictionRepository, PolicyRepository)
+from .indexed_json_repository import IndexedJsonRepository
+from .json_committer import JsonCommitter
+from .journal_repository import JournalRepository
 
 
-class JsonCredentialRepository(JsonRepository, CredentialRepository):
+class JsonCredentialRepository(
+        IndexedJsonRepository, CredentialRepository):
     """Json Credential Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'credentials') -> None:
+                 collection: str = 'credentials',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Credential,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonDominionRepository(JsonRepository, DominionRepository):
+class JsonDominionRepository(IndexedJsonRepository, DominionRepository):
     """Json Dominion Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'dominions') -> None:
+                 collection: str = 'dominions',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Dominion,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonRankingRepository(JsonRepository, RankingRepository):
+class JsonRankingRepository(IndexedJsonRepository, RankingRepository):
     """Json Ranking Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'rankings') -> None:
+                 collection: str = 'rankings',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Ranking,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonRoleRepository(JsonRepository, RoleRepository):
+class JsonRoleRepository(IndexedJsonRepository, RoleRepository):
     """Json Role Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'roles') -> None:
+                 collection: str = 'roles',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Role,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonRestrictionRepository(JsonRepository, RestrictionRepository):
+class JsonRestrictionRepository(
+        IndexedJsonRepository, RestrictionRepository):
     """Json Restriction Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'restrictions') -> None:
+                 collection: str = 'restrictions',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Restriction,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonPolicyRepository(JsonRepository, PolicyRepository):
+class JsonPolicyRepository(IndexedJsonRepository, PolicyRepository):
     """Json Policy Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'policies') -> None:
+                 collection: str = 'policies',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, Policy,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
 
 
-class JsonUserRepository(JsonRepository, UserRepository):
+class JsonUserRepository(IndexedJsonRepository, UserRepository):
     """Json User Repository"""
 
     def __init__(self, data_path: str, parser: QueryParser,
                  auth_provider: AuthProvider,
-                 collection: str = 'users') -> None:
+                 collection: str = 'users',
+                 committer: Optional[JsonCommitter] = None) -> None:
         super().__init__(data_path, collection, User,
-                         parser, auth_provider, auth_provider)
+                         parser, auth_provider, auth_provider,
+                         committer=committer)
+
+
+class JournalCredentialRepository(
+        JournalRepository, CredentialRepository):
+    """Journal Credential Repository"""
+
+    def __init__(self, data_path: str, parser: QueryParser,
+                 auth_provider: AuthProvider,
+                 collection: str = 'credentials',
+                 committer: Optional[JsonCommitter] = None,
+                 threshold: int = 1_048_576) -> None:
+        super().__init__(data_path, collection, Credential,
+                         parser, auth_provider, auth_provider,
+                         committer=committer, threshold=threshold)
+
+
+class JournalRankingRepository(JournalRepository, RankingRepository):
+    """Journal Ranking Repository"""
+
+    def __init__(self, data_path: str, parser: QueryParser,
+                 auth_provider: AuthProvider,
+                 collection: str = 'rankings',
+                 committer: Optional[JsonCommitter] = None,
+                 threshold: int = 1_048_576) -> None:
+        super().__init__(data_path, collection, Ranking,
+                         parser, auth_provider, auth_provider,
+                         committer=committer, threshold=threshold)
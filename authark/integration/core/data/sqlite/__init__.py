@@ -0,0 +1,7 @@
+from .sqlite_connector import SqliteConnector
+from .sqlite_parser import SqliteParser
+from .sqlite_repository import SqliteRepository
+from .sqlite_model_repositories import (
+    SqliteCredentialRepository, SqliteDominionRepository,
+    SqliteRankingRepository, SqliteRoleRepository, SqliteUserRepository,
+    SqliteRestrictionRepository, SqlitePolicyRepository)
@@ -0,0 +1,53 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict, Set
+
+
+class SqliteConnector:
+    def __init__(self, timeout: float = 5.0) -> None:
+        self.timeout = timeout
+        self.connections: Dict[str, sqlite3.Connection] = {}
+
+    def get(self, path: str) -> sqlite3.Connection:
+        connection = self.connections.get(path)
+        if connection:
+            return connection
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            path, timeout=self.timeout, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        self.connections[path] = connection
+
+        return connection
+
+    def begin(self, path: str) -> 'SqliteTransaction':
+        self.get(path)
+        return SqliteTransaction(sqlite3.connect(
+            path, timeout=self.timeout, check_same_thread=False))
+
+    def close(self) -> None:
+        for connection in self.connections.values():
+            connection.close()
+        self.connections.clear()
+
+
+class SqliteTransaction:
+    """Dedicated connection holding the writes of a repository batch
+    until they are committed or rolled back at its end."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.tables: Set[str] = set()
+
+    def validate(self) -> None:
+        """Unique indexes are already checked by each write."""
+
+    def commit(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+        self.connection.close()
@@ -0,0 +1,78 @@
+from .....application.domain.common import AuthProvider
+from .....application.domain.models import (
+    Credential, Dominion, Ranking, Role, User, Restriction, Policy)
+from .....application.domain.services.repositories import (
+    CredentialRepository, DominionRepository, RankingRepository,
+    RoleRepository, UserRepository, RestrictionRepository, PolicyRepository)
+from .sqlite_connector import SqliteConnector
+from .sqlite_repository import SqliteRepository
+
+
+class SqliteCredentialRepository(SqliteRepository, CredentialRepository):
+    """Sqlite Credential Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'credentials') -> None:
+        super().__init__(data_path, table, Credential, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqliteDominionRepository(SqliteRepository, DominionRepository):
+    """Sqlite Dominion Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'dominions') -> None:
+        super().__init__(data_path, table, Dominion, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqliteRankingRepository(SqliteRepository, RankingRepository):
+    """Sqlite Ranking Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'rankings') -> None:
+        super().__init__(data_path, table, Ranking, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqliteRoleRepository(SqliteRepository, RoleRepository):
+    """Sqlite Role Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'roles') -> None:
+        super().__init__(data_path, table, Role, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqliteRestrictionRepository(SqliteRepository, RestrictionRepository):
+    """Sqlite Restriction Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'restrictions') -> None:
+        super().__init__(data_path, table, Restriction, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqlitePolicyRepository(SqliteRepository, PolicyRepository):
+    """Sqlite Policy Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'policies') -> None:
+        super().__init__(data_path, table, Policy, connector,
+                         locator=auth_provider, editor=auth_provider)
+
+
+class SqliteUserRepository(SqliteRepository, UserRepository):
+    """Sqlite User Repository"""
+
+    def __init__(self, data_path: str, connector: SqliteConnector,
+                 auth_provider: AuthProvider,
+                 table: str = 'users') -> None:
+        super().__init__(data_path, table, User, connector,
+                         locator=auth_provider, editor=auth_provider)
@@ -0,0 +1,127 @@
+import re
+import json
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from .....application.domain.common import (
+    QueryDomain, RepositoryError)
+
+
+Condition = Tuple[str, List[Any]]
+
+
+class SqliteParser:
+    """Translates query domains into parameterized SQLite conditions"""
+
+    def __init__(self, column: str = 'data') -> None:
+        self.column = column
+        self.identifier = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+        self.comparison_dict: Dict[str, Callable[[str, Any], Condition]] = {
+            '=': self._equal,
+            '!=': lambda field, value: (
+                f'{field} IS NOT ?', [self._value(value)]),
+            '<=': lambda field, value: (f'{field} <= ?', [value]),
+            '<': lambda field, value: (f'{field} < ?', [value]),
+            '>': lambda field, value: (f'{field} > ?', [value]),
+            '>=': lambda field, value: (f'{field} >= ?', [value]),
+            'in': self._in,
+            'like': lambda field, value: (
+                f'{field} GLOB ?', [self._glob(value)]),
+            'ilike': lambda field, value: (
+                f'lower({field}) GLOB ?', [self._glob(value).lower()]),
+            'contains': self._contains
+        }
+
+        self.binary_dict = {
+            '&': 'AND',
+            '|': 'OR'
+        }
+
+        self.unary_dict = {
+            '!': 'NOT'
+        }
+
+        self.default_join_operator = '&'
+
+    def parse(self, domain: QueryDomain) -> Condition:
+        if not domain:
+            return '1 = 1', []
+
+        stack: List[Condition] = []
+        for item in list(reversed(domain)):
+            if isinstance(item, str) and item in self.binary_dict:
+                first_operand = stack.pop()
+                second_operand = stack.pop()
+                stack.append(self._join(
+                    self.binary_dict[item], first_operand, second_operand))
+            elif isinstance(item, str) and item in self.unary_dict:
+                condition, parameters = stack.pop()
+                stack.append(
+                    (f'{self.unary_dict[item]} ({condition})', parameters))
+
+            stack = self._default_join(stack)
+
+            if isinstance(item, (list, tuple)):
+                stack.append(self._parse_term(item))
+
+        return self._default_join(stack)[0]
+
+    def field(self, name: str) -> str:
+        if not self.identifier.match(name):
+            raise RepositoryError(f"Invalid query field '{name}'.")
+        if name == 'id':
+            return 'id'
+        return f"json_extract({self.column}, '$.{name}')"
+
+    def _default_join(self, stack: List[Condition]) -> List[Condition]:
+        if len(stack) == 2:
+            first_operand = stack.pop()
+            second_operand = stack.pop()
+            stack.append(self._join(
+                self.binary_dict[self.default_join_operator],
+                first_operand, second_operand))
+        return stack
+
+    def _join(self, operator: str, first: Condition,
+              second: Condition) -> Condition:
+        return (f'({first[0]} {operator} {second[0]})',
+                first[1] + second[1])
+
+    def _parse_term(self, term_tuple: Sequence[Any]) -> Condition:
+        field, operator, value = term_tuple
+        if operator not in self.comparison_dict:
+            raise RepositoryError(f"Invalid query operator '{operator}'.")
+        return self.comparison_dict[operator](self.field(field), value)
+
+    def _equal(self, field: str, value: Any) -> Condition:
+        if value is None:
+            return f'{field} IS NULL', []
+        return f'{field} = ?', [self._value(value)]
+
+    def _in(self, field: str, value: Any) -> Condition:
+        if isinstance(value, str):
+            return f'instr(?, {field}) > 0', [value]
+        values = [self._value(element) for element in value]
+        if not values:
+            return '0', []
+        placeholders = ', '.join('?' for _ in values)
+        return f'{field} IN ({placeholders})', values
+
+    def _contains(self, field: str, value: Any) -> Condition:
+        if field == 'id':
+            return 'instr(id, ?) > 0', [value]
+        path = field[field.index("'"):field.rindex("'") + 1]
+        return ((f"CASE json_type({self.column}, {path}) "
+                 f"WHEN 'array' THEN EXISTS (SELECT 1 FROM json_each("
+                 f"{self.column}, {path}) WHERE json_each.value = ?) "
+                 f"ELSE instr({field}, ?) > 0 END"),
+                [self._value(value), value])
+
+    @staticmethod
+    def _glob(pattern: str) -> str:
+        return str(pattern).replace('%', '*').replace('_', '?')
+
+    @staticmethod
+    def _value(value: Any) -> Any:
+        if isinstance(value, (list, tuple, dict)):
+            return json.dumps(value, separators=(',', ':'))
+        return value
@@ -0,0 +1,239 @@
+import time
+import logging
+import sqlite3
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Union)
+from modelark import Repository
+from modelark.common import Locator, DefaultLocator, Editor, DefaultEditor
+from .....application.domain.common import (
+    QueryDomain, QueryError, DuplicateError, codec)
+from .....application.domain.services.repositories import current_batch
+from .sqlite_connector import SqliteConnector
+from .sqlite_parser import SqliteParser
+
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteRepository(Repository):
+    def __init__(self,
+                 data_path: str,
+                 table: str,
+                 constructor: Callable[..., Any],
+                 connector: SqliteConnector,
+                 parser: Optional[SqliteParser] = None,
+                 locator: Locator = None,
+                 editor: Editor = None,
+                 database: str = 'authark.db') -> None:
+        self.data_path = data_path
+        self.table = table
+        self.constructor = constructor
+        self.connector = connector
+        self.parser = parser or SqliteParser()
+        self.locator = locator or DefaultLocator()
+        self.editor = editor or DefaultEditor()
+        self.database = database
+        self.chunk_size = 500
+        self.prepared: Set[str] = set()
+        self.constraints: Dict[str, Any] = {}
+
+    async def add(self, item: Union[Any, List[Any]]) -> List[Any]:
+        items = item if isinstance(item, list) else [item]
+
+        records = []
+        for item in items:
+            item.updated_at = int(time.time())
+            item.updated_by = self.editor.reference
+            item.created_at = item.created_at or item.updated_at
+            item.created_by = item.created_by or item.updated_by
+            records.append((item.id, codec.dumps(vars(item))))
+
+        with self._transaction() as connection:
+            if len(records) > 1 and getattr(self, 'unique', None):
+                # Unique indexes are checked row by row, so blank the
+                # stored items first to let them swap their values.
+                self._execute_chunked(
+                    connection, f"UPDATE {self.table} SET data = '{{}}'",
+                    [item.id for item in items])
+            try:
+                connection.executemany(
+                    f'INSERT INTO {self.table} (id, data) VALUES (?, ?) '
+                    f'ON CONFLICT (id) DO UPDATE SET data = excluded.data',
+                    records)
+            except sqlite3.IntegrityError as error:
+                raise self._duplicate(error) from error
+            self._bump(connection)
+
+        return items
+
+    async def remove(self, item: Union[Any, List[Any]]) -> bool:
+        items = item if isinstance(item, list) else [item]
+        ids = [item.id for item in items]
+        if not ids or not self.file_path.exists():
+            return False
+
+        with self._transaction() as connection:
+            deleted = self._execute_chunked(
+                connection, f'DELETE FROM {self.table}', ids)
+            self._bump(connection)
+
+        return bool(deleted)
+
+    async def count(self, domain: Optional[QueryDomain] = None) -> int:
+        if not self.file_path.exists():
+            return 0
+
+        condition, parameters = self.parser.parse(domain or [])
+        [result] = self._connect().execute(
+            f'SELECT count(*) FROM {self.table} WHERE {condition}',
+            parameters).fetchone()
+
+        return result
+
+    async def search(self, domain: QueryDomain,
+                     limit: Optional[int] = None, offset: Optional[int] = None,
+                     order: Optional[str] = None) -> List[Any]:
+        if not self.file_path.exists():
+            return []
+
+        condition, parameters = self.parser.parse(domain)
+        query = (f'SELECT data FROM {self.table} WHERE {condition} '
+                 f'ORDER BY {self._order_by(order)}')
+        if limit is not None or offset:
+            query += ' LIMIT ? OFFSET ?'
+            parameters = [*parameters, -1 if limit is None else limit,
+                          offset or 0]
+
+        rows = self._connect().execute(query, parameters)
+
+        return [self.constructor(**codec.loads(data)) for data, in rows]
+
+    async def version(self) -> str:
+        path = str(self.file_path)
+        if not self.file_path.exists():
+            return f'{path}:0'
+
+        row = self._connect().execute(
+            'SELECT version FROM versions WHERE name = ?',
+            (self.table,)).fetchone()
+
+        return f'{path}:{row[0] if row else 0}'
+
+    @property
+    def file_path(self) -> Path:
+        return (Path(self.data_path) / self.locator.zone /
+                self.locator.location / self.database)
+
+    def _connect(self) -> sqlite3.Connection:
+        path = str(self.file_path)
+        batch = current_batch()
+        if batch is None:
+            connection, prepared = self.connector.get(path), self.prepared
+            key = path
+        else:
+            transaction = batch.enlist(
+                ('sqlite', path), lambda: self.connector.begin(path))
+            connection, prepared = transaction.connection, transaction.tables
+            key = self.table
+
+        if key in prepared:
+            return connection
+
+        # Batch connections keep their schema changes in the transaction,
+        # so that they are rolled back along with the batch writes.
+        with nullcontext() if batch else connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} '
+                f'(id TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS versions '
+                '(name TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+            for field in getattr(self, 'indexes', []):
+                fields = [field] if isinstance(field, str) else field
+                columns = ', '.join(map(self.parser.field, fields))
+                connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS '
+                    f"{self.table}_{'_'.join(fields)} "
+                    f'ON {self.table} ({columns})')
+            for field in getattr(self, 'unique', []):
+                self._create_unique(connection, field)
+        prepared.add(key)
+
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection of the current repository batch, or the
+        shared connection committing when the block ends."""
+        connection = self._connect()
+        if current_batch() is not None:
+            yield connection
+            return
+
+        with connection:
+            yield connection
+
+    def _create_unique(self, connection: sqlite3.Connection,
+                       field: Union[str, Sequence[str]]) -> None:
+        """Create a partial unique index of the given fields, leaving out
+        the rows with any empty value."""
+        fields = [field] if isinstance(field, str) else list(field)
+        columns = [self.parser.field(name) for name in fields]
+        condition = ' AND '.join(
+            f"{column} IS NOT NULL AND {column} <> ''"
+            for column in columns)
+        name = f"{self.table}_unique_{'_'.join(fields)}"
+        try:
+            connection.execute(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS {name} '
+                f"ON {self.table} ({', '.join(columns)}) "
+                f'WHERE {condition}')
+        except sqlite3.IntegrityError:
+            logger.warning(
+                f"Unique index '{name}' not created, since its table "
+                "already holds duplicated values.")
+            return
+        self.constraints[name] = field
+
+    def _duplicate(self, error: sqlite3.IntegrityError) -> Exception:
+        """Translate the unique index violations into DuplicateErrors"""
+        for name, field in self.constraints.items():
+            if f"'{name}'" in str(error):
+                return DuplicateError(
+                    f"A value of {field!r} is already taken.")
+        return error
+
+    def _execute_chunked(self, connection: sqlite3.Connection,
+                         statement: str, ids: List[str]) -> int:
+        """Execute a statement over the rows of the given ids, returning
+        the number of affected rows."""
+        count = 0
+        for index in range(0, len(ids), self.chunk_size):
+            chunk = ids[index:index + self.chunk_size]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor = connection.execute(
+                f'{statement} WHERE id IN ({placeholders})', chunk)
+            count += cursor.rowcount
+        return count
+
+    def _bump(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            'INSERT INTO versions (name, version) VALUES (?, 1) '
+            'ON CONFLICT (name) DO UPDATE SET version = version + 1',
+            (self.table,))
+
+    def _order_by(self, order: Optional[str] = None) -> str:
+        if not order:
+            return 'rowid'
+
+        tokens = []
+        for field in order.split(','):
+            key, *direction = field.split()
+            direction = [token.upper() for token in direction]
+            if not set(direction) <= {'ASC', 'DESC'}:
+                raise QueryError(f"Invalid order direction '{field}'.")
+            tokens.append(' '.join([self.parser.field(key), *direction]))
+
+        return ', '.join([*tokens, 'rowid'])
@@ -1,2 +1,3 @@
 from .passlib_hash_service import *
+from .pooled_hash_service import *
 from .pyjwt_token_service import *
@@ -0,0 +1,100 @@
+import os
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+from passlib.hash import pbkdf2_sha256
+from .....application.domain.common import ServiceError
+from .passlib_hash_service import PasslibHashService
+
+
+class PooledHashService(PasslibHashService):
+    """Passlib hash service running its asynchronous methods in a
+    bounded process pool, keeping the event loop free while hashing."""
+
+    def __init__(self, workers: Optional[int] = None,
+                 depth: int = 256) -> None:
+        self.workers = workers or None
+        self.depth = depth
+        self.pending = 0
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    async def agenerate_hash(self, value: str) -> str:
+        return await self._submit(_generate_hash, value)
+
+    async def averify_password(self, password: str, hash: str) -> bool:
+        return await self._submit(_verify_password, password, hash)
+
+    def generate_hashes(self, values: List[str]) -> List[str]:
+        size = self._chunk_size(values)
+        with self._queue(-(-len(values) // size)):
+            return list(self._executor().map(
+                _generate_hash, values, chunksize=size))
+
+    async def agenerate_hashes(self, values: List[str]) -> List[str]:
+        size = self._chunk_size(values)
+        chunks = [values[index:index + size]
+                  for index in range(0, len(values), size)]
+        self._ensure_room(len(chunks))
+
+        results = await asyncio.gather(*(
+            self._submit(_generate_hashes, chunk) for chunk in chunks))
+
+        return [result for chunk in results for result in chunk]
+
+    def shutdown(self) -> None:
+        if self.executor:
+            self.executor.shutdown()
+        self.executor = None
+
+    async def _submit(self, function: Callable, *args: Any) -> Any:
+        with self._queue(1):
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor(), function, *args)
+            except BrokenProcessPool:
+                self.executor = None
+                raise
+
+    @contextmanager
+    def _queue(self, count: int) -> Iterator[None]:
+        """Account for the given number of pending tasks while they run,
+        rejecting them if they would exceed the queue depth."""
+        self._ensure_room(count)
+        self.pending += count
+        try:
+            yield
+        finally:
+            self.pending -= count
+
+    def _ensure_room(self, count: int) -> None:
+        if self.pending + count > self.depth:
+            raise ServiceError(
+                f"The hashing queue is full ({self.depth} pending).")
+
+    def _chunk_size(self, values: List[str]) -> int:
+        # A few chunks per worker balance the load without paying one
+        # inter-process round trip per value.
+        workers = self.workers or os.cpu_count() or 1
+        return max(1, -(-len(values) // (workers * 4)))
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if not self.executor:
+            self.executor = ProcessPoolExecutor(
+                self.workers, multiprocessing.get_context('spawn'))
+        return self.executor
+
+
+def _generate_hash(value: str) -> str:
+    return pbkdf2_sha256.hash(value)
+
+
+def _generate_hashes(values: List[str]) -> List[str]:
+    return [pbkdf2_sha256.hash(value) for value in values]
+
+
+def _verify_password(password: str, hash: str) -> bool:
+    return pbkdf2_sha256.verify(password, hash)
@@ -1,13 +1,75 @@
+import os
+import time
 import schedulark
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
+from schedulark.queue.json.json_queue import locked_open
+from .....application.domain.common import codec
 from .....application.general.suppliers import (
     PlanSupplier, Job, Event)
 
 
+# Job and Event have been reachable through this package all along.
+__all__ = ['JsonQueue', 'JsonPlanSupplier', 'PlanSupplier', 'Job', 'Event']
+
+
+class JsonQueue(schedulark.JsonQueue):
+    """Schedulark json queue reading and writing through the json codec"""
+
+    async def put(self, task: schedulark.Task) -> None:
+        if not os.path.exists(self.path):
+            await self.setup()
+
+        content: Dict = {}
+        with locked_open(self.path, 'r+') as f:
+            content.update(codec.loads(f.read()))
+            content[task.id] = vars(task)
+            self._write(f, content)
+
+    async def pick(self) -> Optional[schedulark.Task]:
+        if not os.path.exists(self.path):
+            return None
+
+        with locked_open(self.path, 'r+') as f:
+            content: Dict = codec.loads(f.read())
+
+            now = self.time()
+            tasks = [task for task in content.values()
+                     if task['scheduled_at'] <= now and (
+                         not task['picked_at'] or (
+                             task['picked_at']
+                             + task['timeout'] <= now))]
+
+            if not tasks:
+                return None
+
+            task = min(tasks, key=lambda task: task['scheduled_at'])
+            task['picked_at'] = int(time.time())
+            content[task['id']] = task
+            self._write(f, content)
+
+            return schedulark.Task(**task)
+
+    async def remove(self, task: schedulark.Task) -> None:
+        if not os.path.exists(self.path):
+            return
+
+        with locked_open(self.path, 'r+') as f:
+            content: Dict = codec.loads(f.read())
+
+            if task.id in content:
+                del content[task.id]
+
+            self._write(f, content)
+
+    @staticmethod
+    def _write(file, content: Dict) -> None:
+        file.seek(file.truncate(0))
+        file.write(codec.dumps(content, indent=True))
+
+
 class JsonPlanSupplier(PlanSupplier):
     def __init__(self, path: str) -> None:
-        self.planner = schedulark.Planner(
-            schedulark.JsonQueue(path))
+        self.planner = schedulark.Planner(JsonQueue(path))
 
     async def setup(self) -> None:
         await self.planner.setup()
@@ -1,14 +1,20 @@
+import os
+import fcntl
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from tenark.resolver import resolve_managers
 from .....application.general.suppliers import MemoryTenantSupplier
 
 
 class JsonTenantSupplier(MemoryTenantSupplier):
+    """Json tenant supplier kept consistent across processes by locking
+    its catalog writes and reloading it whenever the file changes."""
 
     def __init__(self, catalog_path: str, zones: Dict[str, str],
                  directory_template='__template__') -> None:
         directory_template = str(Path(zones['default']) / '__template__')
+        self.catalog_path = catalog_path
         self.arranger, self.provider = resolve_managers({
             'cataloguer_kind': 'json',
             'catalog_path': catalog_path,
@@ -16,3 +22,45 @@ class JsonTenantSupplier(MemoryTenantSupplier):
             'provision_template': directory_template,
             'provision_directory_zones': zones
         })
+        self.stamp = self._stamp()
+
+    def get_tenant(self, tenant_id: str) -> Dict[str, Any]:
+        self._refresh()
+        return super().get_tenant(tenant_id)
+
+    def create_tenant(self, tenant_dict: Dict[str, Any]) -> None:
+        with self._lock(fcntl.LOCK_EX):
+            self.provider.cataloguer.load()
+            super().create_tenant(tenant_dict)
+            self.stamp = self._stamp()
+
+    def resolve_tenant(self, name: str) -> Dict[str, Any]:
+        self._refresh()
+        return super().resolve_tenant(name)
+
+    def search_tenants(self, domain: List[Any]) -> List[Dict[str, Any]]:
+        self._refresh()
+        return super().search_tenants(domain)
+
+    def _refresh(self) -> None:
+        if self._stamp() == self.stamp:
+            return
+        with self._lock(fcntl.LOCK_SH):
+            self.provider.cataloguer.load()
+            self.stamp = self._stamp()
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.catalog_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    @contextmanager
+    def _lock(self, operation: int) -> Iterator[None]:
+        with open(f'{self.catalog_path}.lock', 'a') as lock:
+            fcntl.flock(lock, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
@@ -5,8 +5,9 @@ from .crypto_factory import CryptoFactory
 from .json_factory import JsonFactory
 from .web_factory import WebFactory
 from .oauth_factory import OauthFactory
+from .sqlite_factory import SqliteFactory
 
 
 factory_builder = FactoryBuilder([
     BaseFactory, CheckFactory, CryptoFactory,
-    JsonFactory, WebFactory, OauthFactory])
+    JsonFactory, WebFactory, OauthFactory, SqliteFactory])
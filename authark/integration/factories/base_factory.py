@@ -1,6 +1,6 @@
 from injectark import Factory
 from ...application.domain.common import (
-    QueryParser, AuthProvider, StandardAuthProvider)
+    QueryParser, CompiledQueryParser, AuthProvider, StandardAuthProvider)
 from ...application.domain.services.repositories import (
     UserRepository, MemoryUserRepository,
     CredentialRepository, MemoryCredentialRepository,
@@ -15,7 +15,7 @@ from ...application.domain.services import (
     RefreshTokenService, MemoryRefreshTokenService,
     VerificationTokenService, MemoryVerificationTokenService,
     ImportService, MemoryImportService, EnrollmentService,
-    AccessService, VerificationService, IdentityService,
+    AccessService, DecisionService, VerificationService, IdentityService,
     MemoryIdentityService)
 from ...application.general.suppliers import (
     TenantSupplier, MemoryTenantSupplier,
@@ -25,7 +25,8 @@ from ...application.operation.managers import (
     SessionManager, SecurityManager, ProcedureManager,
     TenantManager, SetupManager)
 from ...application.operation.informers import (
-    StandardInformer, ComposingInformer, TenantInformer)
+    StandardInformer, ComposingInformer, TenantInformer,
+    SecurityInformer)
 from ...application.general import (
     PlanSupplier, MemoryPlanSupplier)
 from ..core.common import Config
@@ -38,6 +39,7 @@ class BaseFactory(Factory):
         self.config = config
         self.public = [
             'StandardInformer', 'ComposingInformer', 'TenantInformer',
+            'SecurityInformer',
             'AuthManager', 'ImportManager', 'ManagementManager',
             'TenantManager', 'ProcedureManager', 'SecurityManager',
             'SetupManager', 'SessionManager'
@@ -47,7 +49,7 @@ class BaseFactory(Factory):
     # Repositories
 
     def query_parser(self) -> QueryParser:
-        return QueryParser()
+        return CompiledQueryParser()
 
     def auth_provider(self) -> AuthProvider:
         return StandardAuthProvider()
@@ -125,11 +127,14 @@ class BaseFactory(Factory):
         self, ranking_repository: RankingRepository,
         role_repository: RoleRepository,
         dominion_repository: DominionRepository,
-        token_service: AccessTokenService
+        token_service: AccessTokenService,
+        decision_service: DecisionService
     ) -> AccessService:
         return AccessService(
             ranking_repository, role_repository,
-            dominion_repository, token_service)
+            dominion_repository, token_service,
+            decision_service=decision_service,
+            budget=self.config['tokens']['access'].get('permissions', 0))
 
     def verification_service(
         self, user_repository: UserRepository,
@@ -147,6 +152,14 @@ class BaseFactory(Factory):
         return EnrollmentService(
             user_repository, credential_repository, hash_service )
 
+    def decision_service(
+        self, policy_repository: PolicyRepository,
+        restriction_repository: RestrictionRepository,
+        auth_provider: AuthProvider
+    ) -> DecisionService:
+        return DecisionService(
+            policy_repository, restriction_repository, auth_provider)
+
     # Suppliers
 
     def plan_supplier(self) -> PlanSupplier:
@@ -175,11 +188,12 @@ class BaseFactory(Factory):
         self, user_repository: UserRepository,
         dominion_repository: DominionRepository,
         role_repository: RoleRepository,
-        ranking_repository: RankingRepository
+        ranking_repository: RankingRepository,
+        access_service: AccessService
     ) -> ManagementManager:
         return ManagementManager(
             user_repository, dominion_repository,
-            role_repository, ranking_repository)
+            role_repository, ranking_repository, access_service)
 
     def import_manager(
         self,
@@ -201,9 +215,11 @@ class BaseFactory(Factory):
 
     def security_manager(
         self, restriction_repository: RestrictionRepository,
-        policy_repository: PolicyRepository
+        policy_repository: PolicyRepository,
+        decision_service: DecisionService
     ) -> SecurityManager:
-        return SecurityManager(restriction_repository, policy_repository)
+        return SecurityManager(
+            restriction_repository, policy_repository, decision_service)
 
     def procedure_manager(
         self,  auth_provider: AuthProvider,
@@ -260,6 +276,14 @@ class BaseFactory(Factory):
         return ComposingInformer(
             dominion_repository, role_repository, ranking_repository)
 
+    def security_informer(
+        self, ranking_repository: RankingRepository,
+        decision_service: DecisionService,
+        auth_provider: AuthProvider
+    ) -> SecurityInformer:
+        return SecurityInformer(
+            ranking_repository, decision_service, auth_provider)
+
     def tenant_informer(
         self, tenant_supplier: TenantSupplier,
     ) -> TenantInformer:
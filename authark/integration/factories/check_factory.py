@@ -15,7 +15,7 @@ from ...application.domain.services.repositories import (
     DominionRepository, MemoryDominionRepository)
 from ...application.domain.services import (
     HashService, MemoryHashService,
-    AccessService, AccessTokenService)
+    AccessService, AccessTokenService, DecisionService)
 from ...application.general.suppliers import (
     TenantSupplier, MemoryTenantSupplier)
 from ..core import PyJWTAccessTokenService
@@ -147,7 +147,10 @@ class CheckFactory(CryptoFactory):
             self, ranking_repository: RankingRepository,
             role_repository: RoleRepository,
             dominion_repository: DominionRepository,
-            token_service: AccessTokenService) -> AccessService:
+            token_service: AccessTokenService,
+            decision_service: DecisionService) -> AccessService:
         return AccessService(
             ranking_repository, role_repository,
-            dominion_repository, token_service)
+            dominion_repository, token_service,
+            decision_service=decision_service,
+            budget=self.config['tokens']['access'].get('permissions', 0))
@@ -1,8 +1,9 @@
+import os
 from ...application.domain.services import (
     HashService, AccessTokenService, RefreshTokenService,
     VerificationTokenService, TokenService)
 from ..core.suppliers.crypto import (
-    PasslibHashService, PyJWTTokenService,
+    PooledHashService, PyJWTTokenService,
     PyJWTVerificationTokenService, PyJWTAccessTokenService,
     PyJWTRefreshTokenService)
 from ..core.common import Config
@@ -21,11 +22,16 @@ class CryptoFactory(BaseFactory):
             'tokens', {}).get('refresh')
         self.tokens_verification_config = self.config.get(
             'tokens', {}).get('verification')
+        self.hashing_config = self.config.get('hashing', {})
 
     # Services
 
     def hash_service(self) -> HashService:
-        return PasslibHashService()
+        # Server workers share the cores unless told otherwise.
+        workers = self.hashing_config.get('workers') or max(
+            1, (os.cpu_count() or 1) // (self.config.get('workers') or 1))
+        return PooledHashService(
+            workers, self.hashing_config.get('depth', 256))
 
     def token_service(self) -> TokenService:
         return PyJWTTokenService(
@@ -7,11 +7,12 @@ from ...application.domain.services.repositories import (
     PolicyRepository)
 from ...application.domain.services import HashService, ImportService
 from ...application.general import (
-    PlanSupplier, TenantSupplier, SetupSupplier)
+    PlanSupplier, TenantSupplier, CachedTenantSupplier, SetupSupplier)
 from ..core.data import (
-    JsonCredentialRepository, JsonDominionRepository, JsonRoleRepository,
-    JsonUserRepository, JsonRankingRepository, JsonImportService,
-    JsonRestrictionRepository, JsonPolicyRepository)
+    JsonDominionRepository, JsonRoleRepository,
+    JsonUserRepository, JsonImportService,
+    JsonRestrictionRepository, JsonPolicyRepository, JsonCommitter,
+    JournalCredentialRepository, JournalRankingRepository)
 from ..core.common import Config
 from ..core.suppliers import (
     JsonTenantSupplier, JsonSetupSupplier)
@@ -23,6 +24,10 @@ class JsonFactory(CryptoFactory):
     def __init__(self, config: Config) -> None:
         super().__init__(config)
         self.data_path = self.config['zones']['default']['data']
+        self.committer = JsonCommitter(**self.config['json']['commit'])
+
+    def json_committer(self) -> JsonCommitter:
+        return self.committer
 
     # Repositories
 
@@ -31,49 +36,58 @@ class JsonFactory(CryptoFactory):
             auth_provider: AuthProvider
     ) -> UserRepository:
         return JsonUserRepository(
-            self.data_path, query_parser, auth_provider)
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer)
 
     def credential_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> CredentialRepository:
-        return JsonCredentialRepository(
-            self.data_path, query_parser, auth_provider)
+        return JournalCredentialRepository(
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer,
+            **self.config['json'].get('journal', {}))
 
     def dominion_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> DominionRepository:
         return JsonDominionRepository(
-            self.data_path, query_parser, auth_provider)
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer)
 
     def role_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> RoleRepository:
         return JsonRoleRepository(
-            self.data_path, query_parser, auth_provider)
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer)
 
     def restriction_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> RestrictionRepository:
         return JsonRestrictionRepository(
-            self.data_path, query_parser, auth_provider)
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer)
 
     def policy_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> PolicyRepository:
         return JsonPolicyRepository(
-            self.data_path, query_parser, auth_provider)
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer)
 
     def ranking_repository(
             self, query_parser: QueryParser,
             auth_provider: AuthProvider
     ) -> RankingRepository:
-        return JsonRankingRepository(
-            self.data_path, query_parser, auth_provider)
+        return JournalRankingRepository(
+            self.data_path, query_parser, auth_provider,
+            committer=self.committer,
+            **self.config['json'].get('journal', {}))
 
     def import_service(self, hash_service: HashService) -> ImportService:
         return JsonImportService(hash_service)
@@ -82,7 +96,9 @@ class JsonFactory(CryptoFactory):
         catalog_path = self.config['tenancy']['json']
         zones = {key: value['data'] for key, value in
                  self.config['zones'].items()}
-        return JsonTenantSupplier(catalog_path, zones)
+        return CachedTenantSupplier(
+            JsonTenantSupplier(catalog_path, zones),
+            self.config['tenancy'].get('ttl', 60))
 
     def setup_supplier(self) -> SetupSupplier:
         zones = {key: value['data'] for key, value in
@@ -0,0 +1,73 @@
+from ...application.domain.common import QueryParser, AuthProvider
+from ...application.domain.services.repositories import (
+    UserRepository, CredentialRepository,
+    DominionRepository, RoleRepository,
+    RankingRepository, RestrictionRepository,
+    PolicyRepository)
+from ..core.data import (
+    SqliteConnector, SqliteCredentialRepository, SqliteDominionRepository,
+    SqliteRoleRepository, SqliteUserRepository, SqliteRankingRepository,
+    SqliteRestrictionRepository, SqlitePolicyRepository)
+from ..core.common import Config
+from .oauth_factory import OauthFactory
+
+
+class SqliteFactory(OauthFactory):
+    def __init__(self, config: Config) -> None:
+        super().__init__(config)
+        self.data_path = self.config['zones']['default']['data']
+        self.connector = SqliteConnector()
+
+    def sqlite_connector(self) -> SqliteConnector:
+        return self.connector
+
+    # Repositories
+
+    def user_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> UserRepository:
+        return SqliteUserRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def credential_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> CredentialRepository:
+        return SqliteCredentialRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def dominion_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> DominionRepository:
+        return SqliteDominionRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def role_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> RoleRepository:
+        return SqliteRoleRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def restriction_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> RestrictionRepository:
+        return SqliteRestrictionRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def policy_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> PolicyRepository:
+        return SqlitePolicyRepository(
+            self.data_path, self.connector, auth_provider)
+
+    def ranking_repository(
+            self, query_parser: QueryParser,
+            auth_provider: AuthProvider
+    ) -> RankingRepository:
+        return SqliteRankingRepository(
+            self.data_path, self.connector, auth_provider)
@@ -1 +1,4 @@
-from .request import get_request_filter, get_request_ids
+from .format import encode_cursor
+from .request import (
+    get_request_filter, get_request_cursor, get_request_ids)
+from .response import make_etag, match_etag, compress_response
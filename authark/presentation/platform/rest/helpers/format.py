@@ -1,12 +1,14 @@
 import re
-from json import loads, JSONDecodeError
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from json import JSONDecodeError
 from typing import List, Any
+from .....application.domain.common import codec
 
 
 def parse_domain(filter: str) -> List[Any]:
     domain: List[Any] = []
     try:
-        domain = loads(filter or "")
+        domain = codec.loads(filter or "")
     except JSONDecodeError:
         return domain
 
@@ -19,6 +21,35 @@ def parse_domain(filter: str) -> List[Any]:
     return domain
 
 
+def parse_order(order: str) -> str:
+    fields = []
+    for field in (order or '').split(','):
+        tokens = field.split()
+        if tokens:
+            fields.append(' '.join([camel_to_snake(tokens[0]), *tokens[1:]]))
+
+    return ', '.join(fields)
+
+
+def encode_cursor(key: str) -> str:
+    if not key:
+        return ''
+    return urlsafe_b64encode(codec.encode([key])).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> str:
+    if not cursor:
+        return ''
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        [key] = codec.loads(urlsafe_b64decode(cursor + padding))
+    except (TypeError, ValueError):
+        key = None
+    if not isinstance(key, str):
+        raise ValueError(f"Invalid cursor '{cursor}'.")
+    return key
+
+
 def camel_to_snake(value: str) -> str:
     value = re.sub(r"[\-\.\s]", '_', str(value))
     return (value[0].lower() +
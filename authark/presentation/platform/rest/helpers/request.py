@@ -1,17 +1,27 @@
-from typing import Tuple, List, Any
-from json import loads
+from typing import Tuple, List, Any, Optional
 from aiohttp import web
-from .format import parse_domain
+from .....application.domain.common import codec
+from .format import parse_domain, parse_order, decode_cursor
 
 
 def get_request_filter(request: web.Request) -> Tuple:
     filter = request.query.get('filter', '')
     limit = int(request.query.get('limit') or 1000)
     offset = int(request.query.get('offset') or 0)
+    order = parse_order(request.query.get('order', ''))
 
     domain = parse_domain(filter)
 
-    return domain, limit, offset
+    return domain, limit, offset, order
+
+
+def get_request_cursor(request: web.Request) -> Optional[str]:
+    if 'after' not in request.query:
+        return None
+    try:
+        return decode_cursor(request.query['after'])
+    except ValueError as error:
+        raise web.HTTPBadRequest(reason=str(error))
 
 
 async def get_request_ids(request: web.Request) -> List[str]:
@@ -22,7 +32,7 @@ async def get_request_ids(request: web.Request) -> List[str]:
 
     body = await request.text()
     if body:
-        ids.extend(loads(await request.text()))
+        ids.extend(codec.loads(body))
 
     return ids
 
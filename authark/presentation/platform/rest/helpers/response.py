@@ -0,0 +1,44 @@
+from hashlib import blake2b
+from aiohttp import web
+from aiohttp.web_response import ContentCoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+def make_etag(version: str, request: web.Request) -> str:
+    """Derive an entity tag from a collection version and the requested
+    representation of it, sent as a weak one since it is shared by the
+    compressed and identity bodies."""
+    return blake2b(f'{version}|{request.path_qs}'.encode(),
+                   digest_size=12).hexdigest()
+
+
+def match_etag(etag: str, request: web.Request) -> bool:
+    return any(tag.value in (etag, '*')
+               for tag in request.if_none_match or ())
+
+
+def compress_response(request: web.Request, response: web.StreamResponse,
+                      minimum: int = 1024) -> web.StreamResponse:
+    """Compress the body with brotli when available and accepted, or
+    with gzip or deflate, skipping the small ones."""
+    body = response.body if isinstance(response, web.Response) else None
+    if isinstance(body, bytes) and len(body) < minimum:
+        return response
+
+    response.headers.add('Vary', 'Accept-Encoding')
+    accepted = {coding.split(';')[0].strip() for coding in request.headers.get(
+        'Accept-Encoding', '').lower().split(',')}
+    if (brotli and isinstance(response, web.Response) and
+            isinstance(body, bytes) and 'br' in accepted):
+        response.body = brotli.compress(body)
+        response.headers['Content-Encoding'] = 'br'
+    elif 'gzip' in accepted:
+        response.enable_compression(ContentCoding.gzip)
+    elif 'deflate' in accepted:
+        response.enable_compression(ContentCoding.deflate)
+
+    return response
@@ -1,7 +1,7 @@
 from typing import List, Callable
 from injectark import Injectark
 from .....integration.core import Config
-from .authenticate import authenticate_middleware_factory
+from .authenticate import authenticate_middleware_factory, TokenCache
 from .errors import errors_middleware_factory
 
 
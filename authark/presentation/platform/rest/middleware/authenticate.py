@@ -1,13 +1,83 @@
 import jwt
-from typing import Callable, Dict, Any
+import time
+import logging
+from hashlib import blake2b
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, Tuple
 from aiohttp import web
 from injectark import Injectark, Config
 from .....application.operation.managers import SessionManager
 
 
+logger = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """Bounded LRU of verified token payloads keyed by the token digest
+    and expiring with the token itself. Its hits and misses are logged
+    every report interval in seconds."""
+
+    def __init__(self, size: int = 4096, ttl: float = 300,
+                 report: float = 300) -> None:
+        self.size = size
+        self.ttl = ttl
+        self.report = report
+        self.entries: 'OrderedDict[bytes, Tuple[float, Dict[str, Any]]]' = (
+            OrderedDict())
+        self.hits = 0
+        self.misses = 0
+        self.reported = time.time()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._digest(token)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            self.entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        if not self.size:
+            return
+
+        expiration = time.time() + self.ttl
+        if isinstance(payload.get('exp'), (int, float)):
+            expiration = min(expiration, payload['exp'])
+
+        key = self._digest(token)
+        self.entries[key] = (expiration, dict(payload))
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def log(self) -> None:
+        now = time.time()
+        if now - self.reported < self.report:
+            return
+        self.reported = now
+        logger.info(f"Token cache: {self.hits} hits, {self.misses} misses, "
+                    f"{self.hit_rate:.1%} hit rate, "
+                    f"{len(self.entries)} entries.")
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return blake2b(token.encode(), digest_size=16).digest()
+
+
 def authenticate_middleware_factory(injector: Injectark) -> Callable:
     session_manager: SessionManager = injector['SessionManager']
-    secret = injector.config['tokens']['rest']['secret']
+    settings = injector.config['tokens']['rest']
+    secret = settings['secret']
+    cache = TokenCache(**settings.get('cache', {}))
 
     @web.middleware
     async def middleware(request: web.Request, handler: Callable):
@@ -21,16 +91,20 @@ def authenticate_middleware_factory(injector: Injectark) -> Callable:
             'Authorization', '').replace('Bearer ', '')
         token = token or request.query.get('access_token', '')
 
-        try:
-            payload = jwt.decode(
-                token, secret, algorithms=['HS256'],
-                options={"verify_signature": bool(secret)})
+        payload = cache.get(token)
+        cache.log()
+        if payload is None:
+            try:
+                payload = jwt.decode(
+                    token, secret, algorithms=['HS256'],
+                    options={"verify_signature": bool(secret)})
+            except Exception as error:
+                reason = f"{error.__class__.__name__}: {str(error)}"
+                raise web.HTTPUnauthorized(reason=reason)
+            cache.put(token, payload)
 
-            session_manager.set_user({'data': payload})
+        session_manager.set_user({'data': payload})
 
-        except Exception as error:
-            reason = f"{error.__class__.__name__}: {str(error)}"
-            raise web.HTTPUnauthorized(reason=reason)
         return await handler(request)
 
     return middleware
@@ -1,9 +1,9 @@
 import logging
-from json import dumps
 from traceback import format_tb
 from typing import Callable, Dict, Any
 from aiohttp import web
 from injectark import Injectark
+from .....application.domain.common import QueryError, codec
 
 
 def errors_middleware_factory(injector: Injectark) -> Callable:
@@ -15,6 +15,8 @@ def errors_middleware_factory(injector: Injectark) -> Callable:
         except Exception as error:
             type_ = type(error).__name__
             status = getattr(error, 'status', 500)
+            if isinstance(error, QueryError):
+                status = 400
             message = str(error)
             traceback = format_tb(error.__traceback__)
 
@@ -24,6 +26,6 @@ def errors_middleware_factory(injector: Injectark) -> Callable:
                 "type": type_,
                 "message": message,
                 "trace": traceback
-            }]}, status=status, dumps=dumps)
+            }]}, status=status, dumps=codec.dumps)
 
     return middleware
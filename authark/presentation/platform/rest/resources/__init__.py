@@ -1,2 +1,4 @@
 from .resource import Resource
 from .root import RootResource
+from .batch import BatchResource
+from .operations import Route, routes
@@ -0,0 +1,58 @@
+from aiohttp import web
+from typing import Any, Dict, List, Tuple
+from validark import normalize
+from .....application.domain.common import codec
+from .....application.domain.services.repositories import repository_batch
+from .operations import Route
+
+
+class BatchResource:
+    def __init__(self, table: Dict[Tuple[str, str], Route]) -> None:
+        self.table = table
+        self.keys = {'operationId', 'action', 'entry'}
+
+    async def patch(self, request: web.Request) -> web.Response:
+        operations = self._parse(await request.read())
+
+        results = []
+        with repository_batch():
+            for (handler, fixed_meta), entry in operations:
+                entry = normalize(entry, 'snake')
+                entry.setdefault('meta', {}).update(fixed_meta)
+                results.append(await handler(entry))
+
+        return web.json_response(
+            normalize({'data': results}), dumps=codec.dumps)
+
+    def _parse(self, body: bytes) -> List[Tuple[Route, Dict[str, Any]]]:
+        """Resolve the operations of a batch body, rejecting it whole if
+        any of its items is malformed or unknown."""
+        try:
+            records = codec.loads(body or b'{}')
+        except ValueError as error:
+            raise web.HTTPBadRequest(reason=f"Invalid batch body: {error}")
+
+        items = records.get('data', []) if isinstance(records, dict) else None
+        if not isinstance(items, list):
+            raise web.HTTPBadRequest(
+                reason="Invalid batch body: 'data' must be a list.")
+
+        operations = []
+        for index, item in enumerate(items):
+            if not (isinstance(item, dict) and item.keys() <= self.keys and
+                    isinstance(item.get('operationId'), str) and
+                    isinstance(item.get('action') or '', str) and
+                    isinstance(item.get('entry', {}), dict)):
+                raise web.HTTPBadRequest(
+                    reason=f"Invalid batch item {index}: expected an "
+                    "object with a string 'operationId', an optional "
+                    "string 'action' and an optional object 'entry'.")
+            key = (item['operationId'], item.get('action') or 'default')
+            entry = item.get('entry', {})
+            if key not in self.table:
+                raise web.HTTPBadRequest(
+                    reason=f"Invalid batch item {index}: unknown "
+                    f"operation '{key[0]}' with action '{key[1]}'.")
+            operations.append((self.table[key], entry))
+
+        return operations
@@ -1,6 +1,20 @@
+from typing import Any, Callable, Dict, Tuple
+from injectark import Injectark
+
+
 
 def operations():
     return {
+        # Authorization
+        'authorizationsPatchId': {
+            'actions':{
+                'default':{
+                    'handler': 'SecurityInformer.authorize',
+                    'meta': {'model': 'authorization'}
+                }
+            }
+        },
+
         # Dominion
         'dominionsHeadId': {
             'actions':{
@@ -15,6 +29,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'dominion'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'dominion'}
                 }
             }
         },
@@ -33,6 +51,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'policy'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'policy'}
                 }
             }
         },
@@ -67,6 +89,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'ranking'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'ranking'}
                 }
             }
         },
@@ -121,6 +147,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'restriction'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'restriction'}
                 }
             }
         },
@@ -155,6 +185,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'role'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'role'}
                 }
             }
         },
@@ -206,6 +240,10 @@ def operations():
                 'default':{
                     'handler': 'StandardInformer.search',
                     'meta': {'model': 'user'}
+                },
+                'version':{
+                    'handler': 'StandardInformer.version',
+                    'meta': {'model': 'user'}
                 }
             }
         },
@@ -238,3 +276,18 @@ def operations():
 
 
     }
+
+
+Route = Tuple[Callable, Dict[str, Any]]
+
+
+def routes(injector: Injectark) -> Dict[Tuple[str, str], Route]:
+    """Resolve every operation action into its bound handler and fixed
+    meta, keyed by (operationId, action)."""
+    table: Dict[Tuple[str, str], Route] = {}
+    for operation_id, operation_map in operations().items():
+        for action, route in operation_map['actions'].items():
+            class_name, method_name = route['handler'].split('.')
+            handler = getattr(injector[class_name], method_name)
+            table[(operation_id, action)] = (handler, route['meta'])
+    return table
@@ -1,20 +1,27 @@
-from json import loads
-from aiohttp import web
+from aiohttp import web, ETag
 from injectark import Injectark
-from typing import Callable, Type, Tuple, Dict
+from typing import (
+    Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type)
 from validark import normalize,  validate
-from ..helpers import get_request_filter, get_request_ids
-from .operations import operations
+from .....application.domain.common import codec
+from ..helpers import (
+    get_request_filter, get_request_cursor, get_request_ids, encode_cursor,
+    make_etag, match_etag, compress_response)
+from .operations import Route, routes
 
 
 class Resource:
-    def __init__(self, spec: dict, injector: Injectark) -> None:
+    def __init__(self, spec: dict, injector: Injectark,
+                 table: Optional[Dict[Tuple[str, str], Route]] = None,
+                 chunk_size: int = 1000) -> None:
         self.spec = spec
         self.injector = injector
         self.paths = self.spec['paths']
+        self.table = routes(injector) if table is None else table
+        self.chunk_size = chunk_size
 
     async def head(self, request) -> web.Response:
-        domain, _, _ =  get_request_filter(request)
+        domain, *_ =  get_request_filter(request)
         resource = request.match_info['resource']
         path = self.paths[f'/{resource}']['head']
         action = 'default'
@@ -28,10 +35,11 @@ class Resource:
         result = await handler({'meta': meta})
 
         return web.json_response(
-            {'data': None}, headers={'Count': str(result['data'])})
+            {'data': None}, headers={'Count': str(result['data'])},
+            dumps=codec.dumps)
 
-    async def get(self, request: web.Request) -> web.Response:
-        domain, limit, offset =  get_request_filter(request)
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        domain, limit, offset, order =  get_request_filter(request)
         action = 'default'
 
         resource = request.match_info['resource']
@@ -40,14 +48,37 @@ class Resource:
         handler, fixed_meta = self.resolve_operation(
             path['operationId'], action)
 
-        meta = {'domain': domain, 'limit': limit, 'offset': offset}
+        meta = {'domain': domain, 'limit': limit,
+                'offset': offset, 'order': order}
+        after = get_request_cursor(request)
+        if after is not None:
+            meta['after'] = after
         meta.update(fixed_meta)
+
+        if 'stream' in request.query:
+            meta['limit'] = limit if 'limit' in request.query else None
+            return await self._stream(request, handler, meta)
+
+        etag = await self._etag(request, path['operationId'])
+        if etag and match_etag(etag, request):
+            return web.Response(
+                status=304, headers={'ETag': f'W/"{etag}"'})
+
         result = await handler({'meta': meta})
 
-        return web.json_response(normalize(result))
+        headers = {}
+        if 'cursor' in result:
+            headers['Next-Cursor'] = encode_cursor(result.pop('cursor'))
+
+        response = web.json_response(
+            normalize(result), headers=headers, dumps=codec.dumps)
+        if etag:
+            response.etag = ETag(value=etag, is_weak=True)
+
+        return compress_response(request, response)
 
     async def patch(self, request: web.Request) -> web.Response:
-        entry = loads(await request.text())
+        entry = codec.loads(await request.read() or b'{}')
         action = entry.get('meta', {}).get('action','default')
 
         resource = request.match_info['resource']
@@ -59,7 +90,7 @@ class Resource:
         entry.setdefault('meta', {}).update(fixed_meta)
         result = await handler(normalize(entry, 'snake'))
 
-        return web.json_response(normalize(result))
+        return web.json_response(normalize(result), dumps=codec.dumps)
 
     async def delete(self, request: web.Request) -> web.Response:
         ids = await get_request_ids(request)
@@ -71,18 +102,72 @@ class Resource:
         handler, fixed_meta = self.resolve_operation(
             path['operationId'], action)
 
-        entry = {'meta': fixed_meta, 'data': ids}
+        entry = {'meta': dict(fixed_meta), 'data': ids}
         result = await handler(entry)
 
-        return web.json_response(result)
+        return web.json_response(result, dumps=codec.dumps)
+
+    async def _stream(self, request: web.Request, handler: Callable,
+                      meta: Dict[str, Any]) -> web.StreamResponse:
+        pages = self._pages(handler, meta)
+        page: Optional[List[Dict[str, Any]]] = await pages.__anext__()
+
+        response = web.StreamResponse(
+            headers={'Content-Type': 'application/json'})
+        response.enable_chunked_encoding()
+        compress_response(request, response)
+        await response.prepare(request)
+
+        separator = b''
+        await response.write(b'{"data": [')
+        while page is not None:
+            for record in page:
+                await response.write(
+                    separator + codec.encode(normalize(record)))
+                separator = b', '
+            page = await pages.__anext__() if page else None
+        await response.write(b']}')
+        await response.write_eof()
+
+        return response
+
+    async def _etag(self, request: web.Request,
+                    operation_id: str) -> Optional[str]:
+        route = self.table.get((operation_id, 'version'))
+        if not route:
+            return None
+
+        handler, fixed_meta = route
+        result = await handler({'meta': dict(fixed_meta)})
+
+        return make_etag(result['data'], request)
+
+    async def _pages(self, handler: Callable, meta: Dict[str, Any]
+                     ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk through the search results in keyset pages unless an
+        explicit order or offset was requested, ending with an empty
+        page."""
+        remaining = meta['limit']
+        paged = not meta['offset'] and not meta['order']
+        if paged:
+            meta['after'] = meta.get('after') or ''
+
+        while remaining is None or remaining > 0:
+            size = remaining
+            if paged:
+                size = min(self.chunk_size, remaining or self.chunk_size)
+            result = await handler({'meta': {**meta, 'limit': size}})
+            yield result['data']
+
+            cursor = result.get('cursor')
+            if not (paged and cursor):
+                break
+            meta['after'] = cursor
+            if remaining is not None:
+                remaining -= len(result['data'])
+
+        yield []
 
     def resolve_operation(
         self, operationId: str, action: str) -> Tuple[Callable, Dict]:
-        operation_map = operations()[operationId]
-
-        route = operation_map['actions'][action]
-
-        class_name, method_name = route['handler'].split('.')
-        meta = route['meta']
-
-        return getattr(self.injector[class_name], method_name),meta
+        return self.table[(operationId, action)]
@@ -1,12 +1,12 @@
 import json
 import aiohttp_jinja2
-from typing import Any
+from typing import Any, Optional
 from pathlib import Path
 from jinja2 import FileSystemLoader
 from aiohttp import web, ClientSession
 from injectark import Injectark
 from .middleware import middlewares
-from .resources import (Resource, RootResource)
+from .resources import (Resource, RootResource, BatchResource, routes)
 
 class RestApplication(web.Application):
     def __init__(self, injector: Injectark) -> None:
@@ -15,14 +15,16 @@ class RestApplication(web.Application):
         self._setup()
 
     @staticmethod
-    async def run(app: web.Application, port: int = 4321):
-        await web._run_app(app, port=port)
+    async def run(app: web.Application, port: int = 4321,
+                  reuse_port: Optional[bool] = None):
+        await web._run_app(app, port=port, reuse_port=reuse_port)
 
     def _setup(self) -> None:
         templates = str(Path(__file__).parent / 'resources')
         aiohttp_jinja2.setup(self, loader=FileSystemLoader(templates))
 
         self.cleanup_ctx.append(self._http_client)
+        self.cleanup_ctx.append(self._hash_service)
 
         spec = json.loads(
             (Path(__file__).parent / 'openapi.json').read_text())
@@ -36,11 +38,19 @@ class RestApplication(web.Application):
         yield
         await session.close()
 
+    async def _hash_service(self, app: web.Application):
+        hash_service = self.injector.resolve('HashService')
+        yield
+        if hash_service:
+            hash_service.shutdown()
+
     def _create_api(self, spec) -> None:
 
-        resource = Resource(spec, self.injector)
+        table = routes(self.injector)
+        resource = Resource(spec, self.injector, table)
         self.add_routes([
             web.get('/', RootResource(spec).get),
+            web.patch('/batch', BatchResource(table).patch),
 
             web.get('/{resource}/{id}', resource.get, allow_head=False),
             web.get('/{resource}', resource.get, allow_head=False),
@@ -1,6 +1,8 @@
+import os
+import sys
 import json
 import logging
-from argparse import ArgumentParser, Namespace
+from argparse import ArgumentParser, Namespace, SUPPRESS
 from injectark import Injectark
 from typing import List, Dict
 from ....integration.core import Config
@@ -8,6 +10,7 @@ from .... import __version__
 from ...platform.rest import RestApplication
 from ...system.console import ConsoleApplication
 from .scheduler import Scheduler
+from .supervisor import Supervisor
 
 
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +40,10 @@ class Shell:
         serve_parser = subparsers.add_parser(
             'serve', help='Start HTTP server.')
         serve_parser.add_argument('-p', '--port')
+        serve_parser.add_argument(
+            '-w', '--workers', help='Number of worker processes.')
+        serve_parser.add_argument(
+            '--worker', action='store_true', help=SUPPRESS)
         serve_parser.set_defaults(func=self.serve)
 
         # Work
@@ -87,8 +94,22 @@ class Shell:
     async def serve(self, options_dict: Dict[str, str]) -> None:
         logger.info('SERVE')
         port = int(options_dict.get('port') or self.config['port'])
-        app = RestApplication(self.injector)
-        await RestApplication.run(app, port)
+        workers = int(options_dict.get('workers') or
+                      self.config.get('workers') or 1)
+
+        if options_dict.get('worker'):
+            app = RestApplication(self.injector)
+            await RestApplication.run(app, port, reuse_port=True)
+        elif workers > 1:
+            command = [sys.executable, '-m', 'authark', 'serve',
+                       '--port', str(port), '--worker']
+            # Lets the workers share the cores among their hash pools.
+            env = {**os.environ, 'AUTHARK_WORKERS': str(workers)}
+            await Supervisor(command, workers, env=env).run()
+        else:
+            app = RestApplication(self.injector)
+            await RestApplication.run(app, port)
+
         logger.info('END SERVE')
 
     async def work(self, options_dict: Dict[str, str]) -> None:
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import signal
+from typing import List, Mapping, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class Supervisor:
+    """Start a fixed pool of worker processes, restart the ones that crash
+    and stop them all gracefully on SIGTERM or SIGINT."""
+
+    def __init__(self, command: Sequence[str], workers: int,
+                 grace: float = 60, backoff: float = 1,
+                 env: Optional[Mapping[str, str]] = None) -> None:
+        self.command = list(command)
+        self.workers = workers
+        self.env = env
+        self.grace = grace
+        self.backoff = backoff
+        self.processes: List[asyncio.subprocess.Process] = []
+        self.restarts = 0
+        self.stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.stop)
+
+        try:
+            await asyncio.gather(*(
+                self._supervise(index) for index in range(self.workers)))
+        finally:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(signum)
+
+    def stop(self) -> None:
+        logger.info('Stopping workers...')
+        self.stopping.set()
+
+    async def _supervise(self, index: int) -> None:
+        while not self.stopping.is_set():
+            process = await asyncio.create_subprocess_exec(
+                *self.command, env=self.env)
+            self.processes.append(process)
+            logger.info(f'Worker {index} started [{process.pid}]')
+
+            exited = asyncio.ensure_future(process.wait())
+            stopping = asyncio.ensure_future(self.stopping.wait())
+            await asyncio.wait(
+                [exited, stopping], return_when=asyncio.FIRST_COMPLETED)
+            stopping.cancel()
+
+            if not exited.done():
+                await self._drain(process, exited)
+                break
+
+            self.processes.remove(process)
+            self.restarts += 1
+            logger.warning(f'Worker {index} [{process.pid}] exited with '
+                           f'code {process.returncode}. Restarting...')
+            try:
+                await asyncio.wait_for(
+                    self.stopping.wait(), timeout=self.backoff)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _drain(self, process: asyncio.subprocess.Process,
+                     exited: asyncio.Future) -> None:
+        process.terminate()
+        try:
+            await asyncio.wait_for(asyncio.shield(exited), self.grace)
+        except asyncio.TimeoutError:
+            logger.warning(f'Killing worker [{process.pid}]...')
+            process.kill()
+            await exited
+        self.processes.remove(process)
+        logger.info(f'Worker [{process.pid}] stopped')
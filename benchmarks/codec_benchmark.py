@@ -0,0 +1,49 @@
+"""Compare the standard library and the orjson codecs encoding and
+decoding user and ranking payloads.
+Usage: python -m benchmarks.codec_benchmark [size]"""
+
+import sys
+import time
+from authark.application.domain.common.codec import JsonCodec, OrjsonCodec
+from authark.application.domain.models import User, Ranking
+
+
+def build_payloads(size: int):
+    users = {str(index): vars(User(
+        id=str(index), username=f'user{index}',
+        email=f'user{index}@example.org', name=f'User {index}',
+        attributes={'phone': f'555-{index:04}', 'tags': ['a', 'b']},
+        created_at=1600000000 + index, updated_at=1600000000 + index))
+        for index in range(size)}
+    rankings = {str(index): vars(Ranking(
+        id=str(index), user_id=str(index), role_id=str(index % 10),
+        created_at=1600000000 + index)) for index in range(size)}
+    return {'users': users, 'rankings': rankings}
+
+
+def measure(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(size: int = 100_000) -> None:
+    payloads = build_payloads(size)
+    standard, fast = JsonCodec(), OrjsonCodec()
+
+    print(f'{"payload":<10} {"operation":<10} {"json":>9} '
+          f'{"orjson":>9} {"speedup":>8}')
+    for name, payload in payloads.items():
+        content = standard.dumps(payload)
+        for operation, function, args in (
+                ('dumps', 'dumps', (payload,)),
+                ('indent', 'dumps', (payload, True)),
+                ('loads', 'loads', (content,))):
+            standard_time = measure(getattr(standard, function), *args)
+            fast_time = measure(getattr(fast, function), *args)
+            print(f'{name:<10} {operation:<10} {standard_time:>8.3f}s '
+                  f'{fast_time:>8.3f}s {standard_time / fast_time:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:2]])
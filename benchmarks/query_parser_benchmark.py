@@ -0,0 +1,64 @@
+"""Compare the QueryParser and the CompiledQueryParser filtering in-memory
+entities. Usage: python -m benchmarks.query_parser_benchmark [size]"""
+
+import sys
+import time
+from authark.application.domain.common import (
+    QueryParser, CompiledQueryParser)
+from authark.application.domain.models import User
+
+
+DOMAINS = {
+    'equality': [('username', '=', 'user500000')],
+    'conjunction': [('email', '!=', ''), ('active', '=', True),
+                    ('picture', 'in', ['avatar.png', 'photo.png'])],
+    'disjunction': ['|', ('name', '=', 'Nobody'), '!',
+                    ('username', 'like', 'user1%')],
+    'ilike': [('email', 'ilike', '%@EXAMPLE.org')],
+}
+
+
+def build_users(size: int):
+    pictures = ['avatar.png', 'photo.png', '']
+    return [User(id=str(index), username=f'user{index}',
+                 email=f'user{index}@example.org', name=f'User {index}',
+                 picture=pictures[index % 3]) for index in range(size)]
+
+
+def measure(parser, domain, users) -> float:
+    start = time.perf_counter()
+    function = parser.parse(domain)
+    matches = sum(1 for user in users if function(user))
+    elapsed = time.perf_counter() - start
+    return elapsed, matches
+
+
+def measure_parse(parser, count: int) -> float:
+    start = time.perf_counter()
+    for index in range(count):
+        parser.parse([('type', '=', 'password'), ('user_id', '=', index)])
+    return time.perf_counter() - start
+
+
+def main(size: int = 1_000_000) -> None:
+    users = build_users(size)
+    reference, compiled = QueryParser(), CompiledQueryParser()
+
+    print(f'{"domain":<12} {"parser":>9} {"compiled":>9} {"speedup":>8}')
+    for name, domain in DOMAINS.items():
+        parser_time, expected = measure(reference, domain, users)
+        compiled_time, matches = measure(compiled, domain, users)
+        assert matches == expected
+        print(f'{name:<12} {parser_time:>8.3f}s {compiled_time:>8.3f}s '
+              f'{parser_time / compiled_time:>7.2f}x')
+
+    count = size // 10
+    parser_time = measure_parse(reference, count)
+    compiled_time = measure_parse(compiled, count)
+    print(f'{"parse x" + str(count):<12} {parser_time:>8.3f}s '
+          f'{compiled_time:>8.3f}s {parser_time / compiled_time:>7.2f}x '
+          f'({compiled.hits} hits, {compiled.misses} misses)')
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:2]])
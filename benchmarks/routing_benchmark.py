@@ -0,0 +1,50 @@
+"""Compare resolving REST operations per request against the routing
+table precomputed at startup.
+Usage: python -m benchmarks.routing_benchmark [count]"""
+
+import sys
+import time
+from injectark import Injectark
+from authark.integration.core import config
+from authark.integration.factories import factory_builder
+from authark.presentation.platform.rest.resources import routes
+from authark.presentation.platform.rest.resources.operations import (
+    operations)
+
+
+KEYS = [('usersGetId', 'default'), ('rolesPatchId', 'default'),
+        ('rankingsDeleteId', 'default'), ('tokensPatchId', 'default')]
+
+
+def resolve(injector, operation_id, action):
+    route = operations()[operation_id]['actions'][action]
+    class_name, method_name = route['handler'].split('.')
+    return getattr(injector[class_name], method_name), route['meta']
+
+
+def measure(function, count: int) -> float:
+    start = time.perf_counter()
+    for index in range(count):
+        function(*KEYS[index % len(KEYS)])
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    injector = Injectark(factory_builder.build(
+        {**config, 'factory': 'CheckFactory'}))
+    table = routes(injector)
+
+    dynamic_time = measure(
+        lambda *key: resolve(injector, *key), count)
+    table_time = measure(lambda *key: table[key], count)
+
+    print(f'{"resolution":<12} {"total":>9} {"per call":>10}')
+    for name, elapsed in (('dynamic', dynamic_time),
+                          ('table', table_time)):
+        print(f'{name:<12} {elapsed:>8.3f}s '
+              f'{elapsed / count * 1e6:>8.2f}us')
+    print(f'{"speedup":<12} {dynamic_time / table_time:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:2]])
@@ -16,7 +16,7 @@ from authark.application.domain.services import (
     TokenService, MemoryTokenService, MemoryRefreshTokenService,
     RefreshTokenService, AccessTokenService, VerificationTokenService,
     MemoryVerificationTokenService, MemoryAccessTokenService,
-    AccessService, VerificationService, ImportService,
+    AccessService, VerificationService, ImportService, DecisionService,
     MemoryImportService, HashService, MemoryHashService,
     EnrollmentService, IdentityService, MemoryIdentityService)
 from authark.application.general import (
@@ -258,6 +258,14 @@ def access_service(mock_ranking_repository, mock_role_repository,
         mock_dominion_repository, mock_token_service)
 
 
+@fixture
+def decision_service(mock_policy_repository, mock_restriction_repository,
+                     mock_auth_provider):
+    return DecisionService(
+        mock_policy_repository, mock_restriction_repository,
+        mock_auth_provider)
+
+
 @fixture
 def verification_service(
         mock_user_repository, mock_verification_token_service):
@@ -314,17 +322,19 @@ def auth_manager(
 @fixture
 def management_manager(
         mock_user_repository, mock_dominion_repository,
-        mock_role_repository, mock_ranking_repository):
+        mock_role_repository, mock_ranking_repository, access_service):
     return ManagementManager(
         mock_user_repository, mock_dominion_repository,
-        mock_role_repository, mock_ranking_repository)
+        mock_role_repository, mock_ranking_repository, access_service)
 
 
 @fixture
 def security_manager(
-        mock_restriction_repository, mock_policy_repository):
+        mock_restriction_repository, mock_policy_repository,
+        decision_service):
     return SecurityManager(
-        mock_restriction_repository, mock_policy_repository)
+        mock_restriction_repository, mock_policy_repository,
+        decision_service)
 
 
 @fixture
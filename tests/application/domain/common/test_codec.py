@@ -0,0 +1,50 @@
+import json
+from pytest import fixture, raises
+from authark.application.domain.common import codec
+from authark.application.domain.common.codec import (
+    JsonCodec, OrjsonCodec)
+
+
+VALUE = {'id': '1', 'name': 'Jhon', 'active': True,
+         'attributes': {'tags': ['a', 'b']}, 'score': 1.5, 'none': None}
+
+
+@fixture(params=[JsonCodec, OrjsonCodec])
+def json_codec(request):
+    return request.param()
+
+
+def test_codec_dumps_and_loads(json_codec):
+    content = json_codec.dumps(VALUE)
+
+    assert content == json.dumps(VALUE, separators=(',', ':'))
+    assert json_codec.loads(content) == VALUE
+    assert json_codec.loads(content.encode()) == VALUE
+    assert json_codec.encode(VALUE) == content.encode()
+
+
+def test_codec_dumps_indent(json_codec):
+    assert json_codec.dumps(VALUE, indent=True) == json.dumps(
+        VALUE, indent=2)
+
+
+def test_codec_invalid_content(json_codec):
+    with raises(json.JSONDecodeError):
+        json_codec.loads('{invalid')
+
+
+def test_orjson_codec_falls_back_on_big_integers():
+    assert OrjsonCodec().dumps({'big': 2 ** 70}) == '{"big":%d}' % 2 ** 70
+
+
+def test_codec_set_codec():
+    standard = JsonCodec()
+    previous = codec.set_codec(standard)
+    try:
+        assert codec.get_codec() is standard
+        assert codec.loads(codec.dumps(VALUE)) == VALUE
+        assert codec.encode([1]) == b'[1]'
+    finally:
+        codec.set_codec(previous)
+
+    assert codec.get_codec() is previous
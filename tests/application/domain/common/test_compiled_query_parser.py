@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from pytest import fixture, raises
+from authark.application.domain.common import (
+    QueryParser, CompiledQueryParser)
+
+
+@fixture
+def parser() -> CompiledQueryParser:
+    return CompiledQueryParser()
+
+
+def build_objects():
+    return [SimpleNamespace(field=field, field2=field2, name=name,
+                            tags=tags)
+            for field, field2, name, tags in [
+                (7, 8, 'Hello World', ['a', 'b']),
+                (7, 5, 'hello world', ['b']),
+                (3, 8, 'HelloX', []),
+                (9, 9, 99, ['c'])]]
+
+
+def test_compiled_query_parser_object_creation(parser):
+    assert isinstance(parser, QueryParser)
+
+
+def test_compiled_query_parser_matches_query_parser(parser):
+    reference = QueryParser()
+    domains = [
+        [],
+        [('field', '=', 7)],
+        [('field', '=', 7), ('field2', '!=', 8)],
+        [('field', '>', 3), ('field2', '<=', 8), ('field', '<', 9)],
+        [('field', '>=', 7), ('field', 'in', [7, 9])],
+        ['|', ('field', '=', 7), ('field2', '!=', 8)],
+        ['|', ('field', '=', 7), '!', ('field2', '!=', 8),
+         ('field2', '>=', 9)],
+        ['!', ('field', '=', 7)],
+        ['|', ('field', '=', 3), '&', ('field', '=', 9),
+         ('field2', 'in', (8, 9))],
+        [('name', 'like', 'Hello%')],
+        [('name', 'like', 'Hello_')],
+        [('name', 'ilike', '%WORLD')],
+        ['|', ('name', 'ilike', '%eLLo%'), ('tags', 'contains', 'c')],
+        [['tags', 'contains', 'b'], ['field2', '=', 5]],
+    ]
+
+    for domain in domains:
+        expected = reference.parse(domain)
+        function = parser.parse(domain)
+        for obj in build_objects():
+            assert function(obj) == expected(obj), domain
+
+
+def test_compiled_query_parser_binds_literals(parser):
+    values = [7]
+    function = parser.parse([('field', 'in', values)])
+    obj = SimpleNamespace(field=7)
+    assert function(obj) is True
+
+
+def test_compiled_query_parser_non_identifier_fields(parser):
+    function = parser.parse([('class', '=', 'A'), ('my-field', '=', 1)])
+    obj = SimpleNamespace(**{'class': 'A', 'my-field': 1})
+    assert function(obj) is True
+
+
+def test_compiled_query_parser_custom_operator(parser):
+    parser.comparison_dict['startswith'] = lambda field, value: (
+        lambda obj: getattr(obj, field).startswith(value))
+
+    function = parser.parse([('name', 'startswith', 'He')])
+
+    assert function(SimpleNamespace(name='Hello')) is True
+    assert function(SimpleNamespace(name='World')) is False
+
+
+def test_compiled_query_parser_unknown_operator(parser):
+    with raises(KeyError):
+        parser.parse([('field', '~', 1)])
+
+
+def test_compiled_query_parser_plan_cache(parser):
+    first = parser.parse([('type', '=', 'password'), ('user_id', '=', '1')])
+    second = parser.parse([('type', '=', 'password'), ('user_id', '=', '2')])
+
+    assert (parser.misses, parser.hits) == (1, 1)
+    assert len(parser.plans) == 1
+
+    obj = SimpleNamespace(type='password', user_id='2')
+    assert first(obj) is False
+    assert second(obj) is True
+
+
+def test_compiled_query_parser_plan_cache_binds_patterns(parser):
+    first = parser.parse([('name', 'ilike', 'hello%')])
+    second = parser.parse([('name', 'ilike', '%WORLD')])
+
+    assert parser.hits == 1
+    assert first(SimpleNamespace(name='Hello there')) is True
+    assert second(SimpleNamespace(name='Hello there')) is False
+    assert second(SimpleNamespace(name='Hello World')) is True
+
+
+def test_compiled_query_parser_plan_cache_eviction() -> None:
+    parser = CompiledQueryParser(cache_size=2)
+
+    parser.parse([('a', '=', 1)])
+    parser.parse([('b', '=', 1)])
+    parser.parse([('a', '=', 2)])
+    parser.parse([('c', '=', 1)])
+
+    assert list(parser.plans) == [(('a', '='),), (('c', '='),)]
+    assert (parser.misses, parser.hits) == (3, 1)
@@ -23,3 +23,13 @@ def test_credential_attributes(credential):
     assert credential.value == (
         'e9cee71ab932fde863338d08be4de9dfe39ea049bdafb342ce659ec5450b69ae')
     assert credential.client == 'ANDROID_LG_0987'
+    assert credential.key == ''
+
+
+def test_credential_refresh_token_key():
+    credential = Credential(value='REFRESH_TOKEN', type='refresh_token')
+
+    assert len(credential.key) == 32
+    assert credential.key == Credential.lookup('REFRESH_TOKEN')
+    assert Credential(value='REFRESH_TOKEN', type='refresh_token',
+                      key='STORED').key == 'STORED'
@@ -1,5 +1,6 @@
-import json
-from authark.application.domain.models import User, Tenant, Token, Dominion
+from authark.application.domain.common import codec
+from authark.application.domain.models import (
+    User, Tenant, Token, Dominion, Policy, Restriction)
 from authark.application.domain.services import Tenant
 
 
@@ -21,7 +22,7 @@ async def test_access_service_generate_token_payload(access_service) -> None:
 
     token = await access_service.generate_token(tenant, user, dominion)
 
-    assert token.value == json.dumps({
+    assert token.value == codec.dumps({
         "tid": "T1",
         "tenant": "default",
         "organization": "Default",
@@ -44,7 +45,7 @@ async def test_access_service_generate_token_roles(access_service) -> None:
 
     token = await access_service.generate_token(tenant, user, dominion)
 
-    assert token.value == json.dumps({
+    assert token.value == codec.dumps({
         "tid": "1",
         "tenant": "default",
         "organization": "Default",
@@ -55,3 +56,91 @@ async def test_access_service_generate_token_roles(access_service) -> None:
         "attributes": {},
         "roles": ['admin|1']
     })
+
+
+async def test_access_service_roles_cache(access_service) -> None:
+    tenant = Tenant(id='1', name='Default')
+    user = User(id='1', username='johndoe', email='johndoe')
+    dominion = Dominion(id='1', name='Data Server')
+
+    roles = await access_service._build_roles(tenant, user, dominion)
+    assert roles == ['admin|1']
+
+    # Entries are reused while the repositories are unchanged.
+    cache = access_service.roles_cache['1']
+    _, versions, role_ids, _ = cache[('1', '1')]
+    cache[('1', '1')] = (float('inf'), versions, role_ids, ['cached|1'])
+    assert await access_service._build_roles(
+        tenant, user, dominion) == ['cached|1']
+
+    # Writes by any worker show up in the repository versions.
+    await access_service.ranking_repository.remove(
+        await access_service.ranking_repository.search([]))
+    assert await access_service._build_roles(tenant, user, dominion) == []
+
+
+async def test_access_service_roles_cache_expiration(access_service) -> None:
+    access_service.ttl = 0
+    tenant = Tenant(id='1', name='Default')
+    user = User(id='1', username='johndoe', email='johndoe')
+    dominion = Dominion(id='1', name='Data Server')
+
+    assert await access_service._build_roles(
+        tenant, user, dominion) == ['admin|1']
+    await access_service.ranking_repository.remove(
+        await access_service.ranking_repository.search([]))
+    assert await access_service._build_roles(tenant, user, dominion) == []
+
+
+async def test_access_service_invalidate(access_service) -> None:
+    tenant = Tenant(id='1', name='Default')
+    dominion = Dominion(id='1', name='Data Server')
+    for user_id in ['1', '2']:
+        await access_service._build_roles(
+            tenant, User(id=user_id), dominion)
+    cache = access_service.roles_cache['1']
+
+    access_service.invalidate(user_ids=['2'])
+    assert list(cache) == [('1', '1')]
+
+    access_service.invalidate(role_ids=['1'])
+    assert list(cache) == []
+
+
+async def test_access_service_permissions_claim(
+        access_service, decision_service) -> None:
+    access_service.decision_service = decision_service
+    access_service.budget = 1024
+    await decision_service.policy_repository.add([
+        Policy(id='P1', role_id='1', resource='orders',
+               privilege='read', active=True),
+        Policy(id='P2', role_id='1', resource='orders',
+               privilege='write', active=True),
+        Policy(id='P3', role_id='1', resource='users',
+               privilege='read', active=True)])
+    await decision_service.restriction_repository.add(Restriction(
+        id='X1', policy_id='P2', name='Own', target='owner'))
+    tenant = Tenant(id='1', name='Default')
+    user = User(id='1', username='johndoe', email='johndoe')
+    dominion = Dominion(id='1', name='Data Server')
+
+    payload = await access_service._build_payload(tenant, user, dominion)
+
+    assert payload['permissions'] == 'orders:read,~write users:read'
+
+
+async def test_access_service_permissions_reference(
+        access_service, decision_service) -> None:
+    access_service.decision_service = decision_service
+    access_service.budget = 8
+    await decision_service.policy_repository.add(Policy(
+        id='P1', role_id='1', resource='orders', privilege='read',
+        active=True))
+    tenant = Tenant(id='1', name='Default')
+    user = User(id='1', username='johndoe', email='johndoe')
+    dominion = Dominion(id='1', name='Data Server')
+
+    payload = await access_service._build_payload(tenant, user, dominion)
+
+    assert 'permissions' not in payload
+    assert len(payload['permissions_ref']) == 16
@@ -0,0 +1,112 @@
+from pytest import fixture
+from authark.application.domain.models import Policy, Restriction
+from authark.application.domain.services import (
+    DecisionService, repository_batch)
+
+
+@fixture
+def service(decision_service) -> DecisionService:
+    decision_service.policy_repository.load({'default': {
+        'P1': Policy(id='P1', role_id='R1', resource='orders',
+                     privilege='read', active=True),
+        'P2': Policy(id='P2', role_id='R2', resource='orders',
+                     privilege='read', active=True),
+        'P3': Policy(id='P3', role_id='R3', resource='orders',
+                     privilege='read', active=False)}})
+    decision_service.restriction_repository.load({'default': {
+        'X2': Restriction(id='X2', policy_id='P1', sequence=2, name='Open',
+                          target='state', domain='[["open"]]'),
+        'X1': Restriction(id='X1', policy_id='P1', sequence=1, name='Own',
+                          target='owner', domain='[["own"]]')}})
+    return decision_service
+
+
+async def test_decision_service_decide(service) -> None:
+    decision = await service.decide(['R1'], 'orders', 'read')
+
+    assert decision['allowed'] is True
+    assert [[restriction['name'] for restriction in alternative]
+            for alternative in decision['restrictions']] == [
+                ['Own', 'Open']]
+
+
+async def test_decision_service_decide_unrestricted(service) -> None:
+    decision = await service.decide(['R1', 'R2'], 'orders', 'read')
+
+    assert decision == {'allowed': True, 'restrictions': []}
+
+
+async def test_decision_service_decide_denied(service) -> None:
+    assert (await service.decide(['R3'], 'orders', 'read'))[
+        'allowed'] is False
+    assert (await service.decide(['R1'], 'orders', 'write'))[
+        'allowed'] is False
+    assert (await service.decide([], 'orders', 'read'))[
+        'allowed'] is False
+
+
+async def test_decision_service_table_is_reused(service) -> None:
+    table = await service.table()
+
+    assert await service.table() is table
+
+
+async def test_decision_service_rebuilds_on_external_changes(
+        service) -> None:
+    table = await service.table()
+
+    await service.policy_repository.add(Policy(
+        id='P4', role_id='R4', resource='orders',
+        privilege='read', active=True))
+
+    assert await service.table() is not table
+    assert (await service.decide(['R4'], 'orders', 'read'))['allowed']
+
+
+async def test_decision_service_update(service) -> None:
+    table = await service.table()
+    versions = await service.versions()
+    restriction = Restriction(id='X1', policy_id='P1', sequence=3,
+                              name='Own', target='owner')
+    await service.restriction_repository.add(restriction)
+    await service.update(versions, restrictions=[restriction],
+                         policy_ids=['P2'])
+
+    assert await service.table() is table
+    decision = await service.decide(['R1', 'R2'], 'orders', 'read')
+    assert [[restriction['name'] for restriction in alternative]
+            for alternative in decision['restrictions']] == [
+                ['Open', 'Own']]
+
+
+async def test_decision_service_update_drops_stale_table(service) -> None:
+    await service.table()
+    # Another worker writes a policy the table doesn't know about.
+    await service.policy_repository.add(Policy(
+        id='P4', role_id='R4', resource='orders',
+        privilege='read', active=True))
+
+    versions = await service.versions()
+    policy = Policy(id='P5', role_id='R5', resource='orders',
+                    privilege='read', active=True)
+    await service.policy_repository.add(policy)
+    await service.update(versions, policies=[policy])
+
+    assert service.tables == {}
+    assert (await service.decide(['R4'], 'orders', 'read'))['allowed']
+    assert (await service.decide(['R5'], 'orders', 'read'))['allowed']
+
+
+async def test_decision_service_batch_tables_not_shared(service) -> None:
+    table = await service.table()
+    policy = Policy(id='P4', role_id='R1', resource='orders',
+                    privilege='write', active=True)
+
+    with repository_batch():
+        versions = await service.versions()
+        await service.policy_repository.add(policy)
+        await service.update(versions, policies=[policy])
+        assert service.tables == {}
+
+        assert (await service.table()) is not table
+        assert service.tables == {}
@@ -66,7 +66,8 @@ async def test_enrollment_servicer_register_duplicated_email_error(
     })
 
     with raises(UserCreationError):
-        await enrollment_service._validate_duplicates([user])
+        await enrollment_service.register(
+            [(new_user, Credential(value='PASS'))])
 
 async def test_enrollment_servicer_register_duplicated_username_error(
         enrollment_service):
@@ -83,7 +84,21 @@ async def test_enrollment_servicer_register_duplicated_username_error(
     })
 
     with raises(UserCreationError):
-        await enrollment_service._validate_duplicates([user])
+        await enrollment_service.register(
+            [(new_user, Credential(value='PASS'))])
+
+
+async def test_enrollment_servicer_register_duplicates_in_batch_error(
+        enrollment_service):
+    users = [User(username='twin', email=f'twin{index}@gmail.com')
+             for index in range(2)]
+
+    with raises(UserCreationError):
+        await enrollment_service.register(
+            [(user, Credential(value='PASS')) for user in users])
+
+    assert await enrollment_service.user_repository.search(
+        [('username', '=', 'twin')]) == []
 
 
 async def test_enrollment_service_deregister(enrollment_service):
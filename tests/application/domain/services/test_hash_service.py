@@ -31,3 +31,22 @@ def test_memory_hash_service_verify_password() -> None:
     assert result is True
     result = hash_service.verify_password("WRONG_PASSWORD", hashed_password)
     assert result is False
+
+
+async def test_memory_hash_service_asynchronous_methods() -> None:
+    hash_service = MemoryHashService()
+
+    hashed_password = await hash_service.agenerate_hash("SECRET_PASSWORD")
+    assert hashed_password == "HASHED: SECRET_PASSWORD"
+    assert await hash_service.averify_password(
+        "SECRET_PASSWORD", hashed_password) is True
+    assert await hash_service.averify_password(
+        "WRONG_PASSWORD", hashed_password) is False
+
+
+async def test_memory_hash_service_generate_hashes() -> None:
+    hash_service = MemoryHashService()
+
+    assert hash_service.generate_hashes(['A', 'B']) == [
+        'HASHED: A', 'HASHED: B']
+    assert await hash_service.agenerate_hashes(['C']) == ['HASHED: C']
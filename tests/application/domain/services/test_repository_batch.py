@@ -0,0 +1,78 @@
+from pytest import raises
+from authark.application.domain.services.repositories import (
+    RepositoryBatch, repository_batch, current_batch)
+
+
+class Participant:
+    def __init__(self, error: str = '') -> None:
+        self.calls = []
+        self.error = error
+
+    def validate(self) -> None:
+        self.calls.append('validate')
+        if self.error == 'validate':
+            raise ValueError('Invalid')
+
+    def commit(self) -> None:
+        self.calls.append('commit')
+        if self.error == 'commit':
+            raise ValueError('Failed')
+
+    def rollback(self) -> None:
+        self.calls.append('rollback')
+
+
+def test_repository_batch_enlist() -> None:
+    batch = RepositoryBatch()
+
+    participant = batch.enlist('key', Participant)
+
+    assert batch.enlist('key', Participant) is participant
+    assert batch.get('key') is participant
+    assert batch.get('missing') is None
+
+
+def test_repository_batch_commit() -> None:
+    assert current_batch() is None
+
+    with repository_batch() as batch:
+        assert current_batch() is batch
+        participant = batch.enlist('key', Participant)
+        with repository_batch() as nested:
+            assert nested is batch
+        assert participant.calls == []
+
+    assert participant.calls == ['validate', 'commit']
+    assert current_batch() is None
+
+
+def test_repository_batch_rollback() -> None:
+    with raises(ValueError):
+        with repository_batch() as batch:
+            participant = batch.enlist('key', Participant)
+            raise ValueError('Failed')
+
+    assert participant.calls == ['rollback']
+    assert batch.closed is True
+
+
+def test_repository_batch_commit_validates_first() -> None:
+    with raises(ValueError):
+        with repository_batch() as batch:
+            first = batch.enlist('first', Participant)
+            second = batch.enlist('second', lambda: Participant('validate'))
+
+    assert first.calls == ['validate', 'rollback']
+    assert second.calls == ['validate', 'rollback']
+
+
+def test_repository_batch_commit_failure() -> None:
+    with raises(ValueError):
+        with repository_batch() as batch:
+            first = batch.enlist('first', Participant)
+            second = batch.enlist('second', lambda: Participant('commit'))
+            third = batch.enlist('third', Participant)
+
+    assert first.calls == ['validate', 'commit']
+    assert second.calls == ['validate', 'commit', 'rollback']
+    assert third.calls == ['validate', 'rollback']
@@ -0,0 +1,158 @@
+from pytest import raises
+from authark.application.domain.common import DuplicateError
+from authark.application.domain.services.repositories import RepositoryIndex
+
+
+def build_index() -> RepositoryIndex:
+    index = RepositoryIndex(['username', 'email'])
+    index.add({'id': '1', 'username': 'valenep', 'email': 'valenep@x.com'})
+    index.add({'id': '2', 'username': 'tebanep', 'email': 'tebanep@x.com'})
+    index.add({'id': '3', 'username': 'gabeche', 'email': 'gabeche@x.com'})
+    return index
+
+
+def test_repository_index_lookup_equality() -> None:
+    index = build_index()
+
+    assert index.lookup([('username', '=', 'tebanep')]) == ['2']
+    assert index.lookup([('id', '=', '3')]) == ['3']
+    assert index.lookup([('username', '=', 'missing')]) == []
+
+
+def test_repository_index_lookup_in() -> None:
+    index = build_index()
+
+    assert index.lookup(
+        [('username', 'in', ['gabeche', 'valenep'])]) == ['1', '3']
+
+
+def test_repository_index_lookup_not_indexed() -> None:
+    index = build_index()
+
+    assert index.lookup([]) is None
+    assert index.lookup([('name', '=', 'Esteban')]) is None
+    assert index.lookup([('username', 'like', 'teb%')]) is None
+    assert index.lookup(['!', ('username', '=', 'tebanep')]) is None
+
+
+def test_repository_index_lookup_operators() -> None:
+    index = build_index()
+
+    assert index.lookup([('username', '=', 'tebanep'),
+                         ('name', '=', 'Esteban')]) == ['2']
+    assert index.lookup([('username', '=', 'tebanep'),
+                         ('email', '=', 'valenep@x.com')]) == []
+    assert index.lookup([
+        '|', ('username', '=', 'gabeche'),
+        ('email', '=', 'valenep@x.com')]) == ['1', '3']
+    assert index.lookup([
+        '|', ('username', '=', 'gabeche'),
+        ('name', '=', 'Valentina')]) is None
+
+
+def test_repository_index_extend() -> None:
+    index = build_index()
+
+    index.extend([
+        {'id': '0', 'username': 'esteban'},
+        {'id': '2', 'username': 'tebanep2'},
+        {'id': '4', 'username': 'valentina'}])
+
+    assert index.keys == ['0', '1', '2', '3', '4']
+    assert index.lookup([('username', '=', 'tebanep')]) == []
+    assert index.lookup([('username', 'in', [
+        'esteban', 'tebanep2', 'valentina'])]) == ['2', '0', '4']
+    assert list(index.scan([('id', '>', '1')])) == ['2', '3', '4']
+
+
+def test_repository_index_add_and_remove() -> None:
+    index = build_index()
+
+    index.add({'id': '2', 'username': 'esteban', 'email': 'tebanep@x.com'})
+    assert index.lookup([('username', '=', 'tebanep')]) == []
+    assert index.lookup([('username', '=', 'esteban')]) == ['2']
+
+    index.remove('2')
+    assert index.lookup([('email', '=', 'tebanep@x.com')]) == []
+    assert index.lookup([('id', 'in', ['1', '2', '3'])]) == ['1', '3']
+
+
+def test_repository_index_scan() -> None:
+    index = build_index()
+    index.add({'id': '0', 'username': 'tebanep'})
+
+    assert list(index.scan([])) == ['0', '1', '2', '3']
+    assert list(index.scan([('id', '>', '1')])) == ['2', '3']
+    assert list(index.scan([
+        ('id', '>', '0'), ('username', '=', 'tebanep')])) == ['2']
+
+    index.remove('2')
+    assert list(index.scan([('id', '>', '1')])) == ['3']
+
+
+def build_composite_index() -> RepositoryIndex:
+    index = RepositoryIndex(
+        ['user_id', ('user_id', 'role_id')], unique=[('user_id', 'role_id')])
+    index.add({'id': '1', 'user_id': 'U1', 'role_id': 'R1'})
+    index.add({'id': '2', 'user_id': 'U1', 'role_id': 'R2'})
+    index.add({'id': '3', 'user_id': 'U2', 'role_id': 'R1'})
+    return index
+
+
+def test_repository_index_lookup_composite() -> None:
+    index = build_composite_index()
+
+    assert index.lookup([('user_id', '=', 'U1'),
+                         ('role_id', '=', 'R2')]) == ['2']
+    assert index.lookup(['&', ('role_id', '=', 'R1'),
+                         ('user_id', 'in', ['U1', 'U2'])]) == ['1', '3']
+    assert index.lookup([('user_id', '=', 'U3'),
+                         ('role_id', '=', 'R1')]) == []
+    assert index.lookup([
+        '|', ('user_id', '=', 'U2'), ('role_id', '=', 'R2')]) is None
+    assert index.entries[('user_id', 'role_id')][('U1', 'R1')] == {
+        '1': None}
+
+
+def test_repository_index_ensure_unique() -> None:
+    index = build_composite_index()
+
+    index.ensure_unique([{'id': '1', 'user_id': 'U1', 'role_id': 'R1'},
+                         {'id': '4', 'user_id': 'U2', 'role_id': 'R2'},
+                         {'id': '5', 'user_id': '', 'role_id': 'R2'},
+                         {'id': '6', 'user_id': '', 'role_id': 'R2'}])
+    index.ensure_unique([{'id': '4', 'user_id': 'U1', 'role_id': 'R2'}],
+                        written={'2': None})
+
+    with raises(DuplicateError):
+        index.ensure_unique(
+            [{'id': '4', 'user_id': 'U1', 'role_id': 'R1'}])
+    with raises(DuplicateError):
+        index.ensure_unique(
+            [{'id': '4', 'user_id': 'U3', 'role_id': 'R1'},
+             {'id': '5', 'user_id': 'U3', 'role_id': 'R1'}])
+
+
+def test_repository_index_ensure_unique_swaps() -> None:
+    index = RepositoryIndex([], unique=['email'])
+    index.extend([{'id': '1', 'email': 'a@x.com'},
+                  {'id': '2', 'email': 'b@x.com'}])
+    records = {'1': {'id': '1', 'email': 'b@x.com'},
+               '2': {'id': '2', 'email': 'a@x.com'}}
+
+    index.ensure_unique(records.values(), records)
+
+    with raises(DuplicateError):
+        index.ensure_unique([records['1']])
+
+
+def test_repository_index_relaxes_duplicated_unique_fields() -> None:
+    index = RepositoryIndex([], unique=['username', 'email'])
+    index.extend([{'id': '1', 'username': 'a', 'email': 'a@x.com'},
+                  {'id': '2', 'username': 'b', 'email': 'a@x.com'}])
+
+    assert index.relaxed == ['email']
+    assert index.unique == ['username']
+    index.ensure_unique([{'id': '3', 'username': 'c', 'email': 'a@x.com'}])
+    with raises(DuplicateError):
+        index.ensure_unique([{'id': '3', 'username': 'a'}])
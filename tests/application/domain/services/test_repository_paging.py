@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from pytest import raises
+from authark.application.domain.common import QueryError
+from authark.application.domain.services.repositories import (
+    paginate, parse_order)
+
+
+def build_items():
+    return [SimpleNamespace(id=str(index), name=name, rank=rank)
+            for index, (name, rank) in enumerate([
+                ('c', 1), ('a', 2), ('b', 1), ('d', 3)])]
+
+
+def test_parse_order() -> None:
+    assert parse_order('name') == [('name', False)]
+    assert parse_order('rank desc, name ASC') == [
+        ('rank', True), ('name', False)]
+    with raises(QueryError):
+        parse_order('name,')
+    with raises(QueryError):
+        parse_order('name sideways')
+
+
+def test_paginate_without_order() -> None:
+    items = build_items()
+
+    assert paginate(iter(items)) == items
+    assert paginate(iter(items), 2) == items[:2]
+    assert paginate(iter(items), 2, 3) == items[3:]
+
+
+def test_paginate_stops_early_without_order() -> None:
+    consumed = []
+
+    def generate():
+        for item in build_items():
+            consumed.append(item)
+            yield item
+
+    assert len(paginate(generate(), 1, 1)) == 1
+    assert len(consumed) == 2
+
+
+def test_paginate_orders_before_slicing() -> None:
+    items = build_items()
+
+    result = paginate(iter(items), 2, order='name')
+    assert [item.name for item in result] == ['a', 'b']
+
+    result = paginate(iter(items), 2, 1, order='name desc')
+    assert [item.name for item in result] == ['c', 'b']
+
+    result = paginate(iter(items), order='rank, name desc')
+    assert [item.name for item in result] == ['c', 'b', 'a', 'd']
+
+
+def test_paginate_orders_none_values_last() -> None:
+    items = build_items()
+    items[1].rank = None
+
+    result = paginate(iter(items), order='rank, name')
+    assert [item.name for item in result] == ['b', 'c', 'd', 'a']
+
+    result = paginate(iter(items), order='rank desc')
+    assert [item.name for item in result][0] == 'a'
+
+
+def test_paginate_unknown_order_field() -> None:
+    with raises(QueryError):
+        paginate(iter(build_items()), order='missing')
@@ -11,8 +11,8 @@ def test_verification_service_generate_token(
 
     assert isinstance(token, Token)
     assert token.value == (
-        '{"type": "activation", "tenant": "default", '
-        '"tid": "1", "uid": "1", "temail": "gabeche@gmail.com"}')
+        '{"type":"activation","tenant":"default",'
+        '"tid":"1","uid":"1","temail":"gabeche@gmail.com"}')
 
 def test_verification_service_generate_token_tenant(
     verification_service) -> None:
@@ -22,8 +22,8 @@ def test_verification_service_generate_token_tenant(
 
     assert isinstance(token, Token)
     assert token.value == (
-        '{"type": "reset", "tenant": "default", '
-        '"tid": "1", "temail": "default@example.com"}')
+        '{"type":"reset","tenant":"default",'
+        '"tid":"1","temail":"default@example.com"}')
 
 async def test_verification_service_verify(verification_service) -> None:
     verification_dict = {
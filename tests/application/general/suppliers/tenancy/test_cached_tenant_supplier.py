@@ -0,0 +1,69 @@
+from pytest import fixture, raises
+from authark.application.general import (
+    TenantSupplier, MemoryTenantSupplier, CachedTenantSupplier)
+
+
+class CountingTenantSupplier(MemoryTenantSupplier):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_tenant(self, tenant_id):
+        self.calls += 1
+        return super().get_tenant(tenant_id)
+
+    def resolve_tenant(self, name):
+        self.calls += 1
+        return super().resolve_tenant(name)
+
+
+@fixture
+def supplier() -> CountingTenantSupplier:
+    supplier = CountingTenantSupplier()
+    supplier.create_tenant({'id': '001', 'name': 'Knowark'})
+    return supplier
+
+
+@fixture
+def tenant_supplier(supplier) -> CachedTenantSupplier:
+    return CachedTenantSupplier(supplier)
+
+
+def test_cached_tenant_supplier_instantiation(tenant_supplier) -> None:
+    assert isinstance(tenant_supplier, TenantSupplier)
+
+
+def test_cached_tenant_supplier_resolve_tenant(
+        tenant_supplier, supplier) -> None:
+    assert tenant_supplier.resolve_tenant('knowark')['id'] == '001'
+    assert tenant_supplier.resolve_tenant('knowark')['id'] == '001'
+    assert tenant_supplier.get_tenant('001')['slug'] == 'knowark'
+    assert supplier.calls == 1
+
+    tenant = tenant_supplier.resolve_tenant('knowark')
+    tenant['name'] = 'Changed'
+    assert tenant_supplier.resolve_tenant('knowark')['name'] == 'Knowark'
+
+
+def test_cached_tenant_supplier_negative_lookups(
+        tenant_supplier, supplier) -> None:
+    for _ in range(3):
+        with raises(Exception):
+            tenant_supplier.resolve_tenant('missing')
+    assert supplier.calls == 1
+
+    tenant_supplier.create_tenant({'id': '002', 'name': 'Missing'})
+    assert tenant_supplier.resolve_tenant('missing')['id'] == '002'
+    assert supplier.calls == 2
+
+
+def test_cached_tenant_supplier_expiration(tenant_supplier, supplier) -> None:
+    tenant_supplier.ttl = 0
+    tenant_supplier.resolve_tenant('knowark')
+    tenant_supplier.resolve_tenant('knowark')
+    assert supplier.calls == 2
+
+
+def test_cached_tenant_supplier_search_tenants(tenant_supplier) -> None:
+    [tenant] = tenant_supplier.search_tenants([])
+    assert tenant['id'] == '001'
@@ -14,8 +14,10 @@ from authark.application.domain.services.repositories import (
     PolicyRepository, MemoryPolicyRepository)
 from authark.application.general.suppliers.tenancy import (
     TenantSupplier,MemoryTenantSupplier)
+from authark.application.domain.services import DecisionService
 from authark.application.operation.informers import (
-    StandardInformer, ComposingInformer, TenantInformer)
+    StandardInformer, ComposingInformer, TenantInformer,
+    SecurityInformer)
 
 
 @fixture
@@ -161,3 +163,13 @@ def composing_informer(dominion_repository: DominionRepository,
 def tenant_informer(tenant_supplier: TenantSupplier,
                      ) -> TenantInformer:
     return TenantInformer(tenant_supplier)
+
+
+@fixture
+def security_informer(ranking_repository: RankingRepository,
+                      restriction_repository: RestrictionRepository,
+                      policy_repository: PolicyRepository,
+                      auth_provider: AuthProvider) -> SecurityInformer:
+    return SecurityInformer(ranking_repository, DecisionService(
+        policy_repository, restriction_repository, auth_provider),
+        auth_provider)
@@ -0,0 +1,42 @@
+from authark.application.domain.common import User as CUser
+from authark.application.domain.models import Policy, Restriction
+from authark.application.operation.informers import SecurityInformer
+
+
+async def test_security_informer_authorize(
+        security_informer: SecurityInformer) -> None:
+    await security_informer.decision_service.policy_repository.add(Policy(
+        id='2', role_id='1', resource='orders', privilege='read',
+        active=True))
+    await security_informer.decision_service.restriction_repository.add(
+        Restriction(id='2', policy_id='2', name='Own', target='owner',
+                    domain='[["owner", "=", ">>UID"]]'))
+
+    result = (await security_informer.authorize({
+        "meta": {"user_id": "1"},
+        "data": [{"resource": "orders", "privilege": "read"},
+                 {"resource": "orders", "privilege": "write"}]
+    }))['data']
+
+    assert result == [
+        {'resource': 'orders', 'privilege': 'read', 'allowed': True,
+         'restrictions': [[{'name': 'Own', 'target': 'owner',
+                            'domain': '[["owner", "=", ">>UID"]]'}]]},
+        {'resource': 'orders', 'privilege': 'write', 'allowed': False,
+         'restrictions': []}]
+
+
+async def test_security_informer_authorize_token_roles(
+        security_informer: SecurityInformer) -> None:
+    await security_informer.decision_service.policy_repository.add(Policy(
+        id='2', role_id='1', resource='orders', privilege='read',
+        active=True))
+    security_informer.auth_provider.setup(CUser(
+        tid='T1', tenant='default', roles=['admin|1']))
+
+    [result] = (await security_informer.authorize({
+        "data": [{"resource": "orders", "privilege": "read"}]
+    }))['data']
+
+    assert result['allowed'] is True
+    assert result['restrictions'] == []
@@ -55,3 +55,40 @@ async def test_standard_informer_join_users_and_roles(
     assert len(items['data']) == 3
     assert items['data'][0][0]['id'] == '1'
     assert items['data'][0][1][0]['name'] == 'admin'
+
+
+async def test_standard_informer_search_paginated(
+        standard_informer: StandardInformer) -> None:
+    domain: QueryDomain = []
+    users = await standard_informer.search(
+        {'meta': dict(model='user', domain=domain, limit=2, offset=1,
+                      order='username desc')})
+    assert [user['username'] for user in users['data']] == [
+        'tebanep', 'gabeche']
+
+
+async def test_standard_informer_search_cursor(
+        standard_informer: StandardInformer) -> None:
+    domain: QueryDomain = []
+    users = await standard_informer.search(
+        {'meta': dict(model='user', domain=domain, limit=2, after='')})
+    assert [user['id'] for user in users['data']] == ['1', '2']
+    assert users['cursor'] == '2'
+
+    users = await standard_informer.search(
+        {'meta': dict(model='user', domain=domain, limit=2,
+                      after=users['cursor'])})
+    assert [user['id'] for user in users['data']] == ['3']
+    assert users['cursor'] == ''
+
+
+async def test_standard_informer_version(
+        standard_informer: StandardInformer) -> None:
+    meta = {'meta': dict(model='role')}
+    version = (await standard_informer.version(meta))['data']
+    assert (await standard_informer.version(meta))['data'] == version
+
+    [role] = await standard_informer.role_repository.search([])
+    await standard_informer.role_repository.add(role)
+
+    assert (await standard_informer.version(meta))['data'] != version
@@ -238,3 +238,41 @@ async def test_auth_manager_fail_to_authenticate_missing_credentials(
     }
     with raises(AuthError):
         await auth_manager.authenticate(request_dict)
+
+
+async def test_auth_manager_refresh_authenticate_legacy_token(auth_manager):
+    refresh_token = '{"type": "refresh_token", "sub": "1"}'
+    credential_repository = auth_manager.credential_repository
+    credential_repository.data['default']['4'] = Credential(
+        id='4', user_id='1', value=refresh_token, type='refresh_token',
+        key='LEGACY')
+
+    tokens = (await auth_manager.authenticate({
+        "meta": {},
+        "data": {
+            "dominion": "default",
+            "tenant": "default",
+            "refresh_token": refresh_token
+        }
+    }))['data']
+
+    assert 'access_token' in tokens.keys()
+
+
+async def test_generate_refresh_token_rotates_in_place(auth_manager):
+    user_id = '1'
+    client = 'mobile'
+    credential_repository = auth_manager.credential_repository
+    for key in ['4', '5']:
+        credential_repository.data['default'][key] = Credential(
+            id=key, user_id=user_id, value=f"PREVIOUS_{key}",
+            type='refresh_token', client=client)
+
+    refresh_token = await auth_manager._generate_refresh_token(
+        user_id, client)
+
+    [credential] = await credential_repository.search([
+        ('user_id', '=', user_id), ('type', '=', 'refresh_token')])
+    assert credential.id == '4'
+    assert credential.value == refresh_token
+    assert credential.key == Credential.lookup(refresh_token)
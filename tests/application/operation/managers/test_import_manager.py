@@ -1,4 +1,4 @@
-from authark.application.domain.models import User
+from authark.application.domain.models import User, Credential
 from authark.application.operation.managers import ImportManager
 
 
@@ -17,8 +17,46 @@ async def test_import_manager_import_users(import_manager) -> None:
         })
 
 
-async def test_import_manager_create_ranking_no_role(import_manager):
-    user = User(username='Dummy', email='dummy@example.com')
-    await import_manager._create_ranking(None, user)
-    assert len(getattr(import_manager.ranking_repository, 'data')[
-               'default']) == 2
+async def test_import_manager_import_users_duplicate_email(
+        import_manager) -> None:
+    import_manager.import_service.users = [
+        (User(username='valenep2', email='tebanep@gmail.com'),
+         Credential(value='secret'), []),
+        (User(username='newuser', email='newuser@gmail.com'), None, [])]
+
+    result = await import_manager.import_users({
+        "meta": {},
+        "data": {
+            "filepath": "",
+            "source": "erp.users",
+            "password_field": "password"
+        }
+    })
+
+    assert result == {"data": {"skipped": ['valenep2']}}
+    users = await import_manager.user_repository.search([])
+    assert sorted(user.username for user in users) == [
+        'gabeche', 'newuser', 'tebanep', 'valenep']
+
+
+async def test_import_manager_import_users_in_bulk(import_manager) -> None:
+    await import_manager.import_users({
+        "meta": {},
+        "data": {
+            "filepath": "",
+            "source": "erp.users",
+            "password_field": "password"
+        }
+    })
+
+    users = await import_manager.user_repository.search(
+        [('username', '=', 'mariod@test.com')])
+    assert len(users) == 1
+    credentials = await import_manager.credential_repository.search(
+        [('user_id', '=', users[0].id)])
+    assert [credential.value for credential in credentials] == [
+        'HASHED: PASS2']
+    rankings = await import_manager.ranking_repository.search(
+        [('role_id', '=', '1')])
+    assert sorted(ranking.user_id for ranking in rankings) == [
+        '1', '2', users[0].id]
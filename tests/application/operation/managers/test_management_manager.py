@@ -1,3 +1,4 @@
+from authark.application.domain.models import User, Tenant, Dominion
 from authark.application.domain.common import RecordList
 
 
@@ -72,6 +73,22 @@ async def test_management_manager_assign_role_duplicate(management_manager):
     assert len(management_manager.ranking_repository.data['default']) == 2
 
 
+async def test_management_manager_assign_role_bulk_duplicates(
+        management_manager):
+    ranking_dicts = [{'user_id': '1', 'role_id': '1'},
+                     {'user_id': '3', 'role_id': '1'},
+                     {'user_id': '3', 'role_id': '1'}]
+    await management_manager.assign_role({
+        "meta": {},
+        "data": ranking_dicts
+    })
+    rankings = management_manager.ranking_repository.data['default']
+    assert len(rankings) == 3
+    assert sorted((ranking.user_id, ranking.role_id)
+                  for ranking in rankings.values()) == [
+                      ('1', '1'), ('2', '1'), ('3', '1')]
+
+
 async def test_management_manager_deassign_role(management_manager):
     ranking_ids = ['1']
     await management_manager.deassign_role({
@@ -79,3 +96,28 @@ async def test_management_manager_deassign_role(management_manager):
         "data": ranking_ids
     })
     assert len(management_manager.ranking_repository.data['default']) == 1
+
+
+async def test_management_manager_invalidates_roles(management_manager):
+    access_service = management_manager.access_service
+    tenant = Tenant(id='1', name='Default')
+    user = User(id='3', username='gabeche')
+    dominion = Dominion(id='1', name='Data Server')
+
+    assert await access_service._build_roles(tenant, user, dominion) == []
+
+    await management_manager.assign_role({
+        "meta": {}, "data": [{'user_id': '3', 'role_id': '1'}]})
+    assert await access_service._build_roles(
+        tenant, user, dominion) == ['admin|1']
+
+    await management_manager.create_role({"meta": {}, "data": [{
+        "id": '1', "name": 'owner', "dominion_id": '1'}]})
+    assert await access_service._build_roles(
+        tenant, user, dominion) == ['owner|1']
+
+    [ranking] = await management_manager.ranking_repository.search(
+        [('user_id', '=', '3')])
+    await management_manager.deassign_role({
+        "meta": {}, "data": [ranking.id]})
+    assert await access_service._build_roles(tenant, user, dominion) == []
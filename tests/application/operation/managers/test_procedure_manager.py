@@ -46,13 +46,13 @@ async def test_procedure_manager_fulfill(procedure_manager):
         'recipient': 'gabeche@gmail.com',
         'owner': 'gabeche',
         'authorization': (
-            '{"type": "authorization", "tenant": "anonymous",'
-            ' "tid": "", "uid": "", "name": "", "email": ""}'),
+            '{"type":"authorization","tenant":"anonymous",'
+            '"tid":"","uid":"","name":"","email":""}'),
         'context': {
                  'multiple_links':(
                      '<a href="http://dash.example.local/login/'
-                     'reset?verification_token={"type": "reset", '
-                     '"tenant": "default", "tid": "001", "temail": '
+                     'reset?verification_token={"type":"reset",'
+                     '"tenant":"default","tid":"001","temail":'
                      '"gabeche@gmail.com"}">Default</a><br>'),
                  'unsubscribe_link': 'unsubscribe_link.com',
                  'user_name': 'gabeche',
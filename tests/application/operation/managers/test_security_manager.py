@@ -61,3 +61,21 @@ async def test_management_manager_remove_policy(security_manager):
     })
     assert len(security_manager.policy_repository.data[
         'default']) == 1
+
+
+async def test_security_manager_updates_decisions(security_manager):
+    decision_service = security_manager.decision_service
+    table = await decision_service.table()
+
+    await security_manager.create_policy({
+        "meta": {},
+        "data": [{"id": "2", "role_id": "1", "resource": "orders",
+                  "privilege": "read", "active": True}]
+    })
+    decision = await decision_service.decide(['1'], 'orders', 'read')
+    assert decision['allowed'] is True
+
+    await security_manager.remove_policy({"meta": {}, "data": ['2']})
+    decision = await decision_service.decide(['1'], 'orders', 'read')
+    assert decision['allowed'] is False
+    assert await decision_service.table() is table
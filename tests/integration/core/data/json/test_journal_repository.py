@@ -0,0 +1,138 @@
+import asyncio
+from pathlib import Path
+from pytest import fixture
+from authark.application.domain.common import (
+    QueryParser, StandardAuthProvider, User as CUser, codec)
+from authark.application.domain.models import Credential
+from authark.integration.core.data import (
+    JsonCommitter, JournalCredentialRepository)
+
+
+@fixture
+def auth_provider() -> StandardAuthProvider:
+    auth_provider = StandardAuthProvider()
+    auth_provider.setup(CUser(id='001', tid='001', tenant='default'))
+    return auth_provider
+
+
+def build_repository(path, auth_provider,
+                     **options) -> JournalCredentialRepository:
+    return JournalCredentialRepository(
+        str(path), QueryParser(), auth_provider,
+        committer=JsonCommitter(), **options)
+
+
+def journal(repository) -> Path:
+    return Path(f'{repository.file_path}.journal')
+
+
+def stored_ids(repository) -> list:
+    content = codec.loads(repository.file_path.read_text() or '{}')
+    return sorted(content.get('credentials', {}))
+
+
+async def test_journal_repository_appends_records(tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider)
+
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+    await repository.add(Credential(id='2', user_id='2', value='B'))
+    await repository.remove(Credential(id='1', value='X'))
+
+    assert stored_ids(repository) == []
+    lines = journal(repository).read_text().splitlines()
+    assert [codec.loads(line)[0] for line in lines] == ['1', '2', '1']
+    assert codec.loads(lines[-1])[1] is None
+
+    result = await repository.search([('user_id', '=', '2')])
+    assert [credential.id for credential in result] == ['2']
+
+
+async def test_journal_repository_rebuilds_from_journal(
+        tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider)
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+    await repository.add(Credential(id='2', user_id='2', value='B'))
+
+    # Another process appends to the journal in the meantime.
+    other = build_repository(tmp_path, auth_provider)
+    await other.remove(Credential(id='2', value='X'))
+    await other.add(Credential(id='3', user_id='3', value='C'))
+
+    restarted = build_repository(tmp_path, auth_provider)
+    for instance in (repository, restarted):
+        result = await instance.search([])
+        assert [credential.id for credential in result] == ['1', '3']
+
+
+async def test_journal_repository_skips_partial_records(
+        tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider)
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+    with journal(repository).open('a') as file:
+        file.write('["2", {"id": "2", "user_')
+
+    restarted = build_repository(tmp_path, auth_provider)
+    assert await restarted.count() == 1
+
+    await restarted.add(Credential(id='3', user_id='3', value='C'))
+
+    lines = journal(restarted).read_text().splitlines()
+    assert [codec.loads(line)[0] for line in lines] == ['1', '3']
+    assert await build_repository(tmp_path, auth_provider).count() == 2
+
+
+async def test_journal_repository_compacts_in_background(
+        tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider, threshold=200)
+    reader = build_repository(tmp_path, auth_provider)
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+    assert await reader.count() == 1
+    version = await reader.version()
+
+    await repository.add(Credential(id='2', user_id='2', value='B'))
+
+    while repository.compacting:
+        await asyncio.sleep(0.01)
+
+    assert stored_ids(repository) == ['1', '2']
+    assert journal(repository).read_text() == ''
+    assert await reader.version() != version
+
+    await repository.remove(Credential(id='1', value='X'))
+    for instance in (repository, reader):
+        result = await instance.search([])
+        assert [credential.id for credential in result] == ['2']
+
+
+async def test_journal_repository_compact(tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider)
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+
+    repository.compact()
+
+    assert stored_ids(repository) == ['1']
+    assert journal(repository).read_text() == ''
+    assert await repository.count() == 1
+
+
+
+async def test_journal_repository_compact_keeps_concurrent_writes(
+        tmp_path, auth_provider, monkeypatch):
+    repository = build_repository(tmp_path, auth_provider)
+    await repository.add(Credential(id='1', user_id='1', value='A'))
+    key, record = codec.loads(journal(repository).read_text())
+    stage = repository.committer.stage
+
+    def concurrent_stage(path, content):
+        # Another process appends while the file is being rewritten.
+        with journal(repository).open('a') as file:
+            file.write(f"{codec.dumps(['2', {**record, 'id': '2'}])}\n")
+        return stage(path, content)
+
+    monkeypatch.setattr(repository.committer, 'stage', concurrent_stage)
+    repository.compact()
+
+    assert stored_ids(repository) == ['1']
+    assert codec.loads(journal(repository).read_text())[0] == '2'
+    result = await build_repository(tmp_path, auth_provider).search([])
+    assert sorted(credential.id for credential in result) == ['1', '2']
@@ -0,0 +1,127 @@
+import asyncio
+from pytest import fixture, raises
+from authark.application.domain.common import (
+    QueryParser, StandardAuthProvider, User as CUser, DuplicateError,
+    codec)
+from authark.application.domain.models import Role, User
+from authark.integration.core.data import (
+    JsonCommitter, JsonRoleRepository, JsonUserRepository)
+
+
+@fixture
+def auth_provider() -> StandardAuthProvider:
+    auth_provider = StandardAuthProvider()
+    auth_provider.setup(CUser(id='001', tid='001', tenant='default'))
+    return auth_provider
+
+
+def build_repository(path, auth_provider, **options) -> JsonRoleRepository:
+    return JsonRoleRepository(
+        str(path), QueryParser(), auth_provider,
+        committer=JsonCommitter(**options))
+
+
+def stored_ids(repository) -> list:
+    content = codec.loads(repository.file_path.read_text() or '{}')
+    return sorted(content.get(repository.collection, {}))
+
+
+async def test_json_committer_groups_writes(tmp_path, auth_provider):
+    repository = build_repository(tmp_path, auth_provider, delay=0.05)
+
+    await repository.add(Role(id='1', name='admin'))
+    version = await repository.version()
+    await repository.add(Role(id='2', name='editor'))
+    await repository.remove(Role(id='1', name='admin'))
+
+    assert stored_ids(repository) == []
+    assert await repository.version() != version
+    assert [user.id for user in await repository.search([])] == ['2']
+    assert await repository.count([('name', '=', 'editor')]) == 1
+
+    await asyncio.sleep(0.1)
+
+    assert stored_ids(repository) == ['2']
+    assert repository.committer.groups == {}
+    assert [user.id for user in await repository.search([])] == ['2']
+
+
+async def test_json_committer_flushes_on_size(tmp_path, auth_provider):
+    repository = build_repository(
+        tmp_path, auth_provider, delay=60, size=2)
+
+    await repository.add(Role(id='1', name='admin'))
+    assert stored_ids(repository) == []
+
+    await repository.add(Role(id='2', name='editor'))
+    assert stored_ids(repository) == ['1', '2']
+    assert repository.committer.timers == {}
+
+
+async def test_json_committer_flush(tmp_path, auth_provider):
+    repository = build_repository(
+        tmp_path, auth_provider, delay=60, fsync=True)
+
+    await repository.add(Role(id='1', name='admin'))
+    repository.committer.flush()
+
+    assert stored_ids(repository) == ['1']
+    assert sorted(path.name for path in repository.file_path.parent
+                  .iterdir()) == ['roles.json', 'roles.json.lock']
+
+
+async def test_json_committer_write_failure(tmp_path):
+    committer = JsonCommitter()
+    path = tmp_path / 'missing' / 'users.json'
+
+    with raises(FileNotFoundError):
+        committer.write(str(path), '{}')
+
+    stat = committer.write(str(tmp_path / 'users.json'), '{}')
+
+    assert stat.st_size == 2
+    assert [path.name for path in tmp_path.iterdir()] == ['users.json']
+
+
+async def test_json_committer_retries_failed_groups(
+        tmp_path, auth_provider, monkeypatch):
+    repository = build_repository(tmp_path, auth_provider, delay=0.05)
+    committer = repository.committer
+    write, failures = committer.write, []
+
+    def fail(path, content):
+        monkeypatch.setattr(committer, 'write', write)
+        failures.append(path)
+        raise OSError('No space left on device')
+
+    await repository.add(Role(id='1', name='admin'))
+    monkeypatch.setattr(committer, 'write', fail)
+    while not failures:
+        await asyncio.sleep(0.01)
+
+    assert stored_ids(repository) == []
+    assert [user.id for user in await repository.search([])] == ['1']
+    assert committer.timers
+
+    while committer.groups:
+        await asyncio.sleep(0.01)
+
+    assert stored_ids(repository) == ['1']
+
+
+async def test_json_committer_skips_unique_collections(
+        tmp_path, auth_provider):
+    repository = JsonUserRepository(
+        str(tmp_path), QueryParser(), auth_provider,
+        committer=JsonCommitter(delay=60))
+    other = JsonUserRepository(
+        str(tmp_path), QueryParser(), auth_provider)
+
+    await repository.add(User(id='1', username='valenep'))
+    assert stored_ids(repository) == ['1']
+    assert repository.committer.groups == {}
+
+    await other.add(User(id='2', username='tebanep'))
+    with raises(DuplicateError):
+        await repository.add(User(id='3', username='tebanep'))
+    assert stored_ids(repository) == ['1', '2']
@@ -44,8 +44,9 @@ def test_json_import_service_instantiation(json_import_service):
     assert isinstance(json_import_service, JsonImportService)
 
 
-def test_json_import_service_import_users(json_import_service, file):
-    user_list = json_import_service.import_users(
+async def test_json_import_service_import_users(
+        json_import_service, file):
+    user_list = await json_import_service.import_users(
         file, "Source changed", "password")
 
     assert len(user_list) == 3
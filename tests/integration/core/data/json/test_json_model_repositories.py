@@ -0,0 +1,252 @@
+from json import loads, dumps
+from pytest import fixture, raises
+from authark.application.domain.common import (
+    QueryParser, StandardAuthProvider, User as CUser, DuplicateError)
+from authark.application.domain.models import User, Credential
+from authark.application.domain.services.repositories import (
+    repository_batch)
+from authark.integration.core.data import (
+    JsonUserRepository, JsonCredentialRepository)
+
+
+@fixture
+def auth_provider() -> StandardAuthProvider:
+    auth_provider = StandardAuthProvider()
+    auth_provider.setup(CUser(id='001', tid='001', tenant='default'))
+    return auth_provider
+
+
+@fixture
+def user_repository(tmp_path, auth_provider) -> JsonUserRepository:
+    return JsonUserRepository(str(tmp_path), QueryParser(), auth_provider)
+
+
+@fixture
+def credential_repository(
+        tmp_path, auth_provider) -> JsonCredentialRepository:
+    return JsonCredentialRepository(
+        str(tmp_path), QueryParser(), auth_provider)
+
+
+async def test_json_user_repository_add_and_search(user_repository):
+    await user_repository.add([
+        User(id='1', username='valenep', email='valenep@gmail.com'),
+        User(id='2', username='tebanep', email='tebanep@gmail.com')])
+
+    [user] = await user_repository.search([('username', '=', 'tebanep')])
+    assert user.id == '2'
+
+    users = await user_repository.search(
+        [('email', 'in', ['valenep@gmail.com', 'tebanep@gmail.com'])])
+    assert [user.id for user in users] == ['1', '2']
+
+    assert await user_repository.count([('username', '=', 'valenep')]) == 1
+    assert await user_repository.count() == 2
+
+
+async def test_json_user_repository_update_index(user_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+    [user] = await user_repository.search([('username', '=', 'valenep')])
+
+    user.username = 'valentina'
+    await user_repository.add(user)
+
+    assert await user_repository.search(
+        [('username', '=', 'valenep')]) == []
+    [user] = await user_repository.search([('username', '=', 'valentina')])
+    assert user.id == '1'
+
+
+async def test_json_user_repository_remove(user_repository):
+    users = await user_repository.add([
+        User(id='1', username='valenep'), User(id='2', username='tebanep')])
+
+    assert await user_repository.remove(users[0]) is True
+    assert await user_repository.remove(users[0]) is False
+    assert await user_repository.search([('username', '=', 'valenep')]) == []
+
+    data = loads(user_repository.file_path.read_text())
+    assert list(data['users']) == ['2']
+
+
+async def test_json_user_repository_external_changes(user_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+    assert len(await user_repository.search([])) == 1
+
+    data = loads(user_repository.file_path.read_text())
+    data['users']['2'] = vars(User(id='2', username='tebanep'))
+    user_repository.file_path.write_text(dumps(data, indent=4))
+
+    [user] = await user_repository.search([('username', '=', 'tebanep')])
+    assert user.id == '2'
+
+
+async def test_json_user_repository_search_isolation(user_repository):
+    await user_repository.add(User(
+        id='1', username='valenep', attributes={'site': '1'}))
+
+    [user] = await user_repository.search([('id', '=', '1')])
+    user.attributes['site'] = '2'
+
+    [user] = await user_repository.search([('id', '=', '1')])
+    assert user.attributes['site'] == '1'
+
+
+async def test_json_credential_repository_search(credential_repository):
+    await credential_repository.add([
+        Credential(id='1', user_id='1', value='HASHED: PASS1'),
+        Credential(id='2', user_id='1', value='TOKEN',
+                   type='refresh_token'),
+        Credential(id='3', user_id='2', value='HASHED: PASS2')])
+
+    [credential] = await credential_repository.search([
+        ('user_id', '=', '1'), ('type', '=', 'password')])
+    assert credential.id == '1'
+
+    [credential] = await credential_repository.search(
+        [('value', '=', 'TOKEN')])
+    assert credential.id == '2'
+
+
+async def test_json_user_repository_search_keyset(user_repository):
+    await user_repository.add([
+        User(id=key, username=f'user{key}') for key in 'dbeac'])
+
+    users = await user_repository.search([], 2, order='id')
+    assert [user.id for user in users] == ['a', 'b']
+
+    users = await user_repository.search([('id', '>', 'b')], 2, order='id')
+    assert [user.id for user in users] == ['c', 'd']
+
+    await user_repository.remove(User(id='d'))
+    users = await user_repository.search(
+        [('id', '>', 'b'), ('username', '!=', 'userc')], 2, order='id')
+    assert [user.id for user in users] == ['e']
+
+
+async def test_json_user_repository_version(user_repository):
+    initial = await user_repository.version()
+
+    await user_repository.add(User(id='1', username='valenep'))
+    added = await user_repository.version()
+
+    assert added != initial
+    assert await user_repository.version() == added
+
+    await user_repository.remove(User(id='1'))
+
+    assert await user_repository.version() != added
+
+
+async def test_json_user_repository_batch(user_repository):
+    await user_repository.add([
+        User(id='1', username='valenep'), User(id='2', username='tebanep')])
+    content = user_repository.file_path.read_text()
+
+    with repository_batch():
+        await user_repository.add(User(id='3', username='gabeche'))
+        assert await user_repository.remove(User(id='1')) is True
+        assert await user_repository.remove(User(id='1')) is False
+
+        assert user_repository.file_path.read_text() == content
+        assert [user.id for user in await user_repository.search(
+            [], order='id')] == ['2', '3']
+        assert await user_repository.count(
+            [('username', '=', 'gabeche')]) == 1
+
+    assert [user.id for user in await user_repository.search(
+        [], order='id')] == ['2', '3']
+    assert user_repository.file_path.read_text() != content
+
+
+async def test_json_user_repository_batch_rollback(user_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+
+    with raises(ValueError):
+        with repository_batch():
+            await user_repository.add(User(id='2', username='tebanep'))
+            raise ValueError('Failed')
+
+    assert [user.id for user in await user_repository.search([])] == ['1']
+
+
+async def test_json_repository_batch_validates_before_writing(
+        credential_repository, user_repository):
+    with raises(DuplicateError):
+        with repository_batch():
+            await credential_repository.add(
+                Credential(id='1', user_id='1', value='X'))
+            await user_repository.add(User(id='1', username='valenep'))
+            # Another process takes the username in the meantime.
+            user_repository.file_path.write_text(dumps({'users': {
+                '2': {'id': '2', 'username': 'valenep'}}}))
+
+    assert await credential_repository.count() == 0
+    assert [user.id for user in await user_repository.search([])] == ['2']
+
+
+async def test_json_user_repository_batch_version(user_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+    initial = await user_repository.version()
+
+    with raises(ValueError):
+        with repository_batch():
+            await user_repository.add(User(id='2', username='tebanep'))
+            pending = await user_repository.version()
+            assert pending != initial
+            raise ValueError('Failed')
+
+    assert await user_repository.version() == initial
+
+
+async def test_json_user_repository_unique(user_repository):
+    await user_repository.add([
+        User(id='1', username='valenep', email='valenep@gmail.com'),
+        User(id='2', username='tebanep')])
+
+    with raises(DuplicateError):
+        await user_repository.add(User(id='3', username='valenep'))
+    with raises(DuplicateError):
+        await user_repository.add([
+            User(id='3', username='gabeche', email='gabeche@gmail.com'),
+            User(id='4', username='gabriel', email='gabeche@gmail.com')])
+
+    await user_repository.add(User(id='3', username='gabeche'))
+    await user_repository.add(User(id='1', username='valentina',
+                                   email='valenep@gmail.com'))
+    assert await user_repository.count() == 3
+
+    await user_repository.add([User(id='1', username='tebanep'),
+                               User(id='2', username='valentina')])
+    assert await user_repository.count([('username', '=', 'tebanep')]) == 1
+
+
+async def test_json_user_repository_duplicated_legacy_values(
+        user_repository):
+    await user_repository.setup()
+    user_repository.file_path.write_text(dumps({'users': {
+        '1': {'id': '1', 'username': 'valenep', 'email': 'dup@gmail.com'},
+        '2': {'id': '2', 'username': 'tebanep', 'email': 'dup@gmail.com'}}}))
+
+    await user_repository.add(User(id='1', username='valentina',
+                                   email='dup@gmail.com'))
+    await user_repository.add(User(id='3', email='dup@gmail.com'))
+    with raises(DuplicateError):
+        await user_repository.add(User(id='4', username='tebanep'))
+    assert await user_repository.count() == 3
+
+
+async def test_json_credential_repository_composite_index(
+        credential_repository):
+    await credential_repository.add([
+        Credential(id='1', user_id='1', value='HASHED: PASS1'),
+        Credential(id='2', user_id='1', value='TOKEN', type='refresh_token',
+                   client='tempos')])
+
+    index = credential_repository._snapshot().index
+    assert index.lookup([('user_id', '=', '1'),
+                         ('type', '=', 'refresh_token'),
+                         ('client', '=', 'tempos')]) == ['2']
+    [credential] = await credential_repository.search([
+        ('user_id', '=', '1'), ('type', '=', 'password')])
+    assert credential.id == '1'
@@ -0,0 +1,30 @@
+from pytest import fixture
+from authark.application.domain.common import (
+    StandardAuthProvider, User as CUser)
+from authark.integration.core.data import (
+    SqliteConnector, SqliteUserRepository, SqliteCredentialRepository)
+
+
+@fixture
+def auth_provider() -> StandardAuthProvider:
+    auth_provider = StandardAuthProvider()
+    auth_provider.setup(CUser(id='001', tid='001', tenant='default'))
+    return auth_provider
+
+
+@fixture
+def connector() -> SqliteConnector:
+    connector = SqliteConnector()
+    yield connector
+    connector.close()
+
+
+@fixture
+def user_repository(tmp_path, connector, auth_provider):
+    return SqliteUserRepository(str(tmp_path), connector, auth_provider)
+
+
+@fixture
+def credential_repository(tmp_path, connector, auth_provider):
+    return SqliteCredentialRepository(
+        str(tmp_path), connector, auth_provider)
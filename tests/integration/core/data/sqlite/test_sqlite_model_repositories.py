@@ -0,0 +1,188 @@
+from pytest import raises
+from authark.application.domain.common import RepositoryError, DuplicateError
+from authark.application.domain.models import User, Credential
+from authark.application.domain.services.repositories import (
+    repository_batch)
+from authark.integration.core.data import (
+    SqliteConnector, SqliteUserRepository)
+
+
+async def test_sqlite_user_repository_add_and_search(user_repository):
+    await user_repository.add([
+        User(id='1', username='valenep', email='valenep@gmail.com',
+             name='Valentina'),
+        User(id='2', username='tebanep', email='tebanep@gmail.com',
+             name='Esteban', attributes={'site': '84'})])
+
+    [user] = await user_repository.search([('username', '=', 'tebanep')])
+    assert user.id == '2'
+    assert user.attributes == {'site': '84'}
+
+    users = await user_repository.search([
+        '|', ('username', '=', 'valenep'), ('email', 'like', 'teban%')])
+    assert [user.id for user in users] == ['1', '2']
+
+    users = await user_repository.search([('name', 'ilike', 'ESTEBAN')])
+    assert [user.id for user in users] == ['2']
+
+    assert await user_repository.count() == 2
+    assert await user_repository.count([('active', '=', True)]) == 2
+
+
+async def test_sqlite_user_repository_update(user_repository):
+    [user] = await user_repository.add(User(id='1', username='valenep'))
+    created_at = user.created_at
+
+    user.username = 'valentina'
+    await user_repository.add(user)
+
+    [user] = await user_repository.search([])
+    assert user.username == 'valentina'
+    assert user.created_at == created_at
+
+
+async def test_sqlite_user_repository_pagination(user_repository):
+    await user_repository.add([
+        User(id=str(index), username=f'user{index}', name=f'{9 - index}')
+        for index in range(10)])
+
+    users = await user_repository.search([], limit=3, offset=2)
+    assert [user.id for user in users] == ['2', '3', '4']
+
+    users = await user_repository.search([], limit=2, order='name desc')
+    assert [user.id for user in users] == ['0', '1']
+
+    with raises(RepositoryError):
+        await user_repository.search([], order='name; DROP TABLE users')
+
+
+async def test_sqlite_user_repository_keyset(user_repository):
+    await user_repository.add([
+        User(id=key, username=f'user{key}') for key in 'dbeac'])
+
+    users = await user_repository.search(
+        [('id', '>', 'b')], limit=2, order='id')
+    assert [user.id for user in users] == ['c', 'd']
+
+
+async def test_sqlite_user_repository_remove(user_repository):
+    users = await user_repository.add([
+        User(id='1', username='valenep'), User(id='2', username='tebanep')])
+
+    assert await user_repository.remove(users[0]) is True
+    assert await user_repository.remove(users[0]) is False
+    assert [user.id for user in await user_repository.search([])] == ['2']
+
+
+async def test_sqlite_repository_without_database(user_repository):
+    assert await user_repository.search([]) == []
+    assert await user_repository.count() == 0
+    assert await user_repository.remove(User(id='1')) is False
+
+
+async def test_sqlite_repository_wal_mode(user_repository, connector):
+    await user_repository.add(User(id='1', username='valenep'))
+
+    connection = connector.get(str(user_repository.file_path))
+    [mode] = connection.execute('PRAGMA journal_mode').fetchone()
+
+    assert mode == 'wal'
+    assert user_repository.file_path.name == 'authark.db'
+    assert user_repository.file_path.parent.name == 'default'
+
+
+async def test_sqlite_credential_repository_shared_database(
+        user_repository, credential_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+    await credential_repository.add([
+        Credential(id='1', user_id='1', value='HASHED: PASS1'),
+        Credential(id='2', user_id='1', value='TOKEN', type='refresh_token',
+                   client='tempos')])
+
+    [credential] = await credential_repository.search([
+        ('user_id', '=', '1'), ('type', '=', 'refresh_token')])
+
+    assert credential.id == '2'
+    assert credential.client == 'tempos'
+    assert credential_repository.file_path == user_repository.file_path
+
+
+async def test_sqlite_repository_version(
+        user_repository, credential_repository):
+    initial = await user_repository.version()
+
+    await user_repository.add(User(id='1', username='valenep'))
+    added = await user_repository.version()
+    await credential_repository.add(
+        Credential(id='1', user_id='1', value='HASHED: PASS1'))
+    await user_repository.remove(User(id='1'))
+
+    assert initial.endswith(':0')
+    assert added.endswith(':1')
+    assert (await user_repository.version()).endswith(':2')
+
+
+async def test_sqlite_repository_batch(
+        user_repository, credential_repository, connector):
+    with repository_batch():
+        await user_repository.add(User(id='1', username='valenep'))
+        await credential_repository.add(
+            Credential(id='1', user_id='1', value='HASHED: PASS1'))
+        assert await user_repository.count() == 1
+
+        connection = connector.get(str(user_repository.file_path))
+        assert connection.execute(
+            'SELECT count(*) FROM users').fetchone() == (0,)
+
+    assert await user_repository.count() == 1
+    assert await credential_repository.count() == 1
+
+
+async def test_sqlite_repository_batch_rollback(user_repository):
+    await user_repository.add(User(id='1', username='valenep'))
+
+    with raises(ValueError):
+        with repository_batch():
+            await user_repository.add(User(id='2', username='tebanep'))
+            await user_repository.remove(User(id='1'))
+            raise ValueError('Failed')
+
+    assert [user.id for user in await user_repository.search([])] == ['1']
+    assert (await user_repository.version()).endswith(':1')
+
+
+async def test_sqlite_user_repository_unique(user_repository):
+    await user_repository.add([
+        User(id='1', username='valenep', email='valenep@gmail.com'),
+        User(id='2', username='tebanep')])
+
+    with raises(DuplicateError):
+        await user_repository.add(User(id='3', email='valenep@gmail.com'))
+    with raises(DuplicateError):
+        await user_repository.add([User(id='3', username='gabeche'),
+                                   User(id='4', username='gabeche')])
+
+    await user_repository.add([User(id='1', username='tebanep'),
+                               User(id='2', username='valenep')])
+    assert await user_repository.count() == 2
+
+
+async def test_sqlite_user_repository_unique_across_connections(
+        tmp_path, user_repository, auth_provider):
+    other_connector = SqliteConnector()
+    other = SqliteUserRepository(
+        str(tmp_path), other_connector, auth_provider)
+    try:
+        await user_repository.add(User(id='1', username='dup'))
+        with raises(DuplicateError):
+            await other.add(User(id='2', username='dup'))
+
+        with raises(DuplicateError):
+            with repository_batch():
+                await other.add(User(id='3', username='other'))
+                await user_repository.add(User(id='4', username='other'))
+
+        await other.add([User(id='5', email=''), User(id='6', email='')])
+        assert await user_repository.count() == 3
+    finally:
+        other_connector.close()
@@ -0,0 +1,38 @@
+from pytest import raises
+from authark.application.domain.common import RepositoryError
+from authark.integration.core.data import SqliteParser
+
+
+def test_sqlite_parser_empty_domain() -> None:
+    assert SqliteParser().parse([]) == ('1 = 1', [])
+
+
+def test_sqlite_parser_terms() -> None:
+    parser = SqliteParser()
+
+    assert parser.parse([('id', '=', '1')]) == ('id = ?', ['1'])
+    assert parser.parse([('username', '=', 'tebanep')]) == (
+        "json_extract(data, '$.username') = ?", ['tebanep'])
+    assert parser.parse([('user_id', 'in', ['1', '2'])]) == (
+        "json_extract(data, '$.user_id') IN (?, ?)", ['1', '2'])
+    assert parser.parse([('user_id', 'in', [])]) == ('0', [])
+    assert parser.parse([('name', 'ilike', 'Teb%')]) == (
+        "lower(json_extract(data, '$.name')) GLOB ?", ['teb*'])
+
+
+def test_sqlite_parser_operators() -> None:
+    parser = SqliteParser()
+
+    condition, parameters = parser.parse([
+        '|', ('username', '=', 'tebanep'), '!', ('active', '=', True),
+        ('id', '!=', '3')])
+
+    assert condition == (
+        "(json_extract(data, '$.username') = ? OR "
+        "(NOT (json_extract(data, '$.active') = ?) AND id IS NOT ?))")
+    assert parameters == ['tebanep', True, '3']
+
+
+def test_sqlite_parser_invalid_field() -> None:
+    with raises(RepositoryError):
+        SqliteParser().parse([("name') OR 1 = 1 --", '=', 'x')])
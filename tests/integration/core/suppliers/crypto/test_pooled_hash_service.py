@@ -0,0 +1,59 @@
+from pytest import fixture, raises
+from authark.application.domain.common import ServiceError
+from authark.integration.core import (
+    PasslibHashService, PooledHashService)
+
+
+@fixture
+def pooled_hash_service():
+    pooled_hash_service = PooledHashService(workers=1, depth=4)
+    yield pooled_hash_service
+    pooled_hash_service.shutdown()
+
+
+def test_pooled_hash_service_instantiation(pooled_hash_service):
+    assert isinstance(pooled_hash_service, PasslibHashService)
+    assert pooled_hash_service.executor is None
+
+
+async def test_pooled_hash_service_generate_and_verify(
+        pooled_hash_service):
+    result = await pooled_hash_service.agenerate_hash('MY_SECRET_PASSWORD')
+    assert '$pbkdf2-sha256' in result
+
+    assert await pooled_hash_service.averify_password(
+        'MY_SECRET_PASSWORD', result) is True
+    assert await pooled_hash_service.averify_password(
+        'WRONG_PASSWORD', result) is False
+    assert pooled_hash_service.pending == 0
+
+
+async def test_pooled_hash_service_queue_depth(pooled_hash_service):
+    pooled_hash_service.pending = pooled_hash_service.depth
+
+    with raises(ServiceError):
+        await pooled_hash_service.agenerate_hash('MY_SECRET_PASSWORD')
+
+
+async def test_pooled_hash_service_generate_hashes(pooled_hash_service):
+    values = [f'PASSWORD_{index}' for index in range(6)]
+
+    results = pooled_hash_service.generate_hashes(values)
+    assert len(results) == 6
+    assert pooled_hash_service.verify_password(values[3], results[3])
+
+    results = await pooled_hash_service.agenerate_hashes(values)
+    assert len(results) == 6
+    assert pooled_hash_service.verify_password(values[5], results[5])
+    assert await pooled_hash_service.agenerate_hashes([]) == []
+
+
+async def test_pooled_hash_service_generate_hashes_depth(
+        pooled_hash_service):
+    pooled_hash_service.pending = pooled_hash_service.depth - 1
+
+    with raises(ServiceError):
+        await pooled_hash_service.agenerate_hashes(['A', 'B', 'C', 'D'])
+    with raises(ServiceError):
+        pooled_hash_service.generate_hashes(['A', 'B', 'C', 'D'])
+    assert pooled_hash_service.pending == pooled_hash_service.depth - 1
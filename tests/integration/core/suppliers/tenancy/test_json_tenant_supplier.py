@@ -31,3 +31,21 @@ def test_json_tenant_supplier_instantiation(monkeypatch):
         'provision_template': directory_template,
         'provision_directory_zones': zones
     }
+
+
+def test_json_tenant_supplier_shared_catalog(
+        tmp_path, catalog_path, directory_template, tenant_dict):
+    zones = {'default': str(tmp_path)}
+    first_supplier = JsonTenantSupplier(catalog_path, zones,
+                                        directory_template)
+    second_supplier = JsonTenantSupplier(catalog_path, zones,
+                                         directory_template)
+
+    first_supplier.create_tenant(tenant_dict)
+    assert second_supplier.resolve_tenant('servagro')['id'] == (
+        tenant_dict['id'])
+
+    second_supplier.create_tenant({**tenant_dict, 'id': '002',
+                                   'name': 'Knowark', 'slug': 'knowark'})
+    assert len(first_supplier.search_tenants([])) == 2
+    assert len(second_supplier.search_tenants([])) == 2
@@ -1,8 +1,9 @@
 from pytest import raises
 from authark.application.general import PlanSupplier
 from authark.integration.core.suppliers import JsonPlanSupplier, Job, Event
+from authark.application.domain.common import codec
 from authark.integration.core.suppliers.plan.json_plan_supplier import (
-    schedulark)
+    schedulark, JsonQueue)
 
 
 class MockPlanner:
@@ -73,3 +74,20 @@ async def test_json_planner_notify(monkeypatch) -> None:
         },
         'data': {'event': 'data'}
     }
+
+
+async def test_json_queue_put_pick_remove(tmp_path) -> None:
+    queue = JsonQueue(str(tmp_path / 'tasks.json'))
+    await queue.setup()
+    task = schedulark.Task(job='NotifyJob', payload={'data': 'value'})
+    task.scheduled_at = 0
+
+    await queue.put(task)
+    picked = await queue.pick()
+
+    assert picked.id == task.id
+    assert picked.payload == {'data': 'value'}
+    assert await queue.pick() is None
+
+    await queue.remove(picked)
+    assert codec.loads((tmp_path / 'tasks.json').read_text()) == {}
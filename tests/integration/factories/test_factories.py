@@ -6,7 +6,7 @@ from authark.integration.factories import factory_builder
 
 test_tuples = [
     ('BaseFactory', [
-        ('QueryParser', 'QueryParser'),
+        ('QueryParser', 'CompiledQueryParser'),
         ('AuthProvider', 'StandardAuthProvider'),
         ('UserRepository', 'MemoryUserRepository'),
         ('CredentialRepository', 'MemoryCredentialRepository'),
@@ -34,6 +34,8 @@ test_tuples = [
         ('StandardInformer', 'StandardInformer'),
         ('ComposingInformer', 'ComposingInformer'),
         ('TenantInformer', 'TenantInformer'),
+        ('SecurityInformer', 'SecurityInformer'),
+        ('DecisionService', 'DecisionService'),
         ('TenantSupplier', 'MemoryTenantSupplier'),
         ('SetupSupplier', 'MemorySetupSupplier'),
         ('TemplateSupplier', 'MemoryTemplateSupplier'),
@@ -53,7 +55,7 @@ test_tuples = [
         ('AccessService', 'AccessService'),
     ]),
     ('CryptoFactory', [
-        ('HashService', 'PasslibHashService'),
+        ('HashService', 'PooledHashService'),
         ('TokenService', 'PyJWTTokenService'),
         ('AccessTokenService', 'PyJWTAccessTokenService'),
         ('RefreshTokenService', 'PyJWTRefreshTokenService'),
@@ -61,14 +63,14 @@ test_tuples = [
     ]),
     ('JsonFactory', [
         ('UserRepository', 'JsonUserRepository'),
-        ('CredentialRepository', 'JsonCredentialRepository'),
+        ('CredentialRepository', 'JournalCredentialRepository'),
         ('DominionRepository', 'JsonDominionRepository'),
         ('RoleRepository', 'JsonRoleRepository'),
         ('RestrictionRepository', 'JsonRestrictionRepository'),
         ('PolicyRepository', 'JsonPolicyRepository'),
-        ('RankingRepository', 'JsonRankingRepository'),
+        ('RankingRepository', 'JournalRankingRepository'),
         ('ImportService', 'JsonImportService'),
-        ('TenantSupplier', 'JsonTenantSupplier'),
+        ('TenantSupplier', 'CachedTenantSupplier'),
         ('PlanSupplier', 'JsonPlanSupplier'),
         ('SetupSupplier', 'JsonSetupSupplier'),
     ]),
@@ -78,6 +80,17 @@ test_tuples = [
     ('OauthFactory', [
         ('IdentityService', 'OauthIdentityService'),
     ]),
+    ('SqliteFactory', [
+        ('SqliteConnector', 'SqliteConnector'),
+        ('UserRepository', 'SqliteUserRepository'),
+        ('CredentialRepository', 'SqliteCredentialRepository'),
+        ('DominionRepository', 'SqliteDominionRepository'),
+        ('RoleRepository', 'SqliteRoleRepository'),
+        ('RestrictionRepository', 'SqliteRestrictionRepository'),
+        ('PolicyRepository', 'SqlitePolicyRepository'),
+        ('RankingRepository', 'SqliteRankingRepository'),
+        ('IdentityService', 'OauthIdentityService'),
+    ]),
 ]
 
 
@@ -90,3 +103,18 @@ def test_factories():
         for abstract, concrete in dependencies:
             result = injector.resolve(abstract)
             assert type(result).__name__ == concrete
+
+
+def test_crypto_factory_hash_workers(monkeypatch):
+    monkeypatch.setattr('os.cpu_count', lambda: 8)
+    settings = {**config, 'hashing': {}}
+
+    for workers, expected in [(1, 8), (4, 2), (16, 1)]:
+        factory = factory_builder.build(
+            {**settings, 'workers': workers}, name='CryptoFactory')
+        assert factory.hash_service().workers == expected
+
+    factory = factory_builder.build(
+        {**settings, 'workers': 4, 'hashing': {'workers': 3}},
+        name='CryptoFactory')
+    assert factory.hash_service().workers == 3
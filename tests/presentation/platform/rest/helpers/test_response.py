@@ -0,0 +1,67 @@
+import gzip
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+from authark.presentation.platform.rest.helpers import (
+    make_etag, match_etag, compress_response)
+from authark.presentation.platform.rest.helpers import response as module
+
+
+def test_make_etag() -> None:
+    request = make_mocked_request('GET', '/roles?limit=5')
+    etag = make_etag('default:1', request)
+
+    assert etag == make_etag('default:1', request)
+    assert etag != make_etag('default:2', request)
+    assert etag != make_etag('default:1', make_mocked_request(
+        'GET', '/roles?limit=6'))
+
+
+def test_match_etag() -> None:
+    assert match_etag('abc', make_mocked_request(
+        'GET', '/roles', headers={'If-None-Match': '"xyz", "abc"'}))
+    assert match_etag('abc', make_mocked_request(
+        'GET', '/roles', headers={'If-None-Match': '*'}))
+    assert match_etag('abc', make_mocked_request(
+        'GET', '/roles', headers={'If-None-Match': 'W/"abc"'}))
+    assert not match_etag('abc', make_mocked_request(
+        'GET', '/roles', headers={'If-None-Match': '"xyz"'}))
+    assert not match_etag('abc', make_mocked_request('GET', '/roles'))
+
+
+async def test_compress_response_gzip() -> None:
+    request = make_mocked_request(
+        'GET', '/users', headers={'Accept-Encoding': 'gzip, deflate'})
+    response = compress_response(
+        request, web.json_response({'data': ['x' * 2048]}))
+
+    await response.prepare(request)
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+
+
+async def test_compress_response_small_body() -> None:
+    request = make_mocked_request(
+        'GET', '/users', headers={'Accept-Encoding': 'gzip'})
+    response = compress_response(request, web.json_response({'data': []}))
+
+    await response.prepare(request)
+
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_compress_response_brotli(monkeypatch) -> None:
+    class brotli:
+        @staticmethod
+        def compress(body):
+            return gzip.compress(body)
+
+    monkeypatch.setattr(module, 'brotli', brotli)
+    request = make_mocked_request(
+        'GET', '/users', headers={'Accept-Encoding': 'gzip, br'})
+    body = b'x' * 2048
+
+    response = compress_response(request, web.Response(body=body))
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert gzip.decompress(response.body) == body
@@ -0,0 +1,66 @@
+import time
+import logging
+from authark.presentation.platform.rest.middleware import TokenCache
+
+
+def test_token_cache_get_and_put():
+    cache = TokenCache(size=2)
+
+    assert cache.get('TOKEN_1') is None
+    cache.put('TOKEN_1', {'uid': '001'})
+
+    assert cache.get('TOKEN_1') == {'uid': '001'}
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_token_cache_honors_expiration():
+    cache = TokenCache(ttl=300)
+
+    now = int(time.time())
+    cache.put('EXPIRED', {'uid': '001', 'exp': now - 1})
+    cache.put('VALID', {'uid': '002', 'exp': now + 60})
+
+    assert cache.get('EXPIRED') is None
+    assert cache.get('VALID') == {'uid': '002', 'exp': now + 60}
+    assert len(cache.entries) == 1
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(size=2)
+
+    cache.put('TOKEN_1', {'uid': '001'})
+    cache.put('TOKEN_2', {'uid': '002'})
+    cache.get('TOKEN_1')
+    cache.put('TOKEN_3', {'uid': '003'})
+
+    assert cache.get('TOKEN_2') is None
+    assert cache.get('TOKEN_1') == {'uid': '001'}
+    assert cache.get('TOKEN_3') == {'uid': '003'}
+
+
+def test_token_cache_disabled():
+    cache = TokenCache(size=0)
+
+    cache.put('TOKEN_1', {'uid': '001'})
+
+    assert cache.get('TOKEN_1') is None
+
+
+def test_token_cache_logs_its_hit_rate(caplog):
+    cache = TokenCache(report=60)
+    cache.put('TOKEN_1', {'uid': '001'})
+    cache.get('TOKEN_1')
+    cache.get('TOKEN_2')
+
+    with caplog.at_level(logging.INFO):
+        cache.log()
+        assert caplog.messages == []
+
+        cache.reported -= 60
+        cache.log()
+        cache.log()
+
+    assert caplog.messages == [
+        'Token cache: 1 hits, 1 misses, 50.0% hit rate, 1 entries.']
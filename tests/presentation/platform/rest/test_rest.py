@@ -1,7 +1,12 @@
 import jwt
+import logging
 from json import loads, dumps
+from injectark import Injectark
+from authark.integration.core import config
+from authark.integration.factories import factory_builder
 from authark.presentation.platform.rest import RestApplication
 from authark.presentation.platform.rest import rest as rest_module
+from authark.presentation.platform.rest.resources import operations
 
 
 async def test_rest_application_run(monkeypatch):
@@ -9,7 +14,7 @@ async def test_rest_application_run(monkeypatch):
 
     class web:
         @staticmethod
-        async def _run_app(app, port=1234):
+        async def _run_app(app, port=1234, reuse_port=None):
             nonlocal called
             called = True
 
@@ -20,6 +25,16 @@ async def test_rest_application_run(monkeypatch):
     assert called is True
 
 
+async def test_rest_application_shuts_down_hash_service(app) -> None:
+    hash_service = app.app.injector.resolve('HashService')
+    calls = []
+    hash_service.shutdown = lambda: calls.append('shutdown')
+
+    await app.close()
+
+    assert calls == ['shutdown']
+
+
 async def test_root(app) -> None:
     response = await app.get('/')
 
@@ -55,6 +70,36 @@ async def test_users_head(app, headers) -> None:
     assert int(count) == 2
 
 
+async def test_rest_routes_table(app) -> None:
+    injector = app.app.injector
+    table = operations.routes(injector)
+
+    assert len(table) == sum(len(operation['actions']) for operation
+                             in operations.operations().values())
+    handler, meta = table[('usersGetId', 'default')]
+    assert handler == injector['StandardInformer'].search
+    assert meta == {'model': 'user'}
+
+
+async def test_authenticate_logs_token_cache_hits(
+        aiohttp_client, headers, monkeypatch, caplog) -> None:
+    monkeypatch.setitem(config, 'factory', 'CheckFactory')
+    monkeypatch.setitem(config['tokens']['rest'], 'cache', {'report': 0})
+    app = await aiohttp_client(RestApplication(
+        Injectark(factory_builder.build(config))))
+
+    with caplog.at_level(logging.INFO):
+        await app.get('/users', headers=headers)
+        await app.get('/users', headers=headers)
+        await app.get('/users', headers={'Authorization': 'Bearer INVALID'})
+
+    assert [message for message in caplog.messages
+            if message.startswith('Token cache')] == [
+        'Token cache: 0 hits, 1 misses, 0.0% hit rate, 0 entries.',
+        'Token cache: 1 hits, 1 misses, 50.0% hit rate, 1 entries.',
+        'Token cache: 1 hits, 2 misses, 33.3% hit rate, 1 entries.']
+
+
 async def test_get_users_filter(app, headers) -> None:
     response = await app.get(
         '/users?filter=[["id", "=", "1"]]', headers=headers)
@@ -78,6 +123,34 @@ async def test_users_get(app, headers) -> None:
     assert data_dict[1]['id'] == '2'
 
 
+async def test_users_get_stream(app, headers) -> None:
+    [resource] = {route.handler.__self__ for route in app.app.router.routes()
+                  if route.method == 'GET' and
+                  hasattr(route.handler, '__self__') and
+                  hasattr(route.handler.__self__, 'chunk_size')}
+    resource.chunk_size = 1
+
+    response = await app.get('/users?stream', headers=headers)
+    assert response.status == 200
+    assert response.headers['Transfer-Encoding'] == 'chunked'
+    data = loads(await response.text())['data']
+    assert [item['id'] for item in data] == ['1', '2']
+    assert 'createdAt' in data[0]
+
+    response = await app.get('/users?stream&limit=1', headers=headers)
+    data = loads(await response.text())['data']
+    assert [item['id'] for item in data] == ['1']
+
+    response = await app.get(
+        '/users?stream&order=id desc', headers=headers)
+    data = loads(await response.text())['data']
+    assert [item['id'] for item in data] == ['2', '1']
+
+    response = await app.get(
+        '/users?stream&filter=[["id", "=", "3"]]', headers=headers)
+    assert loads(await response.text()) == {'data': []}
+
+
 async def test_users_register_patch_route(app, headers) -> None:
     response = await app.patch(
         '/users',
@@ -286,6 +359,45 @@ async def test_users_get_route_filter(app, headers) -> None:
     data_dict = loads(content)['data']
     assert len(data_dict) == 0
 
+async def test_users_get_route_paginated(app, headers) -> None:
+    response = await app.get(
+        '/users?order=username desc&limit=1&offset=1', headers=headers)
+    content = await response.text()
+    data_dict = loads(content)['data']
+    assert len(data_dict) == 1
+    assert data_dict[0]['username'] == 'eecheverry'
+
+async def test_users_get_route_invalid_order(app, headers) -> None:
+    response = await app.get('/users?order=foo', headers=headers)
+    assert response.status == 400
+    assert loads(await response.text())['errors'][0]['type'] == (
+        'QueryError')
+
+    response = await app.get('/users?stream&order=foo', headers=headers)
+    assert response.status == 400
+
+async def test_users_get_route_cursor(app, headers) -> None:
+    response = await app.get('/users?after=&limit=1', headers=headers)
+    cursor = response.headers['Next-Cursor']
+    data_dict = loads(await response.text())['data']
+    assert [item['id'] for item in data_dict] == ['1']
+
+    response = await app.get(
+        f'/users?after={cursor}&limit=1', headers=headers)
+    cursor = response.headers['Next-Cursor']
+    data_dict = loads(await response.text())['data']
+    assert [item['id'] for item in data_dict] == ['2']
+
+    response = await app.get(
+        f'/users?after={cursor}&limit=1', headers=headers)
+    assert response.headers['Next-Cursor'] == ''
+    assert loads(await response.text())['data'] == []
+
+
+async def test_users_get_route_invalid_cursor(app, headers) -> None:
+    response = await app.get('/users?after=***', headers=headers)
+    assert response.status == 400
+
 async def test_dominions_head(app, headers) -> None:
     response = await app.head('/dominions', headers=headers)
     count = response.headers.get('Count')
@@ -441,6 +553,45 @@ async def test_role_get(app, headers) -> None:
     assert data_dict[0]['id'] == '1'
 
 
+async def test_role_get_etag(app, headers) -> None:
+    response = await app.get('/roles', headers=headers)
+    etag = response.headers['ETag']
+    assert response.status == 200
+    assert etag.startswith('W/"')
+
+    response = await app.get(
+        '/roles', headers={**headers, 'If-None-Match': etag})
+    assert response.status == 304
+    assert response.headers['ETag'] == etag
+
+    response = await app.get(
+        '/roles?filter=[["id", "=", "1"]]',
+        headers={**headers, 'If-None-Match': etag})
+    assert response.status == 200
+    assert response.headers['ETag'] != etag
+
+    await app.patch('/roles', data=dumps({"data": [{
+        "name": "admin", "dominionId": "1"}]}), headers=headers)
+
+    response = await app.get(
+        '/roles', headers={**headers, 'If-None-Match': etag})
+    assert response.status == 200
+    assert response.headers['ETag'] != etag
+    assert len(loads(await response.text())['data']) == 2
+
+
+async def test_users_get_compression(app, headers) -> None:
+    response = await app.get('/users', headers={
+        **headers, 'Accept-Encoding': 'gzip'})
+    assert response.status == 200
+    assert 'Content-Encoding' not in response.headers
+
+    response = await app.get('/users?stream', headers={
+        **headers, 'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert len(loads(await response.text())['data']) == 2
+
+
 async def test_role_patch_route(app, headers) -> None:
     response = await app.patch(
         '/roles',
@@ -468,3 +619,67 @@ async def test_roles_delete(app, headers) -> None:
     data_dict = loads(await response.text())['data']
 
     assert len(data_dict) == 0
+
+
+async def test_batch_patch(app, headers) -> None:
+    response = await app.patch('/batch', data=dumps({"data": [
+        {"operationId": "dominionsGetId",
+         "entry": {"meta": {"domain": []}}},
+        {"operationId": "rolesPatchId", "action": "default",
+         "entry": {"data": [{"id": "R2", "name": "editor",
+                             "dominionId": "1"}]}},
+        {"operationId": "rankingsPatchId",
+         "entry": {"data": [{"userId": "1", "roleId": "R2"}]}}
+    ]}), headers=headers)
+
+    assert response.status == 200
+    [dominions, roles, rankings] = loads(await response.text())['data']
+    assert dominions['data'][0]['id'] == '1'
+
+    response = await app.get(
+        '/rankings?filter=[["roleId", "=", "R2"]]', headers=headers)
+    [ranking] = loads(await response.text())['data']
+    assert ranking['userId'] == '1'
+
+
+async def test_batch_patch_unknown_operation(app, headers) -> None:
+    response = await app.patch('/batch', data=dumps({"data": [
+        {"operationId": "rolesPatchId",
+         "entry": {"data": [{"id": "R2", "name": "editor",
+                             "dominionId": "1"}]}},
+        {"operationId": "unknownPatchId", "entry": {}}
+    ]}), headers=headers)
+
+    assert response.status == 400
+
+    response = await app.head('/roles', headers=headers)
+    assert int(response.headers['Count']) == 1
+
+
+async def test_batch_patch_malformed(app, headers) -> None:
+    for body in ['[]', '{"data": {}}', '{"data": ["rolesPatchId"]}',
+                 '{"data": [{"operationId": ["rolesPatchId"]}]}',
+                 '{"data": [{"operationId": "rolesPatchId", "entry": []}]}',
+                 '{"data": [{"operationId": "rolesPatchId", "extra": 1}]}',
+                 '{"data": [']:
+        response = await app.patch('/batch', data=body, headers=headers)
+        assert response.status == 400, body
+
+
+async def test_authorizations_patch(app, headers) -> None:
+    response = await app.patch('/policies', data=dumps({"data": [
+        {"id": "P1", "roleId": "1", "resource": "orders",
+         "privilege": "read", "active": True}
+    ]}), headers=headers)
+    assert response.status == 200
+
+    response = await app.patch('/authorizations', data=dumps({
+        "meta": {"userId": "1"},
+        "data": [{"resource": "orders", "privilege": "read"},
+                 {"resource": "orders", "privilege": "write"}]
+    }), headers=headers)
+
+    assert response.status == 200
+    [read, write] = loads(await response.text())['data']
+    assert read['allowed'] is True
+    assert write['allowed'] is False
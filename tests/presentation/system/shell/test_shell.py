@@ -71,6 +71,47 @@ async def test_shell_serve(shell, monkeypatch):
     assert custom_port == 9201
 
 
+async def test_shell_serve_workers(shell, monkeypatch):
+    supervisor_args = None
+
+    class MockSupervisor:
+        def __init__(self, command, workers, env):
+            nonlocal supervisor_args
+            supervisor_args = (command, workers, env)
+
+        async def run(self):
+            pass
+
+    monkeypatch.setattr(shell_module, 'Supervisor', MockSupervisor)
+
+    await shell.serve({'port': '9201', 'workers': '4'})
+
+    command, workers, env = supervisor_args
+    assert workers == 4
+    assert env['AUTHARK_WORKERS'] == '4'
+    assert command[-4:] == ['serve', '--port', '9201', '--worker']
+
+
+async def test_shell_serve_worker(shell, monkeypatch):
+    run_kwargs = None
+
+    class MockRestApplication:
+        def __init__(self, injector):
+            pass
+
+        @staticmethod
+        async def run(app, port, **kwargs):
+            nonlocal run_kwargs
+            run_kwargs = kwargs
+
+    monkeypatch.setattr(
+        shell_module, 'RestApplication', MockRestApplication)
+
+    await shell.serve({'port': '9201', 'workers': '4', 'worker': True})
+
+    assert run_kwargs == {'reuse_port': True}
+
+
 async def test_shell_provision(shell):
     options_dict = {
         'data': json.dumps({
@@ -0,0 +1,55 @@
+import sys
+import asyncio
+from authark.presentation.system.shell.supervisor import Supervisor
+
+
+async def wait_for(condition, timeout=10.0):
+    for _ in range(int(timeout / 0.05)):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError('Condition not reached.')
+
+
+async def test_supervisor_restarts_crashed_workers():
+    command = [sys.executable, '-c', 'import sys; sys.exit(1)']
+    supervisor = Supervisor(command, workers=2, backoff=0.01)
+    task = asyncio.ensure_future(supervisor.run())
+
+    await wait_for(lambda: supervisor.restarts >= 4)
+    supervisor.stop()
+    await asyncio.wait_for(task, 10)
+
+    assert supervisor.processes == []
+
+
+async def test_supervisor_drains_workers_on_stop():
+    command = [sys.executable, '-c', 'import time; time.sleep(60)']
+    supervisor = Supervisor(command, workers=2)
+    task = asyncio.ensure_future(supervisor.run())
+
+    await wait_for(lambda: len(supervisor.processes) == 2)
+    processes = list(supervisor.processes)
+    supervisor.stop()
+    await asyncio.wait_for(task, 10)
+
+    assert supervisor.restarts == 0
+    assert supervisor.processes == []
+    assert all(process.returncode is not None for process in processes)
+
+
+async def test_supervisor_kills_workers_after_grace():
+    command = [sys.executable, '-c', (
+        'import signal, time; '
+        'signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+        'print("ready", flush=True); time.sleep(60)')]
+    supervisor = Supervisor(command, workers=1, grace=0.2)
+    task = asyncio.ensure_future(supervisor.run())
+
+    await wait_for(lambda: len(supervisor.processes) == 1)
+    [process] = supervisor.processes
+    await asyncio.sleep(1)
+    supervisor.stop()
+    await asyncio.wait_for(task, 10)
+
+    assert process.returncode == -9